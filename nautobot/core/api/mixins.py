@@ -1,19 +1,132 @@
+import contextlib
+import contextvars
 import logging
 import uuid
 
 from django.core.exceptions import (
+    EmptyResultSet,
     FieldError,
     MultipleObjectsReturned,
     ObjectDoesNotExist,
+    ValidationError as DjangoValidationError,
 )
-from django.db.models import AutoField, Model
+from django.db.models import AutoField, Model, Q
 from rest_framework.exceptions import ValidationError
+from rest_framework.relations import ManyRelatedField
 
 from nautobot.core.api.utils import dict_to_filter_params
 from nautobot.core.utils.data import is_url
 
 logger = logging.getLogger(__name__)
 
+# Related objects looked up by WritableSerializerMixin, as {cache_key: object}, while related_object_cache() is active
+_related_object_cache = contextvars.ContextVar("related_object_cache", default=None)
+
+
+@contextlib.contextmanager
+def related_object_cache():
+    """
+    Context manager to cache the related objects looked up by serializer fields using `WritableSerializerMixin`.
+
+    Intended for deserializing many records that reference the same related objects, such as in a bulk import. Within
+    this context, each distinct lookup is made only once, and `prefetch_related_object_lookups()` can be used to look up the
+    related objects referenced by many records at once.
+    """
+    token = _related_object_cache.set({})
+    try:
+        yield
+    finally:
+        _related_object_cache.reset(token)
+
+
+def _freeze_lookup_value(value):
+    if value is None:
+        return None
+    if isinstance(value, Model):
+        return str(value.pk)
+    return str(value)
+
+
+def _related_object_cache_key(queryset, filter_params):
+    """Return a hashable key identifying the given lookup, or None if it can't be cached."""
+    try:
+        query = str(queryset.query)
+    except EmptyResultSet:
+        return None
+    try:
+        return (query, tuple(sorted((key, _freeze_lookup_value(value)) for key, value in filter_params.items())))
+    except TypeError:
+        return None
+
+
+def prefetch_related_object_lookups(serializer, data, batch_size=1000):
+    """
+    Look up the related objects referenced by each of the given records of input data for `serializer` in bulk.
+
+    Objects are looked up with a single query per field (and per batch of `batch_size` distinct references), and added
+    to the active `related_object_cache()`, so that deserializing the records doesn't need to look them up one by one.
+    References that can't be resolved this way to a single object are left to be looked up (and reported) as usual.
+    """
+    cache = _related_object_cache.get()
+    if cache is None:
+        return
+
+    for field_name, field in serializer.fields.items():
+        if field.read_only:
+            continue
+        many = isinstance(field, ManyRelatedField)
+        if many:
+            field = field.child_relation
+        if not isinstance(field, WritableSerializerMixin) or getattr(field, "queryset", None) is None:
+            continue
+        queryset = field.queryset
+
+        lookups = {}
+        for record in data:
+            values = record.get(field_name)
+            if values is None:
+                continue
+            for value in values if many and isinstance(values, list) else [values]:
+                try:
+                    filter_params = field.get_queryset_filter_params(
+                        data=field.get_lookup_value(value), queryset=queryset
+                    )
+                except (DjangoValidationError, TypeError, ValidationError, ValueError):
+                    continue
+                cache_key = _related_object_cache_key(queryset, filter_params)
+                if cache_key is not None and cache_key not in cache:
+                    lookups[cache_key] = filter_params
+
+        # Lookups using the same set of fields can be made in a single query
+        lookups_by_fields = {}
+        for cache_key, filter_params in lookups.items():
+            lookups_by_fields.setdefault(tuple(sorted(filter_params)), []).append((cache_key, filter_params))
+        for field_names, field_lookups in lookups_by_fields.items():
+            for i in range(0, len(field_lookups), batch_size):
+                _prefetch_lookups(queryset, field_names, field_lookups[i : i + batch_size], cache)
+
+
+def _prefetch_lookups(queryset, field_names, lookups, cache):
+    query = Q()
+    for _, filter_params in lookups:
+        query |= Q(**filter_params)
+    try:
+        matches = {}
+        for pk, *values in queryset.filter(query).values_list("pk", *field_names):
+            matches.setdefault(tuple(_freeze_lookup_value(value) for value in values), set()).add(pk)
+        pks = set().union(*matches.values())
+        objects = {obj.pk: obj for obj in queryset.filter(pk__in=pks)} if pks else {}
+    except (DjangoValidationError, FieldError, TypeError, ValueError):
+        # Not a valid lookup; leave it to be reported when the record is deserialized
+        return
+
+    for cache_key, filter_params in lookups:
+        pks = matches.get(tuple(_freeze_lookup_value(filter_params[field_name]) for field_name in field_names), ())
+        if len(pks) == 1:
+            (pk,) = pks
+            if pk in objects:
+                cache[cache_key] = objects[pk]
+
 
 class LimitQuerysetChoicesSerializerMixin:
     """Mixin field that restricts queryset choices to those accessible
@@ -85,11 +198,25 @@ class WritableSerializerMixin:
             ) from e
         return {"pk": pk}
 
+    def get_lookup_value(self, data):
+        """Return the value identifying the related object to look up for the given input data."""
+        return data
+
     def get_object(self, data, queryset):
         """
         Retrieve an unique object based on a dictionary of data attributes and raise errors accordingly if the object is not found.
         """
         filter_params = self.get_queryset_filter_params(data=data, queryset=queryset)
+        cache = _related_object_cache.get()
+        if cache is not None:
+            cache_key = _related_object_cache_key(queryset, filter_params)
+            if cache_key is not None:
+                if cache_key not in cache:
+                    cache[cache_key] = self._get_object_by_filter_params(filter_params, queryset)
+                return cache[cache_key]
+        return self._get_object_by_filter_params(filter_params, queryset)
+
+    def _get_object_by_filter_params(self, filter_params, queryset):
         try:
             return queryset.get(**filter_params)
         except ObjectDoesNotExist as e:
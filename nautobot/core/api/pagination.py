@@ -1,4 +1,12 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import F, Q, QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from nautobot.core.utils.config import get_settings_or_config
 
@@ -8,13 +16,25 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Also supports opt-in keyset ("cursor") pagination of querysets, selected by including the `cursor` query parameter
+    (with an empty value for the first page). Each page is then selected by filtering on the ordering fields of the last
+    record of the previous page rather than with an `OFFSET`, and no `COUNT(*)` query is made, so that the cost of
+    fetching a page doesn't grow with its position in the list. See `paginate_queryset_by_cursor()` for details.
     """
 
+    cursor_query_param = "cursor"
+    cursor_query_description = "Opaque cursor identifying the page to return. Pass an empty value for the first page."
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
+        self.cursor_mode = False
+        if self.cursor_query_param in request.query_params and isinstance(queryset, QuerySet):
+            return self.paginate_queryset_by_cursor(queryset, request)
+
         self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
@@ -31,6 +51,121 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset :])
 
+    def paginate_queryset_by_cursor(self, queryset, request):
+        """
+        Return the page of `queryset` following the cursor given in the request.
+
+        Records are ordered by the requested (or model default) ordering, followed by the primary key so that the order
+        is total. Only fields stored on the model itself can be used to select pages, so the ordering is truncated
+        before the first one that isn't (such as a field of a related model). Null values are always ordered last.
+        """
+        self.cursor_mode = True
+        self.cursor = None
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = 0
+        self.count = None  # never computed
+
+        self.cursor_fields = self._get_cursor_fields(queryset)
+        queryset = queryset.order_by(
+            *(
+                F(field.attname).desc(nulls_last=True) if descending else F(field.attname).asc(nulls_last=True)
+                for field, descending in self.cursor_fields
+            )
+        )
+        cursor_values = self.decode_cursor(request.query_params[self.cursor_query_param])
+        if cursor_values is not None:
+            queryset = queryset.filter(self._get_cursor_filter(cursor_values))
+
+        if not self.limit:
+            return list(queryset)
+
+        # Fetch one extra record to determine whether there is a next page
+        results = list(queryset[: self.limit + 1])
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            self.cursor = self.encode_cursor(results[-1])
+        return results
+
+    def _get_cursor_fields(self, queryset):
+        """Return the list of `(field, descending)` tuples by which to order `queryset` for cursor pagination."""
+        model = queryset.model
+        if queryset.query.order_by or queryset.query.extra_order_by:
+            ordering = [*queryset.query.order_by, *queryset.query.extra_order_by]
+        elif queryset.query.default_ordering:
+            ordering = model._meta.ordering
+        else:
+            ordering = []
+
+        cursor_fields = []
+        for item in ordering:
+            if not isinstance(item, str) or item == "?":
+                break
+            descending = item.startswith("-")
+            try:
+                field = model._meta.get_field(item.lstrip("-"))
+            except FieldDoesNotExist:
+                break
+            if not field.concrete or field.is_relation:
+                break
+            cursor_fields.append((field, descending))
+            if field.primary_key:
+                # The ordering is already total
+                return cursor_fields
+        cursor_fields.append((model._meta.pk, False))
+        return cursor_fields
+
+    def _get_cursor_filter(self, cursor_values):
+        """Return a Q selecting the records that follow the record with the given cursor field values."""
+        cursor_filter = Q()
+        equal_filter = Q()
+        for (field, descending), value in zip(self.cursor_fields, cursor_values):
+            if value is None:
+                # Null values are ordered last, so no record follows on this field alone
+                equal_filter &= Q(**{f"{field.attname}__isnull": True})
+                continue
+            follows = Q(**{f"{field.attname}__{'lt' if descending else 'gt'}": value})
+            if field.null:
+                follows |= Q(**{f"{field.attname}__isnull": True})
+            cursor_filter |= equal_filter & follows
+            equal_filter &= Q(**{field.attname: value})
+        return cursor_filter
+
+    def encode_cursor(self, obj):
+        """Return the cursor of the page following the given record."""
+        values = [
+            None if field.value_from_object(obj) is None else field.value_to_string(obj)
+            for field, _ in self.cursor_fields
+        ]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Return the cursor field values encoded in the given cursor, or None for the first page."""
+        if not cursor:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(self.cursor_fields):
+                raise ValueError
+            return [
+                None if value is None else field.to_python(value)
+                for (field, _), value in zip(self.cursor_fields, values)
+            ]
+        except (binascii.Error, DjangoValidationError, TypeError, ValueError):
+            raise NotFound("Invalid cursor.")
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            },
+        ]
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -55,6 +190,12 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        if self.cursor_mode:
+            if self.cursor is None:
+                return None
+            url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.cursor)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -62,4 +203,8 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Cursor pagination only supports paging forwards
+        if self.cursor_mode:
+            return None
+
         return super().get_previous_link()
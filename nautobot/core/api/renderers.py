@@ -34,6 +34,22 @@ class NautobotJSONRenderer(JSONRenderer):
 
     encoder_class = NautobotKombuJSONEncoder
 
+    def render_stream(self, chunks, count):
+        """
+        Render the provided iterable of lists of records as a single unpaginated list response, yielding it in parts.
+
+        The output is equivalent to rendering `{"count": count, "next": None, "previous": None, "results": [...]}`.
+        """
+        yield self.render({"count": count, "next": None, "previous": None, "results": []})[:-2]
+        first = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+            rendered = self.render(chunk)[1:-1]
+            yield rendered if first else b"," + rendered
+            first = False
+        yield b"]}"
+
 
 class NautobotCSVRenderer(BaseRenderer):
     """
@@ -57,20 +73,33 @@ class NautobotCSVRenderer(BaseRenderer):
         if isinstance(data, dict):
             data = [data]
 
-        headers = self.get_headers(data)
+        return "".join(self.render_stream([data]))
 
+    def render_stream(self, chunks):
+        """
+        Render the provided iterable of lists of records to CSV format, yielding the CSV text of each list in turn.
+
+        The CSV headers are determined from the first non-empty list of records.
+        """
+        headers = None
         buffer = StringIO()
         writer = csv.writer(buffer)
-        writer.writerow(headers)
-        for record in data:
-            writer.writerow(
-                self.object_to_row_elements(
-                    record,
-                    headers=headers,
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if headers is None:
+                headers = self.get_headers(chunk)
+                writer.writerow(headers)
+            for record in chunk:
+                writer.writerow(
+                    self.object_to_row_elements(
+                        record,
+                        headers=headers,
+                    )
                 )
-            )
-
-        return buffer.getvalue()
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
 
     @classmethod
     def get_headers(cls, data):
@@ -1,4 +1,5 @@
 from collections import namedtuple
+import itertools
 import logging
 import platform
 import sys
@@ -160,6 +161,28 @@ def nested_serializers_for_models(models, prefix=""):
     return nested_serializer_classes
 
 
+def serialize_queryset_in_chunks(queryset, serializer_factory, chunk_size=None):
+    """
+    Iterate over `queryset` using a server-side cursor (where supported) and serialize it in chunks.
+
+    Args:
+        queryset (QuerySet): Objects to serialize
+        serializer_factory (callable): Called with each list of objects, returning a `many=True` serializer for them
+        chunk_size (int): Number of objects to fetch and serialize at a time; defaults to `settings.EXPORT_CHUNK_SIZE`
+
+    Yields:
+        (list): The serialized data of each chunk of objects
+    """
+    if chunk_size is None:
+        chunk_size = settings.EXPORT_CHUNK_SIZE
+    iterator = queryset.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield serializer_factory(chunk).data
+
+
 def is_api_request(request):
     """
     Return True of the request is being made via the REST API.
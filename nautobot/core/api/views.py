@@ -11,7 +11,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
 from django.db.models import ProtectedError
-from django.http.response import HttpResponseBadRequest
+from django.http.response import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import NoReverseMatch, reverse as django_reverse
 from drf_spectacular.plumbing import get_relative_url, set_query_parameters
@@ -20,7 +20,6 @@ from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 from graphene_django.settings import graphene_settings
 from graphene_django.views import GraphQLView, HttpError, instantiate_middleware
-from graphql import get_default_backend
 from graphql.execution import ExecutionResult
 from graphql.execution.middleware import MiddlewareManager
 from graphql.type.schema import GraphQLSchema
@@ -35,9 +34,11 @@ import yaml
 
 from nautobot.core.api import BulkOperationSerializer
 from nautobot.core.api.exceptions import SerializerNotFound
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.renderers import NautobotCSVRenderer, NautobotJSONRenderer
+from nautobot.core.api.utils import get_serializer_for_model, serialize_queryset_in_chunks
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
+from nautobot.core.graphql.backends import get_graphql_backend, get_persisted_query, PersistedQueryNotFound
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.filtering import get_all_lookup_expr_for_field, get_filterset_parameter_form_field
 from nautobot.core.utils.lookup import get_form_for_model, get_route_for_model
@@ -230,6 +231,41 @@ class ModelViewSetMixin:
 
         return context
 
+    def list(self, request, *args, **kwargs):
+        if settings.EXPORT_STREAMING_RESPONSES_ENABLED:
+            response = self.get_streaming_list_response(request)
+            if response is not None:
+                return response
+        return super().list(request, *args, **kwargs)
+
+    def get_streaming_list_response(self, request):
+        """
+        Return a response streaming the rendered list of objects to the client, or None if this request isn't suitable.
+
+        CSV responses (which are never paginated) and JSON responses for which pagination has been disabled are
+        streamed; the queryset is then fetched and serialized in chunks of `settings.EXPORT_CHUNK_SIZE` objects rather
+        than all at once.
+        """
+        renderer = request.accepted_renderer
+        queryset = self.filter_queryset(self.get_queryset())
+        chunks = serialize_queryset_in_chunks(queryset, lambda chunk: self.get_serializer(chunk, many=True))
+        if isinstance(renderer, NautobotCSVRenderer):
+            content = (part.encode(renderer.charset) for part in renderer.render_stream(chunks))
+        elif (
+            isinstance(renderer, NautobotJSONRenderer)
+            and self.paginator is not None
+            and hasattr(self.paginator, "get_limit")
+            and not self.paginator.get_limit(request)
+            and not self.paginator.get_offset(request)
+            and getattr(self.paginator, "cursor_query_param", None) not in request.query_params
+        ):
+            content = renderer.render_stream(chunks, queryset.count())
+        else:
+            return None
+
+        content_type = f"{renderer.media_type}; charset={renderer.charset}" if renderer.charset else renderer.media_type
+        return StreamingHttpResponse(content, content_type=content_type)
+
     def restrict_queryset(self, request, *args, **kwargs):
         """
         Restrict the view's queryset to allow only the permitted objects for the given request.
@@ -609,7 +645,7 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             self.schema = graphene_settings.SCHEMA
 
         if self.backend is None:
-            self.backend = get_default_backend()
+            self.backend = get_graphql_backend()
 
         self.graphql_schema = self.graphql_schema or self.schema
 
@@ -637,7 +673,12 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
         """
         query, variables, operation_name, _id = GraphQLView.get_graphql_params(request, data)
 
-        execution_result = self.execute_graphql_request(request, data, query, variables, operation_name)
+        try:
+            query = get_persisted_query(request, data, query=query, query_id=_id)
+        except (PersistedQueryNotFound, ValueError) as e:
+            execution_result = ExecutionResult(errors=[e], invalid=True)
+        else:
+            execution_result = self.execute_graphql_request(request, data, query, variables, operation_name)
 
         status_code = 200
         if execution_result:
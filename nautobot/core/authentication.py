@@ -7,11 +7,12 @@ from django.contrib.auth.backends import (
     RemoteUserBackend as _RemoteUserBackend,
 )
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.db.models import Q
 
 from nautobot.core.utils.permissions import (
+    get_permission_filter,
     permission_is_exempt,
-    qs_filter_from_constraints,
     resolve_permission,
     resolve_permission_ct,
 )
@@ -31,21 +32,39 @@ class ObjectPermissionBackend(ModelBackend):
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
-        """
-        # Retrieve all assigned and enabled ObjectPermissions
-        object_permissions = ObjectPermission.objects.filter(
-            Q(users=user_obj) | Q(groups__user=user_obj), enabled=True
-        ).prefetch_related("object_types")
 
-        # Create a dictionary mapping permissions to their constraints
-        perms = defaultdict(list)
-        for obj_perm in object_permissions:
-            for object_type in obj_perm.object_types.all():
-                for action in obj_perm.actions:
-                    perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
-                    perms[perm_name].extend(obj_perm.list_constraints())
+        The permissions of each user are cached across requests, until any ObjectPermission or group membership is
+        changed, or any group or user is deleted (see `nautobot.users.signals`).
+        """
 
-        return perms
+        def get_permissions():
+            # Retrieve all assigned and enabled ObjectPermissions
+            object_permissions = ObjectPermission.objects.filter(
+                Q(users=user_obj) | Q(groups__user=user_obj), enabled=True
+            ).prefetch_related("object_types")
+
+            # Create a dictionary mapping permissions to their constraints
+            perms = defaultdict(list)
+            for obj_perm in object_permissions:
+                for object_type in obj_perm.object_types.all():
+                    for action in obj_perm.actions:
+                        perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
+                        perms[perm_name].extend(obj_perm.list_constraints())
+
+            return dict(perms)
+
+        # Permissions are kept in the Django cache only, never in the local cache of each process (see
+        # `nautobot.core.utils.cache`), so that revoking a permission takes effect immediately in all processes
+        cache_key = f"{self.get_object_permissions.cache_key_prefix}.{user_obj.pk}"
+        perms = cache.get(cache_key)
+        if perms is None:
+            perms = get_permissions()
+            cache.set(cache_key, perms)
+        return defaultdict(list, perms)
+
+    get_object_permissions.cache_key_prefix = (
+        "nautobot.core.authentication.objectpermissionbackend.get_object_permissions"
+    )
 
     def has_perm(self, user_obj, perm, obj=None):
         if perm == "is_staff":
@@ -82,16 +101,10 @@ class ObjectPermissionBackend(ModelBackend):
         if model._meta.label_lower != ".".join((app_label, model_name)):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
-        # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            "$user": user_obj,
-        }
-        constraints = qs_filter_from_constraints(self.get_all_permissions(user_obj)[perm], tokens)
-
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
         # not the instance itself.
-        return model.objects.filter(constraints, pk=obj.pk).exists()
+        return model.objects.filter(get_permission_filter(user_obj, perm), pk=obj.pk).exists()
 
 
 class RemoteUserBackend(_RemoteUserBackend):
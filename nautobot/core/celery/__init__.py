@@ -22,6 +22,8 @@ from nautobot.extras.registry import registry
 
 logger = logging.getLogger(__name__)
 
+# Fingerprint of the contents of JOBS_ROOT as of the last import of its Jobs
+_jobs_root_fingerprint = None
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nautobot_config")
 
@@ -47,6 +49,9 @@ def import_jobs(sender=None, **kwargs):
     """
     Import system Jobs into Nautobot as well as Jobs from JOBS_ROOT and GIT_ROOT.
 
+    Jobs from JOBS_ROOT are only reimported if any file in JOBS_ROOT has changed since they were last imported, and Jobs
+    from a Git repository only if its `current_head` has changed, so that calling this function repeatedly is cheap.
+
     Note that app-provided jobs are automatically imported at startup time via NautobotAppConfig.ready()
     """
     import nautobot.core.jobs  # noqa: F401
@@ -62,13 +67,49 @@ def import_jobs(sender=None, **kwargs):
         pass
 
 
+def _get_jobs_root_fingerprint(jobs_root):
+    """
+    Return a value that changes whenever any file under the given JOBS_ROOT directory is added, removed, or modified.
+
+    As with Python's own bytecode cache, files are considered modified if their modification time or size changed.
+    """
+    files = []
+    for dirpath, dirnames, filenames in os.walk(jobs_root):
+        dirnames[:] = sorted(dirname for dirname in dirnames if dirname != "__pycache__")
+        for filename in sorted(filenames):
+            filepath = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(filepath)
+            except OSError:  # deleted in the meantime
+                continue
+            files.append((filepath, stat.st_mtime_ns, stat.st_size))
+    return (jobs_root, tuple(files))
+
+
 def _import_jobs_from_jobs_root():
     """
-    (Re)import all modules in settings.JOBS_ROOT.
+    (Re)import all modules in settings.JOBS_ROOT, unless they haven't changed since they were last imported.
     """
+    global _jobs_root_fingerprint
+
     if not (settings.JOBS_ROOT and os.path.isdir(settings.JOBS_ROOT)):
         return
 
+    jobs_root = os.path.realpath(settings.JOBS_ROOT)
+    fingerprint = _get_jobs_root_fingerprint(jobs_root)
+    if fingerprint == _jobs_root_fingerprint:
+        return
+
+    git_repository_slugs = []
+    try:
+        from nautobot.extras.models import GitRepository
+
+        git_repository_slugs = list(
+            GitRepository.objects.filter(provided_contents__contains="extras.job").values_list("slug", flat=True)
+        )
+    except ProgrammingError:  # Database not ready yet, as may be the case on initial startup and migration
+        pass
+
     # Flush any previously loaded non-system, non-App Jobs
     for job_class_path in list(registry["jobs"]):
         if job_class_path.startswith("nautobot."):
@@ -77,22 +118,15 @@ def _import_jobs_from_jobs_root():
         if any(job_class_path.startswith(f"{app_name}.") for app_name in settings.PLUGINS):
             # App provided job
             continue
-        try:
-            from nautobot.extras.models import GitRepository
-
-            if any(
-                job_class_path.startswith(f"{repo.slug}.")
-                for repo in GitRepository.objects.filter(provided_contents__contains="extras.job")
-            ):
-                # Git provided job
-                continue
-        except ProgrammingError:  # Database not ready yet, as may be the case on initial startup and migration
-            pass
+        if any(job_class_path.startswith(f"{slug}.") for slug in git_repository_slugs):
+            # Git provided job
+            continue
         # Else, it's presumably a JOBS_ROOT job
         del registry["jobs"][job_class_path]
 
     # Load all modules in JOBS_ROOT
-    import_modules_privately(path=os.path.realpath(settings.JOBS_ROOT))
+    import_modules_privately(path=jobs_root)
+    _jobs_root_fingerprint = fingerprint
 
 
 def _import_jobs_from_git_repositories():
@@ -100,22 +134,26 @@ def _import_jobs_from_git_repositories():
     if not (git_root and os.path.exists(git_root)):
         return
 
+    from nautobot.extras.datasources.git import job_code_is_current
     from nautobot.extras.models import GitRepository
 
     # Make sure there are no git clones in GIT_ROOT that *aren't* tracked by a GitRepository;
     # for example, maybe a GitRepository was deleted while this worker process wasn't running?
+    git_repository_slugs = set(GitRepository.objects.values_list("slug", flat=True))
     for filename in os.listdir(git_root):
         filepath = os.path.join(git_root, filename)
         if (
             os.path.isdir(filepath)
             and os.path.isdir(os.path.join(filepath, ".git"))
-            and not GitRepository.objects.filter(slug=filename).exists()
+            and filename not in git_repository_slugs
         ):
             logger.warning("Deleting unmanaged (leftover?) Git repository clone at %s", filepath)
             shutil.rmtree(filepath, ignore_errors=True)
 
     # Make sure all GitRepository records that include Jobs have up-to-date git clones, and load their jobs
     for repo in GitRepository.objects.filter(provided_contents__contains="extras.job"):
+        if job_code_is_current(repo):
+            continue
         refresh_git_repository(state=None, repository_pk=repo.pk, head=repo.current_head)
 
 
@@ -0,0 +1,203 @@
+"""
+GraphQL backend that parses and validates each distinct query only once, and support for persisted queries.
+
+The default graphql-core backend parses the query text of each request into a new document, and validates it against
+the schema again every time it is executed. As clients tend to send the same few queries over and over, documents are
+instead validated once when they are created, and kept in a per-process least-recently-used cache keyed by a SHA-256
+hash of the schema's identity and the query text, so that executing a query that was seen before costs neither parsing nor validation.
+
+Clients may also send a persisted query, identified either by the `id` of a saved `GraphQLQuery`, or (following the
+Automatic Persisted Queries protocol) by the SHA-256 hash of its text in `extensions.persistedQuery.sha256Hash`. The
+text of a query is stored by its hash the first time it is sent along with its hash, after which the hash alone
+suffices.
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from functools import partial
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import get_default_backend
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.cache import GraphQLCachedBackend
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.execution import execute, ExecutionResult
+from graphql.language import ast
+from graphql.language.parser import parse
+from graphql.language.printer import print_ast
+from graphql.validation import validate
+
+from nautobot.core.utils.data import is_uuid
+
+# Time (in seconds) for which the text of a persisted query is kept since it was last sent
+PERSISTED_QUERY_TIMEOUT = 60 * 60 * 24
+
+_PERSISTED_QUERY_CACHE_KEY_PREFIX = "nautobot.core.graphql.persisted_query"
+
+_cached_backend = None
+_cached_backend_lock = threading.Lock()
+
+
+class PersistedQueryNotFound(Exception):
+    """Raised when a persisted query is requested by a hash or id that isn't known."""
+
+    def __init__(self, message="PersistedQueryNotFound"):
+        super().__init__(message)
+
+
+class DocumentLRUCache(MutableMapping):
+    """Thread-safe mapping that discards its least recently used items once it holds more than `maxsize` items."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+
+class LRUCachedBackend(GraphQLCachedBackend):
+    """`GraphQLCachedBackend` that tolerates documents being evicted from its cache map by other threads."""
+
+    def get_key_for_schema_and_document_string(self, schema, request_string):
+        """
+        Return the SHA-256 hash of the identity of `schema` and the query text, as the key of their cached document.
+
+        graphql-core's own keys are built-in `hash()` values, which may collide and thereby execute the wrong document,
+        and its `use_consistent_hash` option memoizes every distinct query text in a module-level dict without bound.
+        """
+        if isinstance(request_string, ast.Document):
+            request_string = print_ast(request_string)
+        # Each cached document refers to its schema, so a schema's id can't be reused while any of them are cached
+        return hashlib.sha256(f"{id(schema)}:{request_string}".encode("utf-8")).hexdigest()
+
+    def document_from_string(self, schema, request_string):
+        key = self.get_key_for_schema_and_document_string(schema, request_string)
+        document = self.cache_map.get(key)
+        if document is None:
+            document = self.backend.document_from_string(schema, request_string)
+            self.cache_map[key] = document
+        return document
+
+
+def _execute_validated(schema, document_ast, validation_errors, *args, **kwargs):
+    if validation_errors:
+        return ExecutionResult(errors=validation_errors, invalid=True)
+    return execute(schema, document_ast, *args, **kwargs)
+
+
+class ValidatedDocumentBackend(GraphQLCoreBackend):
+    """GraphQL backend whose documents are validated against the schema once, rather than on each execution."""
+
+    def document_from_string(self, schema, document_string):
+        if isinstance(document_string, ast.Document):
+            document_ast = document_string
+            document_string = print_ast(document_ast)
+        else:
+            document_ast = parse(document_string)
+        validation_errors = validate(schema, document_ast)
+        return GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=partial(_execute_validated, schema, document_ast, validation_errors, **self.execute_params),
+        )
+
+
+def get_graphql_backend():
+    """
+    Return the GraphQL backend to create documents with.
+
+    This is a backend caching up to `settings.GRAPHQL_DOCUMENT_CACHE_SIZE` validated documents in this process, or the
+    default graphql-core backend if that setting is 0.
+    """
+    global _cached_backend
+    if not settings.GRAPHQL_DOCUMENT_CACHE_SIZE:
+        return get_default_backend()
+    with _cached_backend_lock:
+        if _cached_backend is None or _cached_backend.cache_map.maxsize != settings.GRAPHQL_DOCUMENT_CACHE_SIZE:
+            _cached_backend = LRUCachedBackend(
+                ValidatedDocumentBackend(),
+                cache_map=DocumentLRUCache(settings.GRAPHQL_DOCUMENT_CACHE_SIZE),
+            )
+        return _cached_backend
+
+
+def get_query_hash(query):
+    """Return the SHA-256 hash of the given query text, as used to identify persisted queries."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _persisted_query_cache_key(query_hash):
+    return f"{_PERSISTED_QUERY_CACHE_KEY_PREFIX}.{query_hash}"
+
+
+def get_persisted_query(request, data, query=None, query_id=None):
+    """
+    Return the text of the query to execute for the given GraphQL request, resolving any persisted query.
+
+    Args:
+        request (HttpRequest): Request being executed, used to check permission to view a saved `GraphQLQuery`
+        data (dict): Parsed body of the request
+        query (str): Query text sent in the request, if any
+        query_id (str): `id` sent in the request, if any, identifying a saved `GraphQLQuery` to execute
+
+    Returns:
+        (str): The query to execute, which is `query` itself unless a persisted query was requested.
+
+    Raises:
+        PersistedQueryNotFound: if the requested persisted query isn't known
+        ValueError: if the sent query doesn't match the sent hash
+    """
+    from nautobot.extras.models import GraphQLQuery  # avoid circular import
+
+    extensions = data.get("extensions") or {}
+    persisted_query = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+    if isinstance(persisted_query, dict) and persisted_query.get("sha256Hash"):
+        query_hash = persisted_query["sha256Hash"]
+        if query:
+            if get_query_hash(query) != query_hash:
+                raise ValueError("provided sha does not match query")
+            cache.set(_persisted_query_cache_key(query_hash), query, timeout=PERSISTED_QUERY_TIMEOUT)
+            return query
+        query = cache.get(_persisted_query_cache_key(query_hash))
+        if query is None:
+            raise PersistedQueryNotFound()
+        cache.touch(_persisted_query_cache_key(query_hash), timeout=PERSISTED_QUERY_TIMEOUT)
+        return query
+
+    if not query and query_id:
+        saved_query = None
+        if is_uuid(query_id):
+            saved_query = GraphQLQuery.objects.restrict(request.user, "view").filter(pk=query_id).first()
+        if saved_query is None:
+            raise PersistedQueryNotFound()
+        return saved_query.query
+
+    return query
@@ -6,11 +6,15 @@ import graphene
 import graphene_django_optimizer as gql_optimizer
 from graphql import GraphQLError
 
+from nautobot.core.graphql.loaders import (
+    ComputedFieldLoader,
+    FilteredRelatedObjectsLoader,
+    get_loader,
+    RelationshipPeersLoader,
+)
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
 from nautobot.core.graphql.utils import get_filtering_args_from_filterset, str_to_var_name
 from nautobot.core.utils.lookup import get_filterset_for_model
-from nautobot.extras.choices import RelationshipSideChoices
-from nautobot.extras.models import RelationshipAssociation
 
 logger = logging.getLogger(__name__)
 RESOLVER_PREFIX = "resolve_"
@@ -57,6 +61,9 @@ def generate_filter_resolver(schema_type, resolver_name, field_name):
     """
     Generate function to resolve filtering of ManyToOne and ManyToMany related objects.
 
+    When filter arguments are given, the related objects of all parent objects for which this field is resolved together
+    (e.g. every item of a list) are loaded with a single filtered query, see `FilteredRelatedObjectsLoader`.
+
     Args:
         schema_type (DjangoObjectType): DjangoObjectType for a given model
         resolver_name (str): name of the resolver
@@ -72,6 +79,13 @@ def generate_filter_resolver(schema_type, resolver_name, field_name):
         if "_type" in kwargs:
             kwargs["type"] = kwargs.pop("_type")
 
+        if FilteredRelatedObjectsLoader.get_parent_lookup(type(self)._meta.get_field(field_name)) is not None:
+            # Each occurrence of this field in the query may have different arguments and select different subfields
+            loader = get_loader(
+                info, FilteredRelatedObjectsLoader, type(self), field_name, filterset_class, id(info.field_asts[0])
+            )
+            return loader.load(self.pk, info=info, filter_kwargs=kwargs)
+
         resolved_obj = filterset_class(kwargs, getattr(self, field_name).all())
 
         # Check result filter for errors.
@@ -100,6 +114,8 @@ def generate_custom_field_resolver(key, resolver_name):
         resolver_name (str): name of the resolver as declare in DjangoObjectType
     """
 
+    # Custom field values are stored on the object itself, so only that column needs to be loaded with it
+    @gql_optimizer.resolver_hints(only=["_custom_field_data"])
     def resolve_custom_field(self, info, **kwargs):
         return self.cf.get(key, None)
 
@@ -116,7 +132,7 @@ def generate_computed_field_resolver(name, resolver_name):
     """
 
     def resolve_computed_field(self, info, **kwargs):
-        return self.get_computed_field(key=name)
+        return get_loader(info, ComputedFieldLoader, type(self), name).load(self)
 
     resolve_computed_field.__name__ = resolver_name
     return resolve_computed_field
@@ -125,6 +141,9 @@ def generate_computed_field_resolver(name, resolver_name):
 def generate_relationship_resolver(name, resolver_name, relationship, side, peer_model):
     """Generate function to resolve each custom relationship within each DjangoObjectType.
 
+    The peers of all objects for which this field is resolved together (e.g. every item of a list) are loaded in a
+    single batch, see `RelationshipPeersLoader`.
+
     Args:
         name (str): name of the custom field to resolve
         resolver_name (str): name of the resolver as declare in DjangoObjectType
@@ -133,73 +152,12 @@ def generate_relationship_resolver(name, resolver_name, relationship, side, peer
         peer_model (Model): Django Model of the peer of this relationship
     """
 
+    @gql_optimizer.resolver_hints(only=["id"])
     def resolve_relationship(self, info, **kwargs):
-        """Return a queryset or an object depending on the type of the relationship."""
-        peer_side = RelationshipSideChoices.OPPOSITE[side]
-        query_params = {"relationship": relationship}
-        # https://github.com/nautobot/nautobot/issues/1228
-        # If querying for **only** the ID of the related object, for example:
-        # { device(id:"...") { ... rel_my_relationship { id } } }
-        # we will get this exception:
-        # TypeError: Cannot call select_related() after .values() or .values_list()
-        # This appears to be a bug in graphene_django_optimizer but I haven't found a known issue on GitHub.
-        # For now we just work around it by catching the exception and retrying without optimization, below...
-        if not relationship.symmetric:
-            # Get the objects on the other side of this relationship
-            query_params[f"{side}_id"] = self.pk
-
-            try:
-                queryset_ids = gql_optimizer.query(
-                    RelationshipAssociation.objects.filter(**query_params).values_list(f"{peer_side}_id", flat=True),
-                    info,
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = RelationshipAssociation.objects.filter(**query_params).values_list(
-                    f"{peer_side}_id", flat=True
-                )
-        else:
-            # Get objects that are peers for this relationship, regardless of side
-            try:
-                queryset_ids = list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                            "destination_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-                queryset_ids += list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                            "source_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = list(
-                    RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                        "destination_id", flat=True
-                    ),
-                )
-                queryset_ids += list(
-                    RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                        "source_id", flat=True
-                    ),
-                )
-
-        if relationship.has_many(peer_side):
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids), info)
-
-        # Also apparently a graphene_django_optimizer bug - in the same query case as described above, here we may see:
-        # AttributeError: object has no attribute "only"
-        try:
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids).first(), info)
-        except AttributeError:
-            logger.debug("Caught AttributeError in graphene_django_optimizer, falling back to un-optimized query")
-            return peer_model.objects.filter(id__in=queryset_ids).first()
+        """Return a list or an object depending on the type of the relationship."""
+        # Each occurrence of this field in the query may select different subfields of the peers
+        loader = get_loader(info, RelationshipPeersLoader, relationship, side, peer_model, id(info.field_asts[0]))
+        return loader.load(self.pk, info=info)
 
     resolve_relationship.__name__ = resolver_name
     return resolve_relationship
@@ -0,0 +1,246 @@
+"""
+Batch loaders used to resolve GraphQL fields that can't be fetched with the query of their parent objects.
+
+Without batching, a field such as a custom relationship runs its own queries for every object it is resolved on, so that
+querying it on a list of N objects costs N times as many queries. Resolvers instead request their value from one of the
+`DataLoader` subclasses below, which collects the parent objects of every resolver that runs in the same step of query
+execution (e.g. for every item of a list) and resolves them all at once with a constant number of queries.
+
+Loaders are shared by all resolvers of the same field within a single GraphQL request, via `get_loader()`. They don't
+cache their results, as the same request object may be used to execute more than one query.
+"""
+
+import logging
+
+from django.conf import settings
+from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F, ManyToManyField, Q
+import graphene_django_optimizer as gql_optimizer
+from graphql import GraphQLError
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from nautobot.extras.choices import RelationshipSideChoices
+
+logger = logging.getLogger(__name__)
+
+
+def get_loader(info, loader_class, *args):
+    """
+    Return the instance of `loader_class` for the given arguments in the current GraphQL request, creating it if needed.
+
+    Args:
+        info (ResolveInfo): Info of the field being resolved
+        loader_class (type): `DataLoader` subclass to instantiate
+        *args: Hashable arguments identifying the loader, passed to its constructor
+    """
+    loaders = getattr(info.context, "_graphql_loaders", None)
+    if loaders is None:
+        loaders = {}
+        try:
+            info.context._graphql_loaders = loaders
+        except AttributeError:
+            # No request to store the loaders on, so only the objects resolved through this loader are batched
+            pass
+    key = (loader_class, *args)
+    if key not in loaders:
+        loaders[key] = loader_class(*args)
+    return loaders[key]
+
+
+class NautobotDataLoader(DataLoader):
+    """Base class for loaders that resolve a value for each of a list of parent objects with `load_values()`."""
+
+    def __init__(self, *args):
+        super().__init__(cache=False)
+        self.args = args
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        return Promise.resolve(self.load_values(keys))
+
+    def load_values(self, keys):
+        """Return a list of the values corresponding to each of the given keys."""
+        raise NotImplementedError
+
+
+class RelationshipPeersLoader(NautobotDataLoader):
+    """
+    Load the peers of parent objects (by pk) for a Relationship, with one RelationshipAssociation and one peer query.
+
+    Constructor arguments are the Relationship, the side of the Relationship the parent objects are on, the peer model,
+    and a key identifying the field in the GraphQL query (as the peers of each field may select different subfields).
+    """
+
+    # Info of the most recently loaded field, used to optimize the peer query for the subfields it selects
+    info = None
+
+    def load(self, key, info=None):  # pylint: disable=arguments-differ
+        if info is not None:
+            self.info = info
+        return super().load(key)
+
+    def load_values(self, keys):
+        from nautobot.extras.models import RelationshipAssociation  # avoid circular import
+
+        relationship, side, peer_model, _ = self.args
+        peer_side = RelationshipSideChoices.OPPOSITE[side]
+        peer_ids = {key: set() for key in keys}
+
+        associations = RelationshipAssociation.objects.filter(relationship=relationship)
+        if relationship.symmetric:
+            # Get objects that are peers for this relationship, regardless of side
+            associations = associations.filter(Q(source_id__in=peer_ids) | Q(destination_id__in=peer_ids))
+        else:
+            # Get the objects on the other side of this relationship
+            associations = associations.filter(**{f"{side}_id__in": peer_ids})
+        for source_id, destination_id in associations.values_list("source_id", "destination_id"):
+            if source_id in peer_ids and (relationship.symmetric or side == RelationshipSideChoices.SIDE_SOURCE):
+                peer_ids[source_id].add(destination_id)
+            if destination_id in peer_ids and (
+                relationship.symmetric or side == RelationshipSideChoices.SIDE_DESTINATION
+            ):
+                peer_ids[destination_id].add(source_id)
+
+        all_peer_ids = set().union(*peer_ids.values())
+        peers = peer_model.objects.filter(id__in=all_peer_ids) if all_peer_ids else peer_model.objects.none()
+        # https://github.com/nautobot/nautobot/issues/1228
+        # graphene_django_optimizer may raise a TypeError or AttributeError when querying for **only** the ID of the
+        # peer objects, in which case we fall back to an unoptimized query.
+        try:
+            peers = list(gql_optimizer.query(peers, self.info) if self.info is not None else peers)
+        except (AttributeError, TypeError):
+            logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+            peers = list(peer_model.objects.filter(id__in=all_peer_ids))
+
+        # Preserve the ordering of the peer query in the list of peers of each object
+        peer_positions = {peer.pk: position for position, peer in enumerate(peers)}
+        results = []
+        for key in keys:
+            key_peers = [
+                peers[position]
+                for position in sorted(peer_positions[pk] for pk in peer_ids[key] if pk in peer_positions)
+            ]
+            if relationship.has_many(peer_side):
+                results.append(key_peers)
+            else:
+                results.append(key_peers[0] if key_peers else None)
+        return results
+
+
+class FilteredRelatedObjectsLoader(NautobotDataLoader):
+    """
+    Load the related objects of parent objects (by pk) through a one-to-many or many-to-many field, filtered by a filterset.
+
+    All parent objects are resolved with a single filtered query, which is then grouped back by parent pk in memory.
+    Constructor arguments are the parent model, the name of the related field, the filterset class of the related model,
+    and a key identifying the field in the GraphQL query (as each occurrence may have different arguments and subfields).
+    """
+
+    # Info and arguments of the most recently loaded field
+    info = None
+    filter_kwargs = None
+
+    def load(self, key, info=None, filter_kwargs=None):  # pylint: disable=arguments-differ
+        if info is not None:
+            self.info = info
+        if filter_kwargs is not None:
+            self.filter_kwargs = filter_kwargs
+        return super().load(key)
+
+    @staticmethod
+    def get_parent_lookup(field):
+        """Return the lookup from the related model of `field` back to its parent model, or None if there's none."""
+        if isinstance(field, GenericRelation):
+            return field.object_id_field_name
+        if isinstance(field, ManyToManyField):
+            # The reverse relation of e.g. `ManyToManyField(related_name="+")` can't be queried
+            return None if field.remote_field.is_hidden() else field.related_query_name()
+        # ManyToOneRel or ManyToManyRel, i.e. the reverse side of a field on the related model
+        return field.field.name
+
+    def load_values(self, keys):
+        model, field_name, filterset_class, _ = self.args
+        field = model._meta.get_field(field_name)
+        parent_lookup = self.get_parent_lookup(field)
+
+        queryset = field.related_model._default_manager.filter(**{f"{parent_lookup}__in": keys})
+        if isinstance(field, GenericRelation):
+            content_type = ContentType.objects.get_for_model(model, for_concrete_model=field.for_concrete_model)
+            queryset = queryset.filter(**{field.content_type_field_name: content_type})
+
+        filterset = filterset_class(self.filter_kwargs, queryset)
+        if filterset.errors:
+            # Raising this exception will send the error message in the response of the GraphQL request
+            raise GraphQLError({key: filterset.errors[key] for key in filterset.errors})
+        queryset = filterset.qs
+        # https://github.com/nautobot/nautobot/issues/1228
+        try:
+            if self.info is not None:
+                queryset = gql_optimizer.query(queryset, self.info)
+        except (AttributeError, TypeError):
+            logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+
+        # Group by the string representation of the parent pk, as a generic relation's object id may be a CharField
+        related_objects = {str(key): [] for key in keys}
+        for related_object in queryset.annotate(_graphql_parent_pk=F(parent_lookup)):
+            related_objects[str(related_object._graphql_parent_pk)].append(related_object)
+        return [related_objects[str(key)] for key in keys]
+
+
+class ConfigContextLoader(NautobotDataLoader):
+    """Load the rendered config context of Devices or Virtual Machines with a single query per batch."""
+
+    def load_values(self, keys):
+        from nautobot.extras.config_context_cache import prefetch_config_contexts  # avoid circular import
+
+        # Use any stored rendered data first
+        prefetch_config_contexts(keys)
+        # The annotation doesn't account for Dynamic Groups, in which case each object is queried separately
+        if not settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            missing = {
+                obj.pk: obj
+                for obj in keys
+                if not hasattr(obj, "config_context_data") and not hasattr(obj, "_rendered_config_context_data")
+            }
+            if missing:
+                model = type(next(iter(missing.values())))
+                annotated = dict(
+                    model.objects.filter(pk__in=missing)
+                    .annotate_config_context_data()
+                    .values_list("pk", "config_context_data")
+                )
+                for pk, obj in missing.items():
+                    obj.config_context_data = annotated.get(pk) or []
+        return [obj.get_config_context() for obj in keys]
+
+
+class DynamicGroupsLoader(NautobotDataLoader):
+    """Load the (cached) DynamicGroups that objects of a given model (by pk) are members of, with a single query."""
+
+    def load_values(self, keys):
+        from nautobot.extras.models import DynamicGroup  # avoid circular import
+
+        (model,) = self.args
+        dynamic_groups = {key: [] for key in keys}
+        for dynamic_group in DynamicGroup.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            static_group_associations__associated_object_id__in=dynamic_groups,
+        ).annotate(_associated_object_id=F("static_group_associations__associated_object_id")):
+            dynamic_groups[dynamic_group._associated_object_id].append(dynamic_group)
+        return [dynamic_groups[key] for key in keys]
+
+
+class ComputedFieldLoader(NautobotDataLoader):
+    """Render a ComputedField of a given model and key for a list of objects, looking up the ComputedField once."""
+
+    def load_values(self, keys):
+        from nautobot.extras.models import ComputedField  # avoid circular import
+
+        model, key = self.args
+        try:
+            computed_field = ComputedField.objects.get_for_model(model).get(key=key)
+        except ComputedField.DoesNotExist:
+            logger.warning("Computed Field with key %s does not exist for model %s", key, model._meta.verbose_name)
+            return [None] * len(keys)
+        return [computed_field.render(context={"obj": obj}) for obj in keys]
@@ -24,6 +24,7 @@ from nautobot.core.graphql.generators import (
     generate_restricted_queryset,
     generate_schema_type,
 )
+from nautobot.core.graphql.loaders import ConfigContextLoader, DynamicGroupsLoader, get_loader
 from nautobot.core.graphql.types import ContentTypeType, DateType, JSON
 from nautobot.core.graphql.utils import str_to_var_name
 from nautobot.dcim.graphql.types import (
@@ -363,8 +364,8 @@ def extend_schema_type_config_context(schema_type, model):
     if "local_config_context_data" not in fields_name:
         return schema_type
 
-    def resolve_config_context(self, args):
-        return self.get_config_context()
+    def resolve_config_context(self, info):
+        return get_loader(info, ConfigContextLoader, model).load(self)
 
     schema_type._meta.fields["config_context"] = graphene.Field.mounted(generic.GenericScalar())
     setattr(schema_type, "resolve_config_context", resolve_config_context)
@@ -379,8 +380,8 @@ def extend_schema_type_global_features(schema_type, model):
     # associated_contacts and associated_object_metadata are handled elsewhere by extend_schema_type_filter()
     if getattr(model, "is_dynamic_group_associable_model", False):
 
-        def resolve_dynamic_groups(self, args):
-            return self.dynamic_groups
+        def resolve_dynamic_groups(self, info):
+            return get_loader(info, DynamicGroupsLoader, model).load(self.pk)
 
         setattr(schema_type, "resolve_dynamic_groups", resolve_dynamic_groups)
         schema_type._meta.fields["dynamic_groups"] = graphene.Field.mounted(graphene.List(DynamicGroupType))
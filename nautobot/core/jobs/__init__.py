@@ -1,18 +1,20 @@
 import codecs
 import contextlib
 from io import BytesIO
+import tempfile
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.http import QueryDict
 from rest_framework import exceptions as drf_exceptions
 
 from nautobot.core.api.exceptions import SerializerNotFound
+from nautobot.core.api.mixins import prefetch_related_object_lookups, related_object_cache
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.utils import get_serializer_for_model, serialize_queryset_in_chunks
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.exceptions import AbortTransaction
 from nautobot.core.jobs.cleanup import LogsCleanup
@@ -22,9 +24,16 @@ from nautobot.core.utils.requests import get_filterable_params_from_filter_param
 from nautobot.extras.datasources import ensure_git_repository, git_repository_dry_run, refresh_datasource_content
 from nautobot.extras.jobs import BooleanVar, ChoiceVar, FileVar, Job, ObjectVar, RunJobTaskFailed, StringVar, TextVar
 from nautobot.extras.models import ExportTemplate, GitRepository
+from nautobot.extras.utils import bulk_create_with_bulk_change_logging
 
 name = "System Jobs"
 
+# Number of rows of data to validate, create, and check permissions for at a time when importing objects
+IMPORT_BATCH_SIZE = 1000
+
+# Size (in bytes) above which exported data is buffered on disk rather than in memory until it is saved
+EXPORT_SPOOL_MAX_SIZE = 10 * 1024 * 1024
+
 
 class GitRepositorySync(Job):
     """
@@ -181,7 +190,7 @@ class ExportObjectList(Job):
                 raise
             if export_template.file_extension:
                 filename += f".{export_template.file_extension}"
-            self.create_file(filename, output)
+            self._create_file(filename, output)
 
         elif export_format == "yaml":
             # Device-type (etc.) YAML export
@@ -189,8 +198,13 @@ class ExportObjectList(Job):
                 self.logger.error("Model %s doesn't support YAML export", content_type.model)
                 raise ValueError("YAML export not supported for this content-type")
             self.logger.info("Exporting %d objects to YAML. This may take some time.", object_count)
-            yaml_data = [obj.to_yaml() for obj in queryset]
-            self.create_file(filename + ".yaml", "---\n".join(yaml_data))
+            with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE) as output:
+                for i, obj in enumerate(queryset.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)):
+                    if i:
+                        output.write(b"---\n")
+                    output.write(obj.to_yaml().encode("utf-8"))
+                output.seek(0)
+                self._create_file(filename + ".yaml", output)
 
         else:
             # Generic CSV export
@@ -200,9 +214,16 @@ class ExportObjectList(Job):
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
             # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
             # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            csv_data = renderer.render(serializer.data)
-            self.create_file(filename + ".csv", csv_data)
+            chunks = serialize_queryset_in_chunks(
+                queryset,
+                lambda chunk: serializer_class(chunk, many=True, context={"request": None}, force_csv=True),
+            )
+            # Write the CSV data out as each chunk of objects is serialized, rather than holding all of it in memory
+            with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE) as output:
+                for csv_data in renderer.render_stream(chunks):
+                    output.write(csv_data.encode("utf-8"))
+                output.seek(0)
+                self._create_file(filename + ".csv", output)
 
 
 class ImportObjects(Job):
@@ -247,28 +268,128 @@ class ImportObjects(Job):
     def _perform_operation(self, data, serializer_class, queryset):
         new_objs = []
         validation_failed = False
-        for row, entry in enumerate(data, start=1):
-            serializer = serializer_class(data=entry, context={"request": None})
-            if serializer.is_valid():
-                try:
-                    with transaction.atomic():
-                        new_obj = serializer.save()
-                        if not queryset.filter(pk=new_obj.pk).exists():
-                            raise AbortTransaction()
-                    self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
-                    new_objs.append(new_obj)
-                except AbortTransaction:
-                    self.logger.error(
-                        'Row %d: User "%s" does not have permission to create an object with these attributes',
-                        row,
-                        self.user,
+        model = serializer_class.Meta.model
+        bulk_create = model.supports_bulk_create and not (
+            hasattr(model, "required_related_objects_errors")
+            and model.required_related_objects_errors(output_for="api", initial_data={})
+        )
+
+        with related_object_cache():
+            for start in range(0, len(data), IMPORT_BATCH_SIZE):
+                batch = list(enumerate(data[start : start + IMPORT_BATCH_SIZE], start=start + 1))
+                # Look up the related objects referenced by the whole batch at once
+                prefetch_related_object_lookups(
+                    serializer_class(context={"request": None, "depth": 0}),
+                    [entry for _, entry in batch],
+                    IMPORT_BATCH_SIZE,
+                )
+
+                pending_rows = []
+                for row, entry in batch:
+                    serializer = serializer_class(data=entry, context={"request": None})
+                    if not serializer.is_valid() and pending_rows:
+                        # The row may reference an object to be created by an earlier row, so save those and retry
+                        validation_failed |= self._create_objects(pending_rows, queryset, bulk_create, new_objs)
+                        pending_rows = []
+                        serializer = serializer_class(data=entry, context={"request": None})
+                        serializer.is_valid()
+                    if serializer.errors:
+                        validation_failed = True
+                        for field, err in serializer.errors.items():
+                            self.logger.error("Row %d: `%s`: `%s`", row, field, err[0])
+                    else:
+                        pending_rows.append((row, serializer))
+                validation_failed |= self._create_objects(pending_rows, queryset, bulk_create, new_objs)
+
+                if len(data) > IMPORT_BATCH_SIZE:
+                    self.logger.info("Processed %d of %d rows", start + len(batch), len(data))
+
+        return new_objs, validation_failed
+
+    def _create_objects(self, valid_rows, queryset, bulk_create, new_objs):
+        """
+        Create and log the objects for the given list of validated `(row, serializer)` tuples, where permitted.
+
+        The created objects are appended to `new_objs`. Returns True if any of the rows couldn't be created.
+        """
+        created, denied_rows, failed_rows = self._save_permitted_objects(valid_rows, queryset, bulk_create)
+        for row in sorted(denied_rows):
+            self.logger.error(
+                'Row %d: User "%s" does not have permission to create an object with these attributes',
+                row,
+                self.user,
+            )
+        for row, exc in sorted(failed_rows.items()):
+            self.logger.error("Row %d: `%s`", row, exc)
+        for row, new_obj in created:
+            self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
+            new_objs.append(new_obj)
+        return bool(denied_rows or failed_rows)
+
+    def _save_permitted_objects(self, valid_rows, queryset, bulk_create):
+        """
+        Save the objects for the given list of validated `(row, serializer)` tuples, if permitted by `queryset`.
+
+        Returns a list of `(row, new_obj)` tuples, the set of rows that the user doesn't have permission to create, and
+        a dict of `{row: exception}` for rows that conflict with an existing object or another row (e.g. duplicates).
+        """
+        denied_rows = set()
+        while True:
+            rows = [(row, s) for row, s in valid_rows if row not in denied_rows]
+            try:
+                with transaction.atomic():
+                    created = self._save_objects(rows, bulk_create)
+                    # Enforce object-level permissions for the whole batch at once
+                    permitted_pks = set(
+                        queryset.filter(pk__in=[obj.pk for _, obj in created]).values_list("pk", flat=True)
                     )
-                    validation_failed = True
+                    newly_denied_rows = {row for row, obj in created if obj.pk not in permitted_pks}
+                    if newly_denied_rows:
+                        denied_rows |= newly_denied_rows
+                        raise AbortTransaction()
+                return created, denied_rows, {}
+            except AbortTransaction:
+                # Create the remaining objects again, without those that weren't permitted
+                continue
+            except IntegrityError as exc:
+                if len(rows) == 1:
+                    return [], denied_rows, {rows[0][0]: exc}
+                break
+
+        # At least one row conflicts with an existing object or another row; save them one at a time to find which
+        created, failed_rows = [], {}
+        for row_and_serializer in rows:
+            row_created, row_denied_rows, row_failed_rows = self._save_permitted_objects(
+                [row_and_serializer], queryset, bulk_create
+            )
+            created += row_created
+            denied_rows |= row_denied_rows
+            failed_rows.update(row_failed_rows)
+        return created, denied_rows, failed_rows
+
+    def _save_objects(self, valid_rows, bulk_create):
+        created = []
+        bulk_created = []
+        for row, serializer in valid_rows:
+            instance = self._get_unsaved_instance(serializer) if bulk_create else None
+            if instance is not None:
+                bulk_created.append((row, instance))
             else:
-                validation_failed = True
-                for field, err in serializer.errors.items():
-                    self.logger.error("Row %d: `%s`: `%s`", row, field, err[0])
-        return new_objs, validation_failed
+                # Not using serializer.save() as this may be called again for the same serializer
+                created.append((row, serializer.create(dict(serializer.validated_data))))
+        bulk_create_with_bulk_change_logging([obj for _, obj in bulk_created], batch_size=IMPORT_BATCH_SIZE)
+        return sorted(created + bulk_created, key=lambda row_and_obj: row_and_obj[0])
+
+    def _get_unsaved_instance(self, serializer):
+        """Return an unsaved instance for the given validated serializer, or None if it has any many-to-many data."""
+        model = serializer.Meta.model
+        attrs = dict(serializer.validated_data)
+        if attrs.pop("tags", None) or attrs.pop("relationships", None):
+            return None
+        for field in model._meta.many_to_many:
+            if attrs.pop(field.name, None):
+                return None
+        return model(**attrs)
 
     def run(self, *, content_type, csv_data=None, csv_file=None, roll_back_if_error=False):
         if not self.user.has_perm(f"{content_type.app_label}.add_{content_type.model}"):
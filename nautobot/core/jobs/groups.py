@@ -1,5 +1,6 @@
 from nautobot.extras.choices import DynamicGroupTypeChoices
-from nautobot.extras.jobs import Job, ObjectVar
+from nautobot.extras.dynamic_group_refresh import enqueue_cache_refresh
+from nautobot.extras.jobs import BooleanVar, Job, ObjectVar
 from nautobot.extras.models import DynamicGroup
 
 name = "System Jobs"
@@ -19,18 +20,30 @@ class RefreshDynamicGroupCaches(Job):
         required=False,
     )
 
+    parallel = BooleanVar(
+        description="Refresh all groups in parallel in Celery workers (children before their parents) "
+        "instead of one at a time within this job",
+        default=False,
+    )
+
     class Meta:
         name = "Refresh Dynamic Group Caches"
         description = "Re-calculate and re-cache the membership lists of Dynamic Groups."
         has_sensitive_variables = False
 
-    def run(self, single_group=None):
+    def run(self, single_group=None, parallel=False):
         groups = DynamicGroup.objects.restrict(self.user, "view").exclude(
             group_type=DynamicGroupTypeChoices.TYPE_STATIC
         )
         if single_group is not None:
             groups = groups.filter(pk=single_group.pk)
 
+        if parallel:
+            group_pks = list(groups.values_list("pk", flat=True))
+            enqueue_cache_refresh(group_pks)
+            self.logger.info("Refresh of %d cache(s) enqueued", len(group_pks))
+            return
+
         for group in groups:
             group.update_cached_members()
             self.logger.info("Cache refreshed successfully, now with %d members", group.count, extra={"object": group})
@@ -53,6 +53,9 @@ class BaseModel(models.Model):
     is_metadata_associable_model = True
     is_saved_view_model = False  # SavedViewMixin overrides this to default True
     is_cloud_resource_type_model = False  # CloudResourceTypeMixin overrides this to default True
+    # Whether new instances can be created with `bulk_create()` (such as by the ImportObjects system Job) rather than
+    # `save()`, i.e. whether neither `save()` nor any model-specific signal handlers do anything beyond saving the object
+    supports_bulk_create = False
 
     associated_object_metadata = GenericRelation(
         "extras.ObjectMetadata",
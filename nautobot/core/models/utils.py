@@ -1,3 +1,4 @@
+import functools
 from itertools import count, groupby
 import json
 import unicodedata
@@ -5,7 +6,8 @@ from urllib.parse import quote_plus, unquote_plus
 
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist
-from django.core.serializers import serialize
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.encoding import is_protected_type
 from django.utils.tree import Node
 import emoji
 from slugify import slugify
@@ -96,15 +98,58 @@ def pretty_print_query(query):
     return pretty_str(query)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_serialized_fields(model):
+    """
+    Return the fields of `model` that Django's built-in serializer would include, as a tuple of `(field, is_m2m)`.
+
+    Only many-to-many fields with an auto-created through table are included, as with Django's serializer.
+    """
+    concrete_model = model._meta.concrete_model
+    fields = [(field, False) for field in concrete_model._meta.local_fields if field.serialize]
+    fields += [
+        (field, True)
+        for field in concrete_model._meta.local_many_to_many
+        if field.serialize and field.remote_field.through._meta.auto_created
+    ]
+    return tuple(fields)
+
+
+def _serialize_field_value(obj, field, json_encoder):
+    """Return the value of `field` on `obj` as it would appear after a round-trip through `serialize("json")`."""
+    value = field.value_from_object(obj)
+    if not is_protected_type(value):
+        value = field.value_to_string(obj)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        # e.g. JSONField, whose nested values may still need converting
+        return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+    return json_encoder.default(value)
+
+
 def serialize_object(obj, extra=None, exclude=None):
     """
     Return a generic JSON representation of an object using Django's built-in serializer. (This is used for things like
     change logging, not the REST API.) Optionally include a dictionary to supplement the object data. A list of keys
     can be provided to exclude them from the returned dictionary. Private fields (prefaced with an underscore) are
     implicitly excluded.
+
+    The fields to include are determined once per model, and the data is built directly rather than being rendered to a
+    JSON string and parsed again, but is otherwise identical to `json.loads(serialize("json", [obj]))[0]["fields"]`.
     """
-    json_str = serialize("json", [obj])
-    data = json.loads(json_str)[0]["fields"]
+    json_encoder = DjangoJSONEncoder()
+    data = {}
+    for field, is_m2m in _get_serialized_fields(type(obj)):
+        if not is_m2m:
+            data[field.name] = _serialize_field_value(obj, field, json_encoder)
+            continue
+        related_objects = getattr(obj, "_prefetched_objects_cache", {}).get(field.name)
+        if related_objects is None:
+            related_objects = getattr(obj, field.name).select_related(None).only("pk").iterator()
+        data[field.name] = [
+            _serialize_field_value(related, related._meta.pk, json_encoder) for related in related_objects
+        ]
 
     # Include custom_field_data as "custom_fields"
     if hasattr(obj, "_custom_field_data"):
@@ -132,9 +177,11 @@ def serialize_object(obj, extra=None, exclude=None):
     return data
 
 
-def serialize_object_v2(obj):
+def serialize_object_v2(obj, fallback_data=None):
     """
     Return a JSON serialized representation of an object using obj's serializer.
+
+    If obj has no serializer, `fallback_data` is returned if provided, otherwise the result of `serialize_object(obj)`.
     """
     from nautobot.core.api.exceptions import SerializerNotFound
     from nautobot.core.api.utils import get_serializer_for_model
@@ -145,7 +192,7 @@ def serialize_object_v2(obj):
         data = serializer_class(obj, context={"request": None, "depth": 1}).data
     except SerializerNotFound:
         # Fall back to generic JSON representation of obj
-        data = serialize_object(obj)
+        data = fallback_data if fallback_data is not None else serialize_object(obj)
 
     return data
 
@@ -81,6 +81,12 @@ if "NAUTOBOT_BANNER_TOP" in os.environ and os.environ["NAUTOBOT_BANNER_TOP"] !=
 if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGELOG_RETENTION"] != "":
     CHANGELOG_RETENTION = int(os.environ["NAUTOBOT_CHANGELOG_RETENTION"])
 
+# Generate the REST API representation of the ObjectChanges of created and updated objects in a Celery worker
+CHANGELOG_ASYNC_ENABLED = is_truthy(os.getenv("NAUTOBOT_CHANGELOG_ASYNC_ENABLED", "False"))
+
+# Store the rendered ConfigContext data of each Device and Virtual Machine in the cache, rather than recomputing it on read
+CONFIG_CONTEXT_CACHE_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_CACHE_ENABLED", "False"))
+
 # Disable linking of Config Context objects via Dynamic Groups by default. This could cause performance impacts
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
@@ -96,6 +102,14 @@ if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID
 if "NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY" in os.environ and os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"] != "":
     DEVICE_NAME_AS_NATURAL_KEY = is_truthy(os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"])
 
+# Refresh the cached members of Dynamic Groups (and their ancestors) in Celery workers after they are saved
+DYNAMIC_GROUPS_ASYNC_REFRESH_ENABLED = is_truthy(os.getenv("NAUTOBOT_DYNAMIC_GROUPS_ASYNC_REFRESH_ENABLED", "False"))
+
+# Re-evaluate the cached Dynamic Group memberships of each object as it is saved, rather than only on a full refresh
+DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED", "False")
+)
+
 # Exclude potentially sensitive models from wildcard view exemption. These may still be exempted
 # by specifying the model individually in the EXEMPT_VIEW_PERMISSIONS configuration parameter.
 EXEMPT_EXCLUDE_MODELS = (
@@ -107,15 +121,27 @@ EXEMPT_EXCLUDE_MODELS = (
 # Models to exempt from the enforcement of view permissions
 EXEMPT_VIEW_PERMISSIONS = []
 
+# Number of objects to fetch from the database and serialize at a time when exporting object lists
+EXPORT_CHUNK_SIZE = int(os.getenv("NAUTOBOT_EXPORT_CHUNK_SIZE", "2000"))
+
+# Stream CSV and unpaginated JSON REST API list responses to the client as they are serialized
+EXPORT_STREAMING_RESPONSES_ENABLED = is_truthy(os.getenv("NAUTOBOT_EXPORT_STREAMING_RESPONSES_ENABLED", "False"))
+
 # The file path to a directory where cloned Git repositories will be located
 GIT_ROOT = os.getenv("NAUTOBOT_GIT_ROOT", os.path.join(NAUTOBOT_ROOT, "git").rstrip("/"))
 
+# Number of parsed and validated GraphQL query documents to keep in memory per process (0 to disable)
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("NAUTOBOT_GRAPHQL_DOCUMENT_CACHE_SIZE", "100"))
+
 # HTTP proxies to use for outbound requests originating from Nautobot (e.g. when sending webhook requests)
 HTTP_PROXIES = None
 
 # Send anonymized installation metrics when post_upgrade or send_installation_metrics management commands are run
 INSTALLATION_METRICS_ENABLED = is_truthy(os.getenv("NAUTOBOT_INSTALLATION_METRICS_ENABLED", "True"))
 
+# Answer Prefix containment and closest-parent lookups from a per-process, in-memory trie of each Namespace's Prefixes
+IPAM_PREFIX_TRIE_ENABLED = is_truthy(os.getenv("NAUTOBOT_IPAM_PREFIX_TRIE_ENABLED", "False"))
+
 # Maximum file size (in bytes) that as running Job can create in a call to `Job.create_file()`. Default is 10 << 20
 if "NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE" in os.environ and os.environ["NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE"] != "":
     JOB_CREATE_FILE_MAX_SIZE = int(os.environ["NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE"])
@@ -126,6 +152,9 @@ JOB_FILE_IO_STORAGE = os.getenv("NAUTOBOT_JOB_FILE_IO_STORAGE", "db_file_storage
 # The file path to a directory where locally installed Jobs can be discovered
 JOBS_ROOT = os.getenv("NAUTOBOT_JOBS_ROOT", os.path.join(NAUTOBOT_ROOT, "jobs").rstrip("/"))
 
+# Number of seconds for which frequently used model metadata (such as custom fields) is reused from process memory
+LOCAL_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_LOCAL_CACHE_TIMEOUT", "0"))
+
 # `Location` names are not guaranteed globally-unique by Nautobot but in practice they often are.
 # Set this to `True` to use the location `name` alone as the natural key for `Location` objects.
 # Set this to `False` to use the sequence `(name, parent__name, parent__parent__name, ...)` as the natural key instead.
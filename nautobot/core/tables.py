@@ -5,6 +5,7 @@ from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db import NotSupportedError
+from django.db.models import Prefetch
 from django.db.models.fields.related import ForeignKey, RelatedField
 from django.db.models.fields.reverse_related import ManyToOneRel
 from django.urls import reverse
@@ -153,6 +154,10 @@ class BaseTable(django_tables2.Table):
             for column in self.columns:
                 if not column.visible:
                     continue
+                if isinstance(column.column, RelationshipColumn):
+                    # One filtered prefetch per relationship (and side) for the whole page
+                    prefetch_fields.extend(column.column.get_prefetches())
+                    continue
                 if isinstance(column.column, LinkedCountColumn):
                     column_model = lookup.get_model_for_view_name(column.column.viewname)
                     if column_model is None:
@@ -229,7 +234,11 @@ class BaseTable(django_tables2.Table):
                         model.__name__,
                     )
                 else:
-                    logger.debug("Applying .prefetch_related(%s) to %s QuerySet", prefetch_fields, model.__name__)
+                    logger.debug(
+                        "Applying .prefetch_related(%s) to %s QuerySet",
+                        [getattr(field, "prefetch_to", field) for field in prefetch_fields],
+                        model.__name__,
+                    )
                     # Belt and suspenders - we should have avoided any error cases above, but be safe anyway:
                     try:
                         queryset = queryset.prefetch_related(*prefetch_fields)
@@ -242,7 +251,8 @@ class BaseTable(django_tables2.Table):
 
             if count_fields:
                 for column_name, column_model, lookup_name in count_fields:
-                    if hasattr(queryset.first(), column_name):
+                    # Inspect the query rather than fetching a record, so that we don't spend a query per column
+                    if column_name in queryset.query.annotations or hasattr(model, column_name):
                         continue
                     try:
                         logger.debug(
@@ -597,18 +607,67 @@ class RelationshipColumn(django_tables2.Column):
         self.side = side
         self.peer_side = choices.RelationshipSideChoices.OPPOSITE[side]
         kwargs.setdefault("verbose_name", relationship.get_label(side))
-        kwargs.setdefault("accessor", Accessor("associations"))
+        # The associations are looked up in render(), from the prefetched data if available (see get_prefetches()),
+        # so the accessor only needs to resolve to a non-empty value without triggering any queries of its own.
+        kwargs.setdefault("accessor", Accessor("pk"))
         super().__init__(orderable=False, *args, **kwargs)
 
-    def render(self, record, value):  # pylint: disable=arguments-differ
+    @property
+    def association_sides(self):
+        """The side(s) of a RelationshipAssociation on which a record in this column's table may be found."""
+        if self.relationship.symmetric:
+            return (choices.RelationshipSideChoices.SIDE_SOURCE, choices.RelationshipSideChoices.SIDE_DESTINATION)
+        return (self.side,)
+
+    def get_prefetch_attr(self, side):
+        """Name of the attribute that get_prefetches() populates with this column's associations for `side`."""
+        return f"_cr_{self.relationship.key}_{side}_associations"
+
+    def get_peer_model(self):
+        """The model class of the objects on the other side of this relationship, or None if not installed."""
+        peer_side = self.peer_side
+        if peer_side == choices.RelationshipSideChoices.SIDE_PEER:
+            peer_side = choices.RelationshipSideChoices.SIDE_SOURCE
+        return getattr(self.relationship, f"{peer_side}_type").model_class()
+
+    def get_prefetches(self):
+        """
+        Get the Prefetch objects needed to render this column for a whole page of records in a constant number of queries.
+
+        The associations are restricted to this column's relationship, and on the "one" side of a relationship the peer
+        objects are prefetched as well, since they are rendered as links.
+        """
+        prefetches = []
+        for side in self.association_sides:
+            queryset = models.RelationshipAssociation.objects.filter(relationship=self.relationship)
+            if not self.relationship.has_many(self.peer_side) and self.get_peer_model() is not None:
+                queryset = queryset.prefetch_related(choices.RelationshipSideChoices.OPPOSITE[side])
+            prefetches.append(
+                Prefetch(f"{side}_for_associations", queryset=queryset, to_attr=self.get_prefetch_attr(side))
+            )
+        return prefetches
+
+    def get_associations(self, record):
+        """Get the associations of this column's relationship for the given record, preferring prefetched data."""
+        if all(hasattr(record, self.get_prefetch_attr(side)) for side in self.association_sides):
+            return [
+                association
+                for side in self.association_sides
+                for association in getattr(record, self.get_prefetch_attr(side))
+            ]
+
         # Filter the relationship associations by the relationship instance.
         # Since associations accessor returns all the relationship associations regardless of the relationship.
-        value = [v for v in value if v.relationship == self.relationship]
+        value = [v for v in record.associations if v.relationship_id == self.relationship.pk]
         if not self.relationship.symmetric:
             if self.side == choices.RelationshipSideChoices.SIDE_SOURCE:
                 value = [v for v in value if v.source_id == record.id]
             else:
                 value = [v for v in value if v.destination_id == record.id]
+        return value
+
+    def render(self, record):  # pylint: disable=arguments-differ
+        value = self.get_associations(record)
 
         # Handle Symmetric Relationships
         # List `value` could be empty here [] after the filtering from above
@@ -618,7 +677,8 @@ class RelationshipColumn(django_tables2.Column):
         # Handle Relationships on the many side.
         if self.relationship.has_many(self.peer_side):
             v = value[0]
-            meta = type(v.get_peer(record))._meta
+            peer_model = self.get_peer_model()
+            meta = peer_model._meta if peer_model is not None else type(v.get_peer(record))._meta
             name = meta.verbose_name_plural if len(value) > 1 else meta.verbose_name
             return format_html(
                 '<a href="{}?relationship={}&{}_id={}">{} {}</a>',
@@ -632,5 +692,11 @@ class RelationshipColumn(django_tables2.Column):
         # Handle Relationships on the one side.
         else:
             v = value[0]
-            peer = v.get_peer(record)
+            # Avoid get_peer() here as it would dereference the record's own side of the association as well
+            if v.source_id == record.id and v.destination_id != record.id:
+                peer = v.get_destination()
+            elif v.destination_id == record.id and v.source_id != record.id:
+                peer = v.get_source()
+            else:
+                peer = v.get_peer(record)
             return format_html('<a href="{}">{}</a>', peer.get_absolute_url(), peer)
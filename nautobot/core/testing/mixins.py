@@ -16,6 +16,7 @@ from rest_framework.test import APIClient, APIRequestFactory
 from nautobot.core.models import fields as core_fields
 from nautobot.core.testing import utils
 from nautobot.core.utils import permissions
+from nautobot.core.utils.cache import clear_local_cache
 from nautobot.extras import management, models as extras_models
 from nautobot.users import models as users_models
 
@@ -79,6 +80,7 @@ class NautobotTestCaseMixin:
         """
         super().tearDown()
         cache.clear()
+        clear_local_cache()
 
     def prepare_instance(self, instance):
         """
@@ -185,6 +185,66 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=3, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Page through all records by cursor and verify that each is returned once, in order."""
+        Provider.objects.create(name="Cursor Pagination Provider")
+        for sort, expected in (
+            (None, list(Provider.objects.order_by("name", "pk").values_list("pk", flat=True))),
+            ("-name", list(Provider.objects.order_by("-name", "pk").values_list("pk", flat=True))),
+        ):
+            with self.subTest(sort=sort):
+                url = f"{self.url}?cursor=" + (f"&sort={sort}" if sort else "")
+                pks = []
+                while url:
+                    response = self.client.get(url, **self.header)
+                    self.assertHttpStatus(response, 200)
+                    self.assertIsNone(response.data["count"])
+                    self.assertIsNone(response.data["previous"])
+                    self.assertLessEqual(len(response.data["results"]), settings.PAGINATE_COUNT)
+                    pks.extend(result["id"] for result in response.data["results"])
+                    url = response.data["next"]
+                self.assertEqual([str(pk) for pk in expected], [str(pk) for pk in pks])
+
+        response = self.client.get(f"{self.url}?cursor=invalid", **self.header)
+        self.assertHttpStatus(response, 404)
+
+
+class APIStreamingExportTestCase(testing.APITestCase):
+    """Test the streaming of CSV and unpaginated JSON list responses."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse("circuits-api:provider-list")
+
+    def get_content(self, response):
+        if response.streaming:
+            return b"".join(response.streaming_content)
+        return response.content
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], EXPORT_CHUNK_SIZE=2, MAX_PAGE_SIZE=0)
+    def test_streaming_responses(self):
+        for query, parse in (
+            ("?format=csv", lambda content: content.decode("utf-8")),
+            ("?limit=0", json.loads),
+        ):
+            with self.subTest(query=query):
+                response = self.client.get(self.url + query, **self.header)
+                self.assertHttpStatus(response, 200)
+                self.assertFalse(response.streaming)
+                with override_settings(EXPORT_STREAMING_RESPONSES_ENABLED=True):
+                    streaming_response = self.client.get(self.url + query, **self.header)
+                self.assertHttpStatus(streaming_response, 200)
+                self.assertTrue(streaming_response.streaming)
+                self.assertEqual(streaming_response.get("Content-Type"), response.get("Content-Type"))
+                self.assertEqual(parse(self.get_content(streaming_response)), parse(self.get_content(response)))
+
+        # Paginated responses aren't streamed
+        with override_settings(EXPORT_STREAMING_RESPONSES_ENABLED=True):
+            response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertFalse(response.streaming)
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
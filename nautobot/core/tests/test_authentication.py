@@ -4,11 +4,13 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import Q
 from django.test.utils import override_settings
 from django.urls import reverse
 from netaddr import IPNetwork
 
+from nautobot.core.authentication import ObjectPermissionBackend
 from nautobot.core.settings_funcs import sso_auth_enabled
 from nautobot.core.testing import NautobotTestClient, TestCase
 from nautobot.core.utils import lookup
@@ -456,6 +458,57 @@ class ObjectPermissionAPIViewTestCase(TestCase):
         response = self.client.delete(url, format="json", **self.header)
         self.assertEqual(response.status_code, 204)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_object_permissions_cache(self):
+        """Test that a user's permissions are cached across requests, and that changing them invalidates the cache."""
+        url = reverse("ipam-api:prefix-list")
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission",
+            constraints={"locations__name__in": [self.locations[0].name]},
+            actions=["view"],
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Prefix))
+
+        response = self.client.get(url, **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], Prefix.objects.filter(locations__in=[self.locations[0]]).count())
+
+        # The permissions are now loaded from the cache, by another instance of the same user
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertIn("ipam.view_prefix", ObjectPermissionBackend().get_all_permissions(user))
+
+        # Changing the constraints of the permission takes effect immediately
+        obj_perm.constraints = {"locations__name__in": [self.locations[1].name]}
+        obj_perm.save()
+        response = self.client.get(url, **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], Prefix.objects.filter(locations__in=[self.locations[1]]).count())
+
+        # As does removing the user from the permission
+        obj_perm.users.remove(self.user)
+        response = self.client.get(url, **self.header)
+        self.assertEqual(response.status_code, 403)
+
+        # And deactivating the user of the token
+        obj_perm.users.add(self.user)
+        self.assertEqual(self.client.get(url, **self.header).status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get(url, **self.header).status_code, 403)
+
+    def test_object_permissions_cache_invalidated_on_commit(self):
+        """Test that the permissions cache is invalidated again once a change to a permission is committed."""
+        backend = ObjectPermissionBackend()
+        obj_perm = ObjectPermission.objects.create(name="Test permission", actions=["view"])
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Prefix))
+        with self.captureOnCommitCallbacks(execute=True):
+            obj_perm.users.add(self.user)
+            # Simulate a concurrent request refilling the cache from the permissions as they were before the change
+            cache.set(f"{backend.get_object_permissions.cache_key_prefix}.{self.user.pk}", {})
+        self.assertIn("ipam.view_prefix", backend.get_object_permissions(User.objects.get(pk=self.user.pk)))
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
     def test_user_token_constraints(self):
         """
@@ -8,23 +8,29 @@ from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import graphene.types
 from graphene_django.registry import get_global_registry
 from graphene_django.settings import graphene_settings
 from graphql import get_default_backend, GraphQLError
+from graphql.backend import cache as graphql_backend_cache
 from graphql.error.located_error import GraphQLLocatedError
+from promise import Promise
 from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
 from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql.backends import get_graphql_backend, get_query_hash
 from nautobot.core.graphql.generators import (
     generate_list_search_parameters,
     generate_schema_type,
 )
+from nautobot.core.graphql.loaders import RelationshipPeersLoader
 from nautobot.core.graphql.schema import (
     extend_schema_type,
     extend_schema_type_config_context,
@@ -699,6 +705,67 @@ class GraphQLAPIPermissionTest(GraphQLTestCaseBase):
         location_list = list(Location.objects.values_list("name", flat=True))
         self.assertEqual(location_names, location_list)
 
+    def test_graphql_persisted_query_hash(self):
+        """Validate that a query can be sent by its hash once it has been sent along with its hash."""
+        # Make the query unique so that it can't have been persisted by an earlier test run
+        query = f"# {uuid.uuid4()}\n{self.get_racks_query}"
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(query)}}
+
+        response = self.clients[2].post(self.api_url, {"extensions": extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["message"], "PersistedQueryNotFound")
+
+        response = self.clients[2].post(self.api_url, {"query": query, "extensions": extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [item["name"] for item in response.data["data"]["racks"]]
+        self.assertEqual(names, ["Rack 1-1", "Rack 1-2", "Rack 2-1", "Rack 2-2"])
+
+        response = self.clients[2].post(self.api_url, {"extensions": extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [item["name"] for item in response.data["data"]["racks"]]
+        self.assertEqual(names, ["Rack 1-1", "Rack 1-2", "Rack 2-1", "Rack 2-2"])
+
+        wrong_extensions = {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(self.get_racks_query)}}
+        response = self.clients[2].post(self.api_url, {"query": query, "extensions": wrong_extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_graphql_persisted_query_saved_query_id(self):
+        """Validate that a saved GraphQLQuery can be executed by its id, subject to permission to view it."""
+        saved_query = GraphQLQuery.objects.create(name="Persisted Racks", query=self.get_racks_query)
+
+        response = self.clients[2].post(self.api_url, {"id": str(saved_query.pk)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [item["name"] for item in response.data["data"]["racks"]]
+        self.assertEqual(names, ["Rack 1-1", "Rack 1-2", "Rack 2-1", "Rack 2-2"])
+
+        response = self.clients[3].post(self.api_url, {"id": str(saved_query.pk)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["message"], "PersistedQueryNotFound")
+
+        response = self.clients[2].post(self.api_url, {"id": str(uuid.uuid4())}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(GRAPHQL_DOCUMENT_CACHE_SIZE=2)
+    def test_graphql_document_cache(self):
+        """Validate that documents are reused for the same query and evicted when least recently used."""
+        backend = get_graphql_backend()
+        document = backend.document_from_string(graphene_settings.SCHEMA, self.get_racks_query)
+        self.assertIs(backend.document_from_string(graphene_settings.SCHEMA, self.get_racks_query), document)
+
+        backend.document_from_string(graphene_settings.SCHEMA, self.get_racks_params_query)
+        backend.document_from_string(graphene_settings.SCHEMA, self.get_racks_query)
+        backend.document_from_string(graphene_settings.SCHEMA, self.get_locations_racks_query)
+        self.assertEqual(len(backend.cache_map), 2)
+        self.assertIs(backend.document_from_string(graphene_settings.SCHEMA, self.get_racks_query), document)
+        # Query texts aren't memoized by graphql-core outside of the bounded cache
+        self.assertNotIn(self.get_racks_params_query, graphql_backend_cache._cached_queries)
+
+        # Invalid documents are reported as such when executed
+        invalid_document = backend.document_from_string(graphene_settings.SCHEMA, "query { racks { no_such_field } }")
+        result = invalid_document.execute(context_value=None)
+        self.assertTrue(result.invalid)
+        self.assertEqual(len(result.errors), 1)
+
 
 class GraphQLQueryTest(GraphQLTestCaseBase):
     """Execute various GraphQL queries and verify their correct responses."""
@@ -1224,6 +1291,47 @@ query {
         self.assertEqual(custom_field_data[0], {})
         self.assertEqual(result.data["device"]["_custom_field_data"], {})
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_batched(self):
+        """The config contexts of a list of devices should be loaded with a single query."""
+        query = "query { devices { name config_context } }"
+        with CaptureQueriesContext(connection) as queries:
+            result = self.execute_query(query)
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["devices"]), 4)
+        for item in result.data["devices"]:
+            self.assertEqual(item["config_context"], {"a": 123, "b": 456, "c": 777})
+        self.assertEqual(len([query for query in queries if "extras_configcontext" in query["sql"]]), 1)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_nested_filter_batched(self):
+        """The filtered interfaces of a list of devices should be loaded with a single query."""
+        query = 'query { devices { name interfaces(name: "Int1") { name device { name } } } }'
+        with CaptureQueriesContext(connection) as queries:
+            result = self.execute_query(query)
+        self.assertIsNone(result.errors)
+        for item in result.data["devices"]:
+            expected = Interface.objects.filter(device__name=item["name"], name="Int1").count()
+            self.assertEqual(len(item["interfaces"]), expected)
+            for interface in item["interfaces"]:
+                self.assertEqual(interface["device"]["name"], item["name"])
+        self.assertEqual(len([query for query in queries if "dcim_interface" in query["sql"]]), 1)
+
+    def test_relationship_peers_loader(self):
+        """RelationshipPeersLoader should load the peers of many objects with one query for each of associations and peers."""
+        devices = [self.device1, self.device2, self.device3]
+        loader = RelationshipPeersLoader(self.relationship_m2ms_1, "source", Device, None)
+        with self.assertNumQueries(2):
+            peers = Promise.all([loader.load(device.pk) for device in devices]).get()
+        self.assertEqual({peer.pk for peer in peers[0]}, {self.device2.pk, self.device3.pk})
+        self.assertEqual({peer.pk for peer in peers[1]}, {self.device1.pk, self.device3.pk})
+        self.assertEqual({peer.pk for peer in peers[2]}, {self.device1.pk, self.device2.pk})
+
+        loader = RelationshipPeersLoader(self.relationship_o2o_1, "source", VirtualMachine, None)
+        with self.assertNumQueries(2):
+            peers = Promise.all([loader.load(device.pk) for device in devices]).get()
+        self.assertEqual(peers, [self.virtualmachine, None, None])
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_console_ports_cable_peer(self):
         """Test querying console port terminations for their cable peers"""
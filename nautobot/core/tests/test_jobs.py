@@ -1,6 +1,7 @@
 from datetime import timedelta
 from pathlib import Path
 
+from constance.test import override_config
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.files.base import ContentFile
@@ -9,7 +10,7 @@ import yaml
 
 from nautobot.core.jobs.cleanup import CleanupTypes
 from nautobot.core.testing import create_job_result_and_run_job, TransactionTestCase
-from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
+from nautobot.dcim.models import Device, DeviceType, Interface, Location, LocationType, Manufacturer
 from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices
 from nautobot.extras.factory import JobResultFactory, ObjectChangeFactory
 from nautobot.extras.models import (
@@ -85,6 +86,18 @@ class ExportObjectListTest(TransactionTestCase):
         # May be more than one line per Status if they have newlines in their description strings
         self.assertGreaterEqual(len(csv_data.split("\n")), Status.objects.count() + 1, csv_data)  # +1 for CSV header
 
+    def test_export_not_limited_by_job_create_file_max_size(self):
+        """The export shouldn't be limited by JOB_CREATE_FILE_MAX_SIZE, which applies to files created by user Jobs."""
+        with override_config(JOB_CREATE_FILE_MAX_SIZE=1):
+            job_result = create_job_result_and_run_job(
+                "nautobot.core.jobs",
+                "ExportObjectList",
+                content_type=ContentType.objects.get_for_model(Status).pk,
+            )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS, job_result.traceback)
+        csv_data = job_result.files.first().file.read().decode("utf-8")
+        self.assertGreaterEqual(len(csv_data.split("\n")), Status.objects.count() + 1, csv_data)  # +1 for CSV header
+
     def test_export_all_via_export_template(self):
         """When an export-template is specified, it should be used."""
         et = ExportTemplate.objects.create(
@@ -421,6 +434,114 @@ class ImportObjectsTestCase(TransactionTestCase):
 
         self.assertEqual(associations_job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
 
+    def test_csv_import_bulk_create(self):
+        """Objects supporting bulk creation should be created in bulk, with change logging, and in row order."""
+        location_type = LocationType.objects.create(name="Bulk Import Location Type")
+        location_type.content_types.add(ContentType.objects.get_for_model(Device))
+        location = Location.objects.create(
+            name="Bulk Import Location",
+            location_type=location_type,
+            status=Status.objects.get_for_model(Location).first(),
+        )
+        manufacturer = Manufacturer.objects.create(name="Bulk Import Manufacturer")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Bulk Import Device Type")
+        device_role = Role.objects.create(name="Bulk Import Device Role")
+        device_role.content_types.add(ContentType.objects.get_for_model(Device))
+        device = Device.objects.create(
+            name="Bulk Import Device",
+            location=location,
+            device_type=device_type,
+            role=device_role,
+            status=Status.objects.get_for_model(Device).first(),
+        )
+        interface_status = Status.objects.get_for_model(Interface).first()
+        csv_data = "\n".join(
+            ["device,name,type,status"]
+            + [f"{device.pk},eth{i},1000base-t,{interface_status.name}" for i in range(1, 6)]
+        )
+
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Interface).pk,
+            csv_data=csv_data,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(5, Interface.objects.filter(device=device).count())
+        log_successes = JobLogEntry.objects.filter(
+            job_result=job_result, log_level=LogLevelChoices.LOG_INFO, message__icontains="created"
+        )
+        for i in range(5):
+            self.assertEqual(log_successes[i].message, f'Row {i + 1}: Created record "eth{i + 1}"')
+        self.assertEqual(
+            5,
+            ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(Interface),
+                changed_object_id__in=Interface.objects.filter(device=device).values_list("pk", flat=True),
+            ).count(),
+        )
+
+    def test_csv_import_rows_referencing_earlier_rows(self):
+        """Rows should be able to reference objects created by earlier rows of the same import."""
+        parent_location_type = LocationType.objects.create(name="Import Parent Location Type")
+        LocationType.objects.create(name="Import Child Location Type", parent=parent_location_type)
+        csv_data = "\n".join(
+            [
+                "location_type__name,name,status__name,parent__name",
+                "Import Parent Location Type,Import Parent Location,Active,",
+                "Import Child Location Type,Import Child Location,Active,Import Parent Location",
+            ]
+        )
+
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Location).pk,
+            csv_data=csv_data,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS, job_result.traceback)
+        self.assertEqual(Location.objects.get(name="Import Child Location").parent.name, "Import Parent Location")
+
+    def test_csv_import_duplicate_rows(self):
+        """A row duplicating an earlier row of the same import should fail, without failing the other rows."""
+        location_type = LocationType.objects.create(name="Duplicate Import Location Type")
+        location_type.content_types.add(ContentType.objects.get_for_model(Device))
+        location = Location.objects.create(
+            name="Duplicate Import Location",
+            location_type=location_type,
+            status=Status.objects.get_for_model(Location).first(),
+        )
+        manufacturer = Manufacturer.objects.create(name="Duplicate Import Manufacturer")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Duplicate Import Device Type")
+        device_role = Role.objects.create(name="Duplicate Import Device Role")
+        device_role.content_types.add(ContentType.objects.get_for_model(Device))
+        device = Device.objects.create(
+            name="Duplicate Import Device",
+            location=location,
+            device_type=device_type,
+            role=device_role,
+            status=Status.objects.get_for_model(Device).first(),
+        )
+        interface_status = Status.objects.get_for_model(Interface).first()
+        csv_data = "\n".join(
+            ["device,name,type,status"]
+            + [f"{device.pk},{name},1000base-t,{interface_status.name}" for name in ("eth1", "eth1", "eth2")]
+        )
+
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Interface).pk,
+            csv_data=csv_data,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        self.assertNotIn("IntegrityError", job_result.traceback or "")
+        log_errors = JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertTrue(log_errors[0].message.startswith("Row 2: "), log_errors[0].message)
+        self.assertEqual(
+            ["eth1", "eth2"], sorted(Interface.objects.filter(device=device).values_list("name", flat=True))
+        )
+
 
 class LogsCleanupTestCase(TransactionTestCase):
     """
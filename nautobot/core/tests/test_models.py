@@ -1,18 +1,28 @@
+import json
 import time
 from unittest import skip
 from unittest.mock import patch
 import uuid
 
+from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.serializers import serialize
 from django.test import override_settings
 from django.test.utils import isolate_apps
 
 from nautobot.core.models import BaseModel
-from nautobot.core.models.utils import construct_composite_key, construct_natural_slug, deconstruct_composite_key
+from nautobot.core.models.utils import (
+    construct_composite_key,
+    construct_natural_slug,
+    deconstruct_composite_key,
+    serialize_object,
+    serialize_object_v2,
+)
 from nautobot.core.testing import TestCase
-from nautobot.dcim.models import DeviceType, Location, LocationType, Manufacturer
-from nautobot.extras.models import Status
+from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
+from nautobot.extras.models import ConfigContext, CustomField, Status
+from nautobot.ipam.models import Prefix
 
 
 @isolate_apps("nautobot.core.tests")
@@ -59,6 +69,26 @@ class ModelUtilsTestCase(TestCase):
                 natural_slug = construct_natural_slug(values, pk=pk)
                 self.assertEqual(natural_slug, expected_natural_slug)
 
+    def test_serialize_object(self):
+        """Test that `serialize_object()` matches the output of Django's JSON serializer."""
+        for model in (ConfigContext, Device, Location, Prefix, Status):
+            for obj in model.objects.all()[:5]:
+                with self.subTest(model=model, obj=obj):
+                    expected = json.loads(serialize("json", [obj]))[0]["fields"]
+                    data = serialize_object(obj)
+                    if "_custom_field_data" in expected:
+                        self.assertEqual(data.pop("custom_fields"), expected.pop("_custom_field_data"))
+                    data.pop("tags", None)
+                    self.assertEqual(data, {key: value for key, value in expected.items() if not key.startswith("_")})
+
+    def test_serialize_object_v2_reflects_new_custom_fields(self):
+        """Test that `serialize_object_v2()` includes custom fields created after an object of the model was serialized."""
+        location = Location.objects.first()
+        self.assertNotIn("new_field", serialize_object_v2(location)["custom_fields"])
+        custom_field = CustomField.objects.create(label="New Field", key="new_field")
+        custom_field.content_types.add(ContentType.objects.get_for_model(Location))
+        self.assertIn("new_field", serialize_object_v2(location)["custom_fields"])
+
 
 class NaturalKeyTestCase(BaseModelTest):
     """Test the various natural-key APIs for a few representative models."""
@@ -1,3 +1,4 @@
+from unittest import mock
 import uuid
 
 from django import forms as django_forms
@@ -7,6 +8,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import Q
 from django.http import QueryDict
+from django.template import engines
 
 from nautobot.circuits import models as circuits_models
 from nautobot.core import exceptions, forms, settings_funcs
@@ -758,6 +760,23 @@ class MergeDictsWithoutCollisionTest(TestCase):
         self.assertEqual(str(err.exception), 'Conflicting values for key "a": (1, 2)')
 
 
+class RenderJinja2Test(TestCase):
+    """Test the render_jinja2() data utility function."""
+
+    def test_render_jinja2(self):
+        self.assertEqual(data_utils.render_jinja2("{{ obj }} {{ obj | upper }}", {"obj": "abc"}), "abc ABC")
+
+    def test_render_jinja2_caches_compiled_templates(self):
+        template_code = "Hello {{ name }}!"
+        data_utils._compile_jinja2.cache_clear()
+        with mock.patch.object(engines["jinja"], "from_string", wraps=engines["jinja"].from_string) as mock_compile:
+            self.assertEqual(data_utils.render_jinja2(template_code, {"name": "world"}), "Hello world!")
+            self.assertEqual(data_utils.render_jinja2(template_code, {"name": "there"}), "Hello there!")
+            self.assertEqual(data_utils.render_jinja2("Bye {{ name }}!", {"name": "world"}), "Bye world!")
+        # Each distinct template is only compiled once
+        self.assertEqual(mock_compile.call_count, 2)
+
+
 class NavigationRelatedUtils(TestCase):
     def get_all_new_ui_ready_route(self):
         ui_ready_routes = [
@@ -0,0 +1,97 @@
+"""
+Helpers for values stored in the Django cache that are also kept in an in-process ("local") cache.
+
+Some values, such as the CustomFields applicable to a given model, are looked up many times for each request, but
+change only rarely. Each lookup of such a value in the Django cache (typically Redis) costs a network round trip. If
+`settings.LOCAL_CACHE_TIMEOUT` is set, values fetched with `get_cached_value()` are also kept in the memory of the
+current process, and reused for up to that many seconds without contacting the Django cache at all.
+
+Values are grouped by the prefix of their cache keys, and each group has a version token stored in the Django cache.
+`invalidate_cached_values()` deletes all values of a group from the Django cache, discards them from the local cache of
+the current process, and changes the group's version token. Other processes discard their local copies of the group's
+values once they next check the version token, i.e. at most `LOCAL_CACHE_TIMEOUT` seconds later.
+"""
+
+import pickle
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+_local_cache = {}  # {prefix: {cache_key: (version, pickled_value)}}
+_local_versions = {}  # {prefix: (version, time of the last check of the version)}
+_lock = threading.Lock()
+
+
+def _version_cache_key(prefix):
+    return f"{prefix}.__version__"
+
+
+def _get_version(prefix):
+    """Return the current version token of the given group of cached values, checking it at most every timeout."""
+    now = time.monotonic()
+    with _lock:
+        version, checked_at = _local_versions.get(prefix, (None, None))
+    if checked_at is not None and now - checked_at < settings.LOCAL_CACHE_TIMEOUT:
+        return version
+
+    latest_version = cache.get(_version_cache_key(prefix))
+    if latest_version is None:
+        cache.add(_version_cache_key(prefix), uuid.uuid4().hex, timeout=None)
+        latest_version = cache.get(_version_cache_key(prefix))
+    with _lock:
+        if latest_version != version:
+            _local_cache.pop(prefix, None)
+        _local_versions[prefix] = (latest_version, now)
+    return latest_version
+
+
+def get_cached_value(prefix, cache_key, get_value):
+    """
+    Return the value stored in the cache under `cache_key`, or compute and store it with `get_value()` if not present.
+
+    Args:
+        prefix (str): Prefix of `cache_key`, identifying the group of values to which it belongs
+        cache_key (str): Key of the value in the cache
+        get_value (callable): Function returning the value, called only if the value isn't cached yet
+    """
+    if not settings.LOCAL_CACHE_TIMEOUT:
+        value = cache.get(cache_key)
+        if value is None:
+            value = get_value()
+            cache.set(cache_key, value)
+        return value
+
+    version = _get_version(prefix)
+    with _lock:
+        entry = _local_cache.get(prefix, {}).get(cache_key)
+    if entry is not None and entry[0] == version:
+        # Each caller gets its own copy of the value, just as when it is loaded from the Django cache
+        return pickle.loads(entry[1])  # noqa: S301  # suspicious-pickle-usage -- we pickled it ourselves
+
+    value = cache.get(cache_key)
+    if value is None:
+        value = get_value()
+        cache.set(cache_key, value)
+    pickled_value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    with _lock:
+        _local_cache.setdefault(prefix, {})[cache_key] = (version, pickled_value)
+    return pickle.loads(pickled_value)  # noqa: S301  # suspicious-pickle-usage -- we pickled it ourselves
+
+
+def invalidate_cached_values(prefix):
+    """Delete all values whose cache keys start with the given prefix, from the Django cache and local caches."""
+    cache.delete_pattern(f"{prefix}.*")
+    cache.set(_version_cache_key(prefix), uuid.uuid4().hex, timeout=None)
+    with _lock:
+        _local_cache.pop(prefix, None)
+        _local_versions.pop(prefix, None)
+
+
+def clear_local_cache():
+    """Discard all values from the local cache of the current process."""
+    with _lock:
+        _local_cache.clear()
+        _local_versions.clear()
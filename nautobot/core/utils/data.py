@@ -1,5 +1,6 @@
 from collections import namedtuple, OrderedDict
 from decimal import Decimal
+from functools import lru_cache
 import uuid
 
 from django.core import validators
@@ -10,6 +11,9 @@ from nautobot.dcim import choices  # TODO move dcim.choices.CableLengthUnitChoic
 # Setup UtilizationData named tuple for use by multiple methods
 UtilizationData = namedtuple("UtilizationData", ["numerator", "denominator"])
 
+# Maximum number of compiled templates kept in memory by `render_jinja2()`
+JINJA2_TEMPLATE_CACHE_SIZE = 1024
+
 
 def deepmerge(original, new):
     """
@@ -92,12 +96,19 @@ def merge_dicts_without_collision(d1, d2):
     return {**d1, **d2}
 
 
+@lru_cache(maxsize=JINJA2_TEMPLATE_CACHE_SIZE)
+def _compile_jinja2(rendering_engine, template_code):
+    return rendering_engine.from_string(template_code)
+
+
 def render_jinja2(template_code, context):
     """
     Render a Jinja2 template with the provided context. Return the rendered content.
+
+    Compiled templates are cached by their source code, so rendering the same template repeatedly (such as a computed
+    field for each row of a table) only parses and compiles it once.
     """
-    rendering_engine = engines["jinja"]
-    template = rendering_engine.from_string(template_code)
+    template = _compile_jinja2(engines["jinja"], template_code)
     # For reasons unknown to me, django-jinja2 `template.render()` implicitly calls `mark_safe()` on the rendered text.
     # This is a security risk in general, especially so in our case because we're often using this function to render
     # a user-provided template and don't want to open ourselves up to script injection or similar issues.
@@ -97,3 +97,28 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+def get_permission_filter(user, permission):
+    """
+    Return the filter matching the objects on which the given user is granted the given permission by ObjectPermissions.
+
+    The filter is compiled from the user's permission constraints only once for each user instance (i.e. each request).
+
+    Args:
+        user (User): User instance, which must have been granted the permission for *some* objects.
+        permission (str): Permission name, e.g. "dcim.view_location".
+
+    Returns:
+        (Q): Filter matching the permitted objects, which is empty if all objects are permitted.
+    """
+    if not hasattr(user, "_object_perm_filter_cache"):
+        user._object_perm_filter_cache = {}
+    if permission not in user._object_perm_filter_cache:
+        tokens = {
+            "$user": user,
+        }
+        user._object_perm_filter_cache[permission] = qs_filter_from_constraints(
+            user._object_perm_cache[permission], tokens
+        )
+    return user._object_perm_filter_cache[permission]
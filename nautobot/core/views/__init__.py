@@ -41,6 +41,7 @@ from rest_framework.views import APIView
 from nautobot.core.celery import app
 from nautobot.core.constants import SEARCH_MAX_RESULTS
 from nautobot.core.forms import SearchForm
+from nautobot.core.graphql.backends import get_graphql_backend
 from nautobot.core.releases import get_latest_release
 from nautobot.core.utils.lookup import get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
@@ -379,6 +380,9 @@ def csrf_failure(request, reason="", template_name="403_csrf_failure.html"):
 
 
 class CustomGraphQLView(LoginRequiredMixin, GraphQLView):
+    def get_backend(self, request):
+        return get_graphql_backend()
+
     def render_graphiql(self, request, **data):
         query_name = request.GET.get("name")
         if query_name:
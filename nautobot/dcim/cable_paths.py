@@ -0,0 +1,271 @@
+"""
+Bulk tracing of CablePaths from in-memory adjacency maps.
+
+`CablePath.from_origin()` follows each path hop by hop through the ORM, which costs several queries per hop. This is
+fine for retracing the few paths affected by a single change, but far too slow for (re)building the paths of an entire
+network. Instead, `CablePathGraph` loads every Cable, front/rear port mapping, and Circuit Termination pairing once,
+after which any number of origins can be traced without further queries, optionally in parallel by a pool of worker
+processes. `retrace_cable_paths()` then writes the resulting CablePaths back with `bulk_create()`.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import connections, transaction
+from django.db.models import OuterRef, Subquery
+
+from nautobot.dcim.utils import compile_path_node
+
+# Number of origins traced per task when tracing in parallel
+TRACE_CHUNK_SIZE = 1000
+
+# Graph used by worker processes; inherited from the parent process when the pool is forked
+_worker_graph = None
+
+
+class CablePathGraph:
+    """
+    In-memory representation of all cabling, equivalent for tracing purposes to the database state it was loaded from.
+
+    All nodes are represented as `(content_type_id, pk)` tuples. The graph consists only of builtin types, so it is
+    cheap to share with worker processes.
+    """
+
+    def __init__(self, cable_type_id, front_port_type_id, rear_port_type_id, circuit_termination_type_id):
+        self.cable_type_id = cable_type_id
+        self.front_port_type_id = front_port_type_id
+        self.rear_port_type_id = rear_port_type_id
+        self.circuit_termination_type_id = circuit_termination_type_id
+        self.links = {}  # {node: (cable_pk, cable_is_connected, peer_node)}
+        self.front_ports = {}  # {front_port_pk: (rear_port_pk, rear_port_position)}
+        self.front_ports_by_position = {}  # {(rear_port_pk, rear_port_position): front_port_pk}
+        self.rear_port_positions = {}  # {rear_port_pk: positions}
+        self.circuit_termination_peers = {}  # {circuit_termination_pk: peer_circuit_termination_pk}
+
+    @classmethod
+    def from_database(cls):
+        from nautobot.circuits.models import CircuitTermination  # avoid circular import
+        from nautobot.dcim.models import Cable, FrontPort, RearPort
+
+        graph = cls(
+            *(ContentType.objects.get_for_model(model).pk for model in (Cable, FrontPort, RearPort, CircuitTermination))
+        )
+
+        connected_status = Cable.STATUS_CONNECTED
+        for cable_pk, status_pk, a_type_id, a_pk, b_type_id, b_pk in Cable.objects.values_list(
+            "pk", "status", "termination_a_type", "termination_a_id", "termination_b_type", "termination_b_id"
+        ).iterator():
+            is_connected = connected_status is not None and status_pk == connected_status.pk
+            graph.links[(a_type_id, a_pk)] = (cable_pk, is_connected, (b_type_id, b_pk))
+            graph.links[(b_type_id, b_pk)] = (cable_pk, is_connected, (a_type_id, a_pk))
+
+        for front_port_pk, rear_port_pk, position in FrontPort.objects.values_list(
+            "pk", "rear_port", "rear_port_position"
+        ).iterator():
+            graph.front_ports[front_port_pk] = (rear_port_pk, position)
+            graph.front_ports_by_position[(rear_port_pk, position)] = front_port_pk
+        graph.rear_port_positions = dict(RearPort.objects.values_list("pk", "positions").iterator())
+
+        circuit_terminations = {}
+        for pk, circuit_pk, term_side in CircuitTermination.objects.values_list(
+            "pk", "circuit", "term_side"
+        ).iterator():
+            circuit_terminations[(circuit_pk, term_side)] = pk
+        for (circuit_pk, term_side), pk in circuit_terminations.items():
+            peer_pk = circuit_terminations.get((circuit_pk, "Z" if term_side == "A" else "A"))
+            if peer_pk is not None:
+                graph.circuit_termination_peers[pk] = peer_pk
+
+        return graph
+
+    def trace(self, origin):
+        """
+        Trace the path from the given origin node, with the same semantics as `CablePath.from_origin()`.
+
+        Returns a tuple of (destination node or None, path, is_active, is_split), or None if the origin isn't cabled.
+        Raises a `ValidationError` if a loop is detected in the path.
+        """
+        if origin not in self.links:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = origin
+        visited_nodes = set()
+        while node in self.links:
+            if node[1] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node[1])
+            cable_pk, is_connected, peer = self.links[node]
+            if not is_connected:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_type_id, cable_pk))
+            peer_type_id, peer_pk = peer
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_type_id == self.front_port_type_id:
+                path.append(compile_path_node(*peer))
+                rear_port_pk, rear_port_position = self.front_ports[peer_pk]
+                node = (self.rear_port_type_id, rear_port_pk)
+                if self.rear_port_positions[rear_port_pk] > 1:
+                    position_stack.append(rear_port_position)
+                path.append(compile_path_node(*node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_type_id == self.rear_port_type_id:
+                path.append(compile_path_node(*peer))
+
+                # Determine the peer FrontPort's position
+                if self.rear_port_positions[peer_pk] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_pk = self.front_ports_by_position.get((peer_pk, position))
+                if front_port_pk is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self.front_port_type_id, front_port_pk)
+                path.append(compile_path_node(*node))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer_type_id == self.circuit_termination_type_id:
+                peer_termination_pk = self.circuit_termination_peers.get(peer_pk)
+                # A Circuit Termination does not require a peer.
+                if peer_termination_pk is None:
+                    destination = peer
+                    break
+                node = (self.circuit_termination_type_id, peer_termination_pk)
+                path.append(compile_path_node(*peer))
+                path.append(compile_path_node(*node))
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer
+                break
+
+        if destination is None:
+            is_active = False
+
+        return destination, path, is_active, is_split
+
+    def trace_many(self, origins):
+        """
+        Trace each of the given origin nodes, returning a list of `(origin, result)` tuples.
+
+        `result` is as returned by `trace()`, or the `ValidationError` raised by it.
+        """
+        results = []
+        for origin in origins:
+            try:
+                results.append((origin, self.trace(origin)))
+            except ValidationError as e:
+                results.append((origin, e))
+        return results
+
+
+def _trace_chunk(origins):
+    return _worker_graph.trace_many(origins)
+
+
+def trace_cable_paths(graph, origins, workers=1):
+    """
+    Trace the given origin nodes against `graph`, yielding `(origin, result)` tuples as per `CablePathGraph.trace_many()`.
+
+    If `workers` is greater than 1, origins are traced in parallel by a pool of forked worker processes.
+    """
+    global _worker_graph
+    origins = list(origins)
+    chunks = [origins[i : i + TRACE_CHUNK_SIZE] for i in range(0, len(origins), TRACE_CHUNK_SIZE)]
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from graph.trace_many(chunk)
+        return
+
+    # Forked workers must not share (and on exit, close) the parent process's database connections
+    connections.close_all()
+    _worker_graph = graph
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            for results in executor.map(_trace_chunk, chunks):
+                yield from results
+    finally:
+        _worker_graph = None
+
+
+def retrace_cable_paths(origins, graph=None, workers=1, batch_size=1000):
+    """
+    Trace the given origin nodes and replace their CablePaths (if any) with the results.
+
+    Args:
+        origins (iterable): `(content_type_id, pk)` tuples of the path endpoints to retrace
+        graph (CablePathGraph): Graph to trace against; loaded from the database if not specified
+        workers (int): Number of processes to trace with
+        batch_size (int): Number of CablePaths to create per query
+
+    Returns:
+        (tuple): the number of CablePaths created, and a dict of `{origin: ValidationError}` for any origins that failed
+    """
+    from nautobot.dcim.models import CablePath  # avoid circular import
+
+    if graph is None:
+        graph = CablePathGraph.from_database()
+    origins = list(origins)
+    traced = list(trace_cable_paths(graph, origins, workers=workers))
+
+    errors = {}
+    cable_paths = []
+    for origin, result in traced:
+        if isinstance(result, ValidationError):
+            errors[origin] = result
+        elif result is not None:
+            destination, path, is_active, is_split = result
+            cable_paths.append(
+                CablePath(
+                    origin_type_id=origin[0],
+                    origin_id=origin[1],
+                    destination_type_id=destination[0] if destination else None,
+                    destination_id=destination[1] if destination else None,
+                    path=path,
+                    is_active=is_active,
+                    is_split=is_split,
+                )
+            )
+
+    origins_by_type = {}
+    for origin_type_id, origin_pk in origins:
+        origins_by_type.setdefault(origin_type_id, []).append(origin_pk)
+
+    with transaction.atomic():
+        for origin_type_id, origin_pks in origins_by_type.items():
+            for i in range(0, len(origin_pks), batch_size):
+                CablePath.objects.filter(
+                    origin_type_id=origin_type_id, origin_id__in=origin_pks[i : i + batch_size]
+                ).delete()
+        CablePath.objects.bulk_create(cable_paths, batch_size=batch_size)
+
+        # Record a direct reference to each new CablePath on its originating object
+        for origin_type_id, origin_pks in origins_by_type.items():
+            model = ContentType.objects.get_for_id(origin_type_id).model_class()
+            for i in range(0, len(origin_pks), batch_size):
+                model.objects.filter(pk__in=origin_pks[i : i + batch_size]).update(
+                    _path=Subquery(
+                        CablePath.objects.filter(origin_type_id=origin_type_id, origin_id=OuterRef("pk")).values("pk")[
+                            :1
+                        ]
+                    )
+                )
+
+    return len(cable_paths), errors
@@ -1,9 +1,17 @@
-from django.core.management.base import BaseCommand
+import os
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
 from django.db import connection
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.cable_paths import CablePathGraph, retrace_cable_paths
 from nautobot.dcim.models import (
+    Cable,
     CablePath,
     ConsolePort,
     ConsoleServerPort,
@@ -12,7 +20,10 @@ from nautobot.dcim.models import (
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
+from nautobot.dcim.utils import compile_path_node
+
+# Time at which the last run of this command started, used by default as the `--since` of incremental runs
+LAST_RUN_CACHE_KEY = "nautobot.dcim.trace_paths.last_run"
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -41,15 +52,33 @@ class Command(BaseCommand):
             dest="no_input",
             help="Do not prompt user for any input/confirmation",
         )
-
-    def draw_progress_bar(self, percentage):
-        """
-        Draw a simple progress bar 20 increments wide illustrating the specified percentage.
-        """
-        bar_size = int(percentage / 5)
-        self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending="")
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            dest="incremental",
+            help="Also retrace any existing cable paths involving cables created or modified since the last run",
+        )
+        parser.add_argument(
+            "--since",
+            dest="since",
+            help="With --incremental, retrace paths involving cables modified since this ISO 8601 date/time instead",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes to trace cable paths with (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of cable paths to create per query (default: %(default)s)",
+        )
 
     def handle(self, *model_names, **options):
+        start_time = timezone.now()
+
         # If --force was passed, first delete all existing CablePaths
         if options["force"]:
             cable_paths = CablePath.objects.all()
@@ -78,22 +107,74 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
-        # Retrace paths
+        # Determine which paths to retrace
+        origins = []
         for model in ENDPOINT_MODELS:
-            origins = model.objects.filter(cable__isnull=False)
+            model_origins = model.objects.filter(cable__isnull=False)
             if not options["force"]:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
-            if not origins_count:
+                model_origins = model_origins.filter(_path__isnull=True)
+            origin_type_id = ContentType.objects.get_for_model(model).pk
+            model_origins = [(origin_type_id, pk) for pk in model_origins.values_list("pk", flat=True).iterator()]
+            if not model_origins:
                 self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
                 continue
-            self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
+            self.stdout.write(f"Found {len(model_origins)} cabled {model._meta.verbose_name_plural} to trace")
+            origins.extend(model_origins)
+        if options["incremental"] and not options["force"]:
+            changed_origins = self.get_changed_origins(options["since"]).difference(origins)
+            self.stdout.write(f"Found {len(changed_origins)} existing paths involving changed cables to retrace")
+            origins.extend(changed_origins)
+
+        # Retrace paths
+        if origins:
+            self.stdout.write("Loading cables...")
+            graph = CablePathGraph.from_database()
+            self.stdout.write(f"Retracing {len(origins)} paths using {options['workers']} worker process(es)...")
+            created_count, errors = retrace_cable_paths(
+                origins, graph=graph, workers=options["workers"], batch_size=options["batch_size"]
+            )
+            for (origin_type_id, origin_pk), error in errors.items():
+                model = ContentType.objects.get_for_id(origin_type_id).model_class()
+                self.stdout.write(
+                    self.style.WARNING(f"  Unable to trace {model._meta.verbose_name} {origin_pk}: {error.messages[0]}")
+                )
+            self.stdout.write(self.style.SUCCESS(f"  Retraced {created_count} paths"))
 
+        cache.set(LAST_RUN_CACHE_KEY, start_time.isoformat(), timeout=None)
         self.stdout.write(self.style.SUCCESS("Finished."))
+
+    def get_changed_origins(self, since):
+        """
+        Return the origins of all existing CablePaths that include a Cable modified since the given time, or either of
+        its terminations.
+        """
+        if since is None:
+            since = cache.get(LAST_RUN_CACHE_KEY)
+            if since is None:
+                raise CommandError("No previous run of this command is recorded; please specify --since")
+        since_datetime = parse_datetime(since)
+        if since_datetime is None:
+            raise CommandError(f"Invalid --since value {since!r}; expected an ISO 8601 date/time")
+        if timezone.is_naive(since_datetime):
+            since_datetime = timezone.make_aware(since_datetime)
+
+        cable_type_id = ContentType.objects.get_for_model(Cable).pk
+        changed_nodes = set()
+        for cable_pk, a_type_id, a_pk, b_type_id, b_pk in (
+            Cable.objects.filter(last_updated__gte=since_datetime)
+            .values_list("pk", "termination_a_type", "termination_a_id", "termination_b_type", "termination_b_id")
+            .iterator()
+        ):
+            changed_nodes.add(compile_path_node(cable_type_id, cable_pk))
+            changed_nodes.add(compile_path_node(a_type_id, a_pk))
+            changed_nodes.add(compile_path_node(b_type_id, b_pk))
+        if not changed_nodes:
+            return set()
+
+        return {
+            (origin_type_id, origin_pk)
+            for origin_type_id, origin_pk, path in CablePath.objects.values_list(
+                "origin_type", "origin_id", "path"
+            ).iterator()
+            if changed_nodes.intersection(path)
+        }
@@ -120,6 +120,8 @@ class ModularComponentModel(ComponentModel):
     )
 
     natural_key_field_names = ["device", "module", "name"]
+    # Note that Interface.save() only has side effects for existing interfaces or those missing a status
+    supports_bulk_create = True
 
     class Meta:
         abstract = True
@@ -1,8 +1,14 @@
+from datetime import timedelta
+from io import StringIO
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils.timezone import now
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.dcim.cable_paths import CablePathGraph, retrace_cable_paths
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -33,6 +39,7 @@ class CablePathTestCase(TestCase):
         1XX: Test direct connections between different endpoint types
         2XX: Test different cable topologies
         3XX: Test responses to changes in existing objects
+        4XX: Test bulk tracing of paths
     """
 
     @classmethod
@@ -1494,3 +1501,105 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def _create_bulk_tracing_topology(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C2-- [RP2] [FP2:1] --C3-- [IF3]
+        [IF2] --C4-- [FP1:2]                    [FP2:2]
+        [IF4] --C5-- [CT1A] [CT1Z] --C6-- [IF5]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 6)
+        ]
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=2)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=2)
+        frontports = [
+            FrontPort.objects.create(
+                device=self.device, name=f"Front Port {i}:{position}", rear_port=rear_port, rear_port_position=position
+            )
+            for i, rear_port in ((1, rearport1), (2, rearport2))
+            for position in (1, 2)
+        ]
+        circuittermination1 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="A"
+        )
+        circuittermination2 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="Z"
+        )
+        for termination_a, termination_b, status in (
+            (interfaces[0], frontports[0], self.status),
+            (rearport1, rearport2, self.status_planned),
+            (frontports[2], interfaces[2], self.status),
+            (interfaces[1], frontports[1], self.status),
+            (interfaces[3], circuittermination1, self.status),
+            (circuittermination2, interfaces[4], self.status),
+        ):
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=status)
+        return interfaces
+
+    def _get_cable_paths(self):
+        return {
+            (cp.origin_type_id, cp.origin_id): (
+                cp.destination_type_id,
+                cp.destination_id,
+                cp.path,
+                cp.is_active,
+                cp.is_split,
+            )
+            for cp in CablePath.objects.all()
+        }
+
+    def test_401_trace_matches_from_origin(self):
+        interfaces = self._create_bulk_tracing_topology()
+        graph = CablePathGraph.from_database()
+        for origin in [*interfaces, *CircuitTermination.objects.filter(circuit=self.circuit)]:
+            with self.subTest(origin=origin):
+                expected = CablePath.from_origin(origin)
+                result = graph.trace((ContentType.objects.get_for_model(origin).pk, origin.pk))
+                destination, path, is_active, is_split = result
+                self.assertEqual(
+                    destination,
+                    (expected.destination_type_id, expected.destination_id) if expected.destination else None,
+                )
+                self.assertEqual(path, expected.path)
+                self.assertEqual(is_active, expected.is_active)
+                self.assertEqual(is_split, expected.is_split)
+
+    def test_402_retrace_cable_paths(self):
+        interfaces = self._create_bulk_tracing_topology()
+        expected = self._get_cable_paths()
+        origins = list(expected)
+        CablePath.objects.all().delete()
+
+        created_count, errors = retrace_cable_paths(origins, batch_size=2)
+        self.assertEqual(created_count, len(expected))
+        self.assertEqual(errors, {})
+        self.assertEqual(self._get_cable_paths(), expected)
+        for interface in interfaces:
+            interface.refresh_from_db()
+            self.assertPathIsSet(interface, interface._path)
+
+        # Retracing existing paths replaces them
+        created_count, errors = retrace_cable_paths(origins)
+        self.assertEqual(created_count, len(expected))
+        self.assertEqual(self._get_cable_paths(), expected)
+
+    def test_403_trace_paths_command(self):
+        interfaces = self._create_bulk_tracing_topology()
+        expected = self._get_cable_paths()
+        call_command("trace_paths", force=True, no_input=True, workers=1, stdout=StringIO())
+        self.assertEqual(self._get_cable_paths(), expected)
+
+        # Change a cable's status without updating its paths
+        cable = interfaces[0].cable
+        Cable.objects.filter(pk=cable.pk).update(status=self.status_planned, last_updated=now())
+        CablePath.objects.filter(path__contains=cable).update(is_active=True)
+        call_command(
+            "trace_paths",
+            incremental=True,
+            since=(now() - timedelta(minutes=1)).isoformat(),
+            workers=1,
+            stdout=StringIO(),
+        )
+        self.assertEqual(self._get_cable_paths(), expected)
@@ -30,6 +30,7 @@ from nautobot.core.graphql import execute_saved_query
 from nautobot.core.models.querysets import count_related
 from nautobot.extras import filters
 from nautobot.extras.choices import JobExecutionType
+from nautobot.extras.config_context_cache import config_context_cache_enabled, prefetch_config_contexts
 from nautobot.extras.filters import RoleFilterSet
 from nautobot.extras.jobs import get_job
 from nautobot.extras.models import (
@@ -163,16 +164,29 @@ class ConfigContextQuerySetMixin:
         """
         Build the proper queryset based on the request context
 
-        If the `include` query param includes `config_context`, return the queryset annotated with config context.
+        If the `include` query param includes `config_context`, return the queryset annotated with config context,
+        unless the stored rendered config context data is to be used instead.
 
         Else, return the base queryset.
         """
         queryset = super().get_queryset()
-        request = self.get_serializer_context()["request"]
-        if request is not None and "config_context" in request.query_params.get("include", []):
+        if self._include_config_context() and not config_context_cache_enabled():
             return queryset.annotate_config_context_data()
         return queryset
 
+    def paginate_queryset(self, queryset):
+        """
+        If the `include` query param includes `config_context`, load the stored config context data of the page at once.
+        """
+        page = super().paginate_queryset(queryset)
+        if page is not None and self._include_config_context():
+            prefetch_config_contexts(page)
+        return page
+
+    def _include_config_context(self):
+        request = self.get_serializer_context()["request"]
+        return request is not None and "config_context" in request.query_params.get("include", [])
+
 
 class ConfigContextViewSet(NotesViewSetMixin, ModelViewSet):
     queryset = ConfigContext.objects.prefetch_related(
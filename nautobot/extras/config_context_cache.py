@@ -0,0 +1,171 @@
+"""
+Optional materialized store of the rendered (merged) ConfigContext data of each Device and Virtual Machine.
+
+When `settings.CONFIG_CONTEXT_CACHE_ENABLED` is set, the result of merging all ConfigContexts applicable to an object is
+stored in the Django cache the first time it is rendered, and reused by subsequent calls to `get_config_context()`
+(and therefore by the REST API and GraphQL) until it is invalidated. The object's own `local_config_context_data` is
+not part of the stored data, and is merged in on each read as before.
+
+Stored data is invalidated incrementally by signals:
+
+- Saving, deleting, or changing the tags of a Device or Virtual Machine invalidates only that object's data, as does
+  `QuerySet.update()` of Devices or Virtual Machines, or (if `settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` is set) a
+  change to the Dynamic Groups that an object is a member of.
+- Changes to any ConfigContext or its assignments, or to any of the models that it may be assigned through (such as
+  Locations, Roles, Platforms or Clusters), invalidate all stored data at once by changing a version token stored in the
+  Django cache. Such changes are rare compared to reads, and the data of each object is recomputed lazily on its next
+  read. This includes their deletion, which may clear the corresponding field of Devices or Virtual Machines without
+  sending any signal for them.
+
+While a transaction has invalidated any stored data, reads of that data (from the same thread) bypass the cache, since
+the cache only reflects committed data.
+"""
+
+from collections import OrderedDict
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from nautobot.core.utils.data import deepmerge
+
+_VERSION_CACHE_KEY = "nautobot.extras.config_context_cache.version"
+_DATA_CACHE_KEY_PREFIX = "nautobot.extras.config_context_cache.data"
+_local = threading.local()
+
+
+def _data_cache_key(model, pk):
+    return f"{_DATA_CACHE_KEY_PREFIX}.{model._meta.label_lower}.{pk}"
+
+
+def _dirty_keys():
+    if not hasattr(_local, "dirty_keys"):
+        _local.dirty_keys = set()
+    # Outside of a transaction, any changes have been either committed or rolled back by now
+    if not connection.in_atomic_block:
+        _local.dirty_keys.clear()
+    return _local.dirty_keys
+
+
+def config_context_cache_enabled():
+    """Return whether the rendered ConfigContext data of objects may currently be served from the cache."""
+    return settings.CONFIG_CONTEXT_CACHE_ENABLED
+
+
+def _get_version():
+    version = cache.get(_VERSION_CACHE_KEY)
+    if version is None:
+        # Never treat a missing (e.g. evicted) version as matching a previously seen one
+        cache.add(_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(_VERSION_CACHE_KEY)
+    return version
+
+
+def merge_config_context_data(config_context_data):
+    """
+    Merge the given iterable of ConfigContext `data` dicts, overwriting earlier values with later ones on collision.
+    """
+    data = OrderedDict()
+    for context in config_context_data:
+        data = deepmerge(data, context)
+    return data
+
+
+def prefetch_config_contexts(objects):
+    """
+    Load the stored rendered ConfigContext data of each of the given Devices or Virtual Machines in a single lookup.
+
+    Any data that isn't stored yet (or is stale) is computed with a single query per model (or per object, if
+    `settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` is set) and stored. The data is then attached to each object so
+    that `get_config_context()` doesn't need to look it up again.
+    """
+    objects = [obj for obj in objects if obj.pk is not None]
+    if not objects or not config_context_cache_enabled():
+        return
+    dirty = _dirty_keys()
+    if None in dirty:
+        return
+
+    version = _get_version()
+    cache_keys = {obj.pk: _data_cache_key(type(obj), obj.pk) for obj in objects}
+    stored = cache.get_many([cache_key for cache_key in cache_keys.values() if cache_key not in dirty])
+
+    missing = {}
+    for obj in objects:
+        entry = stored.get(cache_keys[obj.pk])
+        if entry is not None and entry[0] == version:
+            obj._rendered_config_context_data = entry[1]
+        elif cache_keys[obj.pk] not in dirty:
+            missing.setdefault(type(obj), []).append(obj)
+
+    to_store = {}
+    for model, model_objects in missing.items():
+        for obj, config_context_data in _get_config_context_data(model, model_objects):
+            data = merge_config_context_data(config_context_data)
+            obj._rendered_config_context_data = data
+            to_store[cache_keys[obj.pk]] = (version, data)
+    if to_store:
+        cache.set_many(to_store, timeout=None)
+
+
+def _get_config_context_data(model, objects):
+    """Yield each of the given objects of `model` with the `data` of each ConfigContext applicable to it, in order."""
+    if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+        from nautobot.extras.models import ConfigContext  # avoid circular import
+
+        # The annotation doesn't account for Dynamic Groups, in which case each object is queried separately
+        for obj in objects:
+            yield obj, ConfigContext.objects.get_for_object(obj).values_list("data", flat=True)
+        return
+
+    annotated = dict(
+        model.objects.filter(pk__in=[obj.pk for obj in objects])
+        .annotate_config_context_data()
+        .values_list("pk", "config_context_data")
+    )
+    for obj in objects:
+        config_context_data = sorted(annotated.get(obj.pk) or [], key=lambda k: (k["weight"], k["name"]))
+        yield obj, [c["data"] for c in config_context_data]
+
+
+def get_rendered_config_context_data(obj):
+    """
+    Return the merged data of all ConfigContexts applicable to the given Device or Virtual Machine.
+
+    Local config context data is not included. Returns None if the data can't be served from the cache, in which case
+    the caller should compute it directly.
+    """
+    if not hasattr(obj, "_rendered_config_context_data"):
+        prefetch_config_contexts([obj])
+    return getattr(obj, "_rendered_config_context_data", None)
+
+
+def invalidate_config_context_cache(obj=None):
+    """
+    Invalidate the stored rendered ConfigContext data of the given Device or Virtual Machine, or of all objects if None.
+
+    Other processes are notified once the current transaction (if any) is committed.
+    """
+    if obj is None:
+        transaction.on_commit(lambda: cache.set(_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None))
+        if connection.in_atomic_block:
+            _dirty_keys().add(None)
+    else:
+        obj.__dict__.pop("_rendered_config_context_data", None)
+        invalidate_config_context_cache_for_objects(type(obj), [obj.pk])
+
+
+def invalidate_config_context_cache_for_objects(model, pks):
+    """
+    Invalidate the stored rendered ConfigContext data of the Devices or Virtual Machines of `model` with the given PKs.
+
+    Other processes are notified once the current transaction (if any) is committed.
+    """
+    cache_keys = [_data_cache_key(model, pk) for pk in pks]
+    if not cache_keys:
+        return
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
+    if connection.in_atomic_block:
+        _dirty_keys().update(cache_keys)
@@ -1,16 +1,19 @@
 from contextlib import contextmanager
 import uuid
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.db import transaction
 from django.test.client import RequestFactory
 
-from nautobot.extras.choices import ObjectChangeEventContextChoices
+from nautobot.extras.choices import ObjectChangeActionChoices, ObjectChangeEventContextChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import ObjectChange
+from nautobot.extras.models.change_logging import defer_object_data_v2
 from nautobot.extras.signals import change_context_state, get_user_if_authenticated
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.tasks import save_object_changes
+from nautobot.extras.webhooks import enqueue_webhooks_in_bulk
 
 
 class ChangeContext:
@@ -28,11 +31,15 @@ class ChangeContext:
     """
 
     defer_object_changes = False  # advanced usage, for creating object changes in bulk
+    async_object_changes = False  # advanced usage, for creating deferred object changes in a Celery worker
 
     def __init__(self, user=None, request=None, context=None, context_detail="", change_id=None):
         self.request = request
         self.user = user
         self.reset_deferred_object_changes()
+        self.queued_object_changes = []
+        self.saved_object_changes = {}
+        self.unverified_object_change_pks = set()
 
         if self.request is None and self.user is None:
             raise TypeError("Either user or request must be provided")
@@ -82,7 +89,56 @@ class ChangeContext:
 
     def flush_deferred_object_changes(self, batch_size=1000):
         if self.defer_object_changes:
-            self.create_object_changes(batch_size=batch_size)
+            if self.async_object_changes:
+                self.queue_object_changes(batch_size=batch_size)
+            else:
+                self.create_object_changes(batch_size=batch_size)
+
+    def queue_object_changes(self, batch_size=1000):
+        """
+        Save the deferred creations and updates without their `object_data_v2` and create any deferred deletions.
+
+        Each created or updated object is snapshotted with `serialize_object()` now, so that its change records the
+        state and time of the change itself; only the slower `object_data_v2` REST API serialization is left to the
+        `save_object_changes` task, to which `enqueue_object_changes()` sends the saved changes.
+        """
+        queued_object_changes = []
+        token = defer_object_data_v2.set(True)
+        try:
+            for key, entries in list(self.deferred_object_changes.items()):
+                if any(entry["action"] == ObjectChangeActionChoices.ACTION_DELETE for entry in entries):
+                    continue
+                for entry in entries:
+                    objectchange = entry["instance"].to_objectchange(entry["action"])
+                    if objectchange is not None:
+                        objectchange.user = entry["user"]
+                        objectchange.user_name = objectchange.user.username
+                        objectchange.request_id = self.change_id
+                        objectchange.change_context = self.context
+                        objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+                        queued_object_changes.append(objectchange)
+                del self.deferred_object_changes[key]
+        finally:
+            defer_object_data_v2.reset(token)
+        ObjectChange.objects.bulk_create(queued_object_changes, batch_size=batch_size)
+        self.create_object_changes(batch_size=batch_size)
+        # Discard the queued changes if the enclosing transaction, if any, is rolled back
+        transaction.on_commit(
+            lambda: self.queued_object_changes.extend(str(objectchange.pk) for objectchange in queued_object_changes)
+        )
+
+    def enqueue_object_changes(self, batch_size=1000):
+        """
+        Send the changes saved by `queue_object_changes()` to a Celery worker to add their `object_data_v2` and enqueue
+        their job hooks and webhooks, once the enclosing transaction, if any, is committed.
+        """
+
+        def enqueue():
+            object_change_pks, self.queued_object_changes = self.queued_object_changes, []
+            if object_change_pks:
+                save_object_changes.delay(object_change_pks, batch_size=batch_size)
+
+        transaction.on_commit(enqueue)
 
     def create_object_changes(self, batch_size=1000):
         while self.deferred_object_changes:
@@ -105,6 +161,39 @@ class ChangeContext:
                         create_object_changes.append(objectchange)
                 self.deferred_object_changes.pop(key, None)
             ObjectChange.objects.bulk_create(create_object_changes, batch_size=batch_size)
+            self.record_object_changes(create_object_changes)
+
+    def record_object_changes(self, object_changes):
+        """
+        Record the given saved ObjectChanges, so that `dispatch_object_changes()` can enqueue their job hooks and webhooks
+        without having to query for all of the changes of this context.
+        """
+        in_atomic_block = transaction.get_connection().in_atomic_block
+        for objectchange in object_changes:
+            self.saved_object_changes[objectchange.pk] = objectchange
+            if in_atomic_block:
+                # The change is discarded if its transaction is rolled back, so it must be checked before dispatching
+                self.unverified_object_change_pks.add(objectchange.pk)
+
+    def dispatch_object_changes(self):
+        """
+        Enqueue the job hooks and webhooks of the ObjectChanges recorded by `record_object_changes()`, then forget them.
+
+        Any changes recorded within a transaction are first checked to still exist, with a single query.
+        """
+        from nautobot.extras.jobs import enqueue_job_hooks_in_bulk  # prevent circular import
+
+        object_changes, self.saved_object_changes = self.saved_object_changes, {}
+        unverified_pks, self.unverified_object_change_pks = self.unverified_object_change_pks, set()
+        if not object_changes:
+            return
+        if unverified_pks:
+            existing_pks = set(ObjectChange.objects.filter(pk__in=unverified_pks).values_list("pk", flat=True))
+            for pk in unverified_pks - existing_pks:
+                del object_changes[pk]
+        object_changes = list(object_changes.values())
+        enqueue_job_hooks_in_bulk(object_changes)
+        enqueue_webhooks_in_bulk(object_changes)
 
 
 class JobChangeContext(ChangeContext):
@@ -179,8 +268,6 @@ def web_request_context(
         Valid choices are in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param request: Optional web request instance, one will be generated if not supplied
     """
-    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
-
     valid_contexts = {
         ObjectChangeEventContextChoices.CONTEXT_JOB: JobChangeContext,
         ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK: JobHookChangeContext,
@@ -198,14 +285,31 @@ def web_request_context(
         request = RequestFactory().request(SERVER_NAME="web_request_context")
         request.user = user
     change_context = valid_contexts[context](request=request, context_detail=context_detail, change_id=change_id)
-    try:
-        with change_logging(change_context):
-            yield request
-    finally:
-        # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
-        for object_change in ObjectChange.objects.filter(request_id=change_context.change_id).iterator():
-            enqueue_job_hooks(object_change)
-            enqueue_webhooks(object_change)
+    if settings.CHANGELOG_ASYNC_ENABLED:
+        change_context.defer_object_changes = True
+        change_context.async_object_changes = True
+    if not change_context.async_object_changes:
+        try:
+            with change_logging(change_context):
+                yield request
+        finally:
+            change_context.flush_deferred_object_changes()
+            # enqueue jobhooks and webhooks of the changes saved in this context
+            change_context.dispatch_object_changes()
+        return
+
+    # Asynchronous changes are only recorded once committed (see `_handle_changed_object()`), so they're flushed once
+    # any enclosing transaction is committed too, and only if the body completed.
+    with change_logging(change_context):
+        yield request
+
+    def flush():
+        change_context.flush_deferred_object_changes()
+        change_context.dispatch_object_changes()
+        # the worker enqueues the jobhooks and webhooks of the changes queued for it
+        change_context.enqueue_object_changes()
+
+    transaction.on_commit(flush)
 
 
 @contextmanager
@@ -219,11 +323,14 @@ def deferred_change_logging_for_bulk_operation():
     if change_context is None:
         raise ValueError("Change logging must be enabled before using deferred_change_logging_for_bulk_operation")
 
+    # Flush any changes already deferred by the enclosing context, as they would otherwise be reset below
+    change_context.flush_deferred_object_changes()
+    defer_object_changes = change_context.defer_object_changes
     with transaction.atomic():
         try:
             change_context.defer_object_changes = True
             yield
             change_context.flush_deferred_object_changes()
         finally:
-            change_context.defer_object_changes = False
+            change_context.defer_object_changes = defer_object_changes
             change_context.reset_deferred_object_changes()
@@ -50,6 +50,9 @@ GitJobResult = namedtuple("GitJobResult", ["job_result", "repository_record"])
 # namedtuple takes from_url(remote git repository url), to_path(local path of git repo), from_branch(git branch)
 GitRepoInfo = namedtuple("GitRepoInfo", ["from_url", "to_path", "from_branch"])
 
+# Head of each Git repository (by slug) from which its Jobs were last imported in this process
+_job_code_heads = {}
+
 
 def enqueue_git_repository_helper(repository, user, job_class, **kwargs):
     """
@@ -717,6 +720,15 @@ def delete_git_config_context_schemas(repository_record, job_result, preserve=()
 #
 
 
+def job_code_is_current(repository_record):
+    """Return whether the Jobs of the given GitRepository were already imported from its `current_head`."""
+    return bool(
+        repository_record.current_head
+        and _job_code_heads.get(repository_record.slug) == repository_record.current_head
+        and os.path.isdir(repository_record.filesystem_path)
+    )
+
+
 def refresh_job_code_from_repository(repository_slug, skip_reimport=False, ignore_import_errors=True):
     """
     After cloning/updating/deleting a GitRepository on disk, call this function to reload and reregister its Python.
@@ -728,6 +740,7 @@ def refresh_job_code_from_repository(repository_slug, skip_reimport=False, ignor
             If False, exceptions will be re-raised after logging.
     """
     # Unload any previous version of this module and its submodules if present
+    _job_code_heads.pop(repository_slug, None)
     for job_class_path in list(registry["jobs"]):
         if job_class_path.startswith(f"{repository_slug}."):
             del registry["jobs"][job_class_path]
@@ -749,6 +762,7 @@ def refresh_job_code_from_repository(repository_slug, skip_reimport=False, ignor
                 import_modules_privately(
                     settings.GIT_ROOT, module_path=[repository_slug, "jobs"], ignore_import_errors=ignore_import_errors
                 )
+                _job_code_heads[repository_slug] = repository.current_head
     except GitRepository.DoesNotExist as exc:
         logger.error("Unable to reload Jobs from %s.jobs: %s", repository_slug, exc)
         if not ignore_import_errors:
@@ -0,0 +1,113 @@
+"""
+Parallel, dependency-ordered refresh of the cached members of Dynamic Groups.
+
+Since the members of a set-based Dynamic Group are computed from those of its child groups, `enqueue_cache_refresh()`
+builds the graph of nested groups from `DynamicGroupMembership` records and enqueues one Celery task per group to be
+refreshed, in stages: groups without children to refresh come first, and each subsequent stage only starts once every
+task of the previous stage has completed, so that parents are always refreshed after their children. Groups within a
+stage are independent of each other and can be refreshed by any number of workers in parallel.
+
+Requests to refresh a group that is already waiting to be refreshed in the first stage of an earlier request (and none
+of whose children are being refreshed along with it) are coalesced with the pending refresh, using a marker stored in
+the Django cache.
+"""
+
+from celery import chain, group as celery_group
+from django.core.cache import cache
+
+from nautobot.extras.choices import DynamicGroupTypeChoices
+
+# Time (in seconds) after which a group's refresh is no longer considered pending, in case its task was lost
+PENDING_REFRESH_TIMEOUT = 3600
+
+_PENDING_REFRESH_CACHE_KEY_PREFIX = "nautobot.extras.dynamic_group_refresh.pending"
+
+
+def _pending_refresh_cache_key(dynamic_group_pk):
+    return f"{_PENDING_REFRESH_CACHE_KEY_PREFIX}.{dynamic_group_pk}"
+
+
+def clear_pending_refresh(dynamic_group_pk):
+    """Mark the given DynamicGroup as no longer waiting to be refreshed, as its refresh is about to begin."""
+    cache.delete(_pending_refresh_cache_key(dynamic_group_pk))
+
+
+def get_refresh_stages(dynamic_group_pks, include_ancestors=False):
+    """
+    Return a list of sets of DynamicGroup pks, each of which only needs to be refreshed after all of the previous ones.
+
+    Args:
+        dynamic_group_pks (iterable): The pks of the DynamicGroups to refresh
+        include_ancestors (bool): Whether to also refresh all ancestors of these groups
+    """
+    from nautobot.extras.models import DynamicGroup, DynamicGroupMembership  # avoid circular import
+
+    children = {}
+    parents = {}
+    for parent_pk, child_pk in DynamicGroupMembership.objects.values_list("parent_group", "group"):
+        children.setdefault(parent_pk, set()).add(child_pk)
+        parents.setdefault(child_pk, set()).add(parent_pk)
+
+    to_refresh = set(dynamic_group_pks)
+    if include_ancestors:
+        stack = list(to_refresh)
+        while stack:
+            for parent_pk in parents.get(stack.pop(), ()):
+                if parent_pk not in to_refresh:
+                    to_refresh.add(parent_pk)
+                    stack.append(parent_pk)
+    # Static groups have no cached members to refresh
+    to_refresh = set(
+        DynamicGroup.objects.filter(pk__in=to_refresh)
+        .exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC)
+        .values_list("pk", flat=True)
+    )
+
+    # Each group's stage is one more than the highest stage of any of its children that are also being refreshed
+    stage_of = {}
+
+    def get_stage(pk, visiting=()):
+        if pk not in stage_of:
+            stage_of[pk] = 1 + max(
+                (
+                    get_stage(child_pk, (*visiting, pk))
+                    for child_pk in children.get(pk, ())
+                    if child_pk in to_refresh and child_pk not in visiting
+                ),
+                default=-1,
+            )
+        return stage_of[pk]
+
+    stages = []
+    for pk in to_refresh:
+        stage = get_stage(pk)
+        while len(stages) <= stage:
+            stages.append(set())
+        stages[stage].add(pk)
+    return stages
+
+
+def enqueue_cache_refresh(dynamic_group_pks, include_ancestors=False):
+    """
+    Enqueue the refresh of the cached members of the given DynamicGroups (and optionally all of their ancestors).
+
+    Returns the Celery `AsyncResult` of the enqueued refresh, or None if there was nothing to enqueue.
+    """
+    from nautobot.extras.tasks import refresh_dynamic_group_cached_members  # avoid circular import
+
+    signatures = []
+    for i, stage in enumerate(get_refresh_stages(dynamic_group_pks, include_ancestors=include_ancestors)):
+        stage_signatures = []
+        for pk in sorted(stage, key=str):
+            # A pending refresh of a group only suffices if it isn't also waiting on any children refreshed below.
+            # Later stages are never marked as pending, as they won't run at all if an earlier stage fails.
+            if i > 0 or cache.add(_pending_refresh_cache_key(pk), True, timeout=PENDING_REFRESH_TIMEOUT):
+                stage_signatures.append(refresh_dynamic_group_cached_members.si(str(pk)))
+        if stage_signatures:
+            signatures.append(celery_group(stage_signatures))
+
+    if not signatures:
+        return None
+    if len(signatures) == 1:
+        return signatures[0].apply_async()
+    return chain(*signatures).apply_async()
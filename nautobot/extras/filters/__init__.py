@@ -1395,6 +1395,7 @@ class WebhookFilterSet(BaseFilterSet):
             "type_create",
             "type_update",
             "type_delete",
+            "batch_delivery",
         ]
 
 
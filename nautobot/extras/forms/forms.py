@@ -1883,6 +1883,7 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_delivery",
         )
 
     def clean(self):
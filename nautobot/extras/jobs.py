@@ -18,8 +18,9 @@ from db_file_storage.form_widgets import DBClearableFileInput
 from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import RegexValidator
 from django.db.models import Model
@@ -709,7 +710,7 @@ class BaseJob:
 
         Args:
             filename (str): Name of the file to create, including extension
-            content (str, bytes): Content to populate the created file with.
+            content (str, bytes, file): Content to populate the created file with, or a binary file object to copy it from.
 
         Raises:
             (ValueError): if the provided content exceeds JOB_CREATE_FILE_MAX_SIZE in length
@@ -717,15 +718,28 @@ class BaseJob:
         Returns:
             (FileProxy): record that was created
         """
+        return self._create_file(filename, content, max_size=get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE"))
+
+    def _create_file(self, filename, content, max_size=None):
+        """
+        Implementation of `create_file()`, optionally without a maximum size (as used by system jobs such as exports).
+
+        A file object is copied into storage in chunks, without being read into memory first (unless the storage backend
+        itself requires it, as `DatabaseFileStorage` does).
+        """
         if isinstance(content, str):
             content = content.encode("utf-8")
-        max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE")
-        actual_size = len(content)
-        if actual_size > max_size:
-            raise ValueError(f"Provided {actual_size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
-        fp = FileProxy.objects.create(
-            name=filename, job_result=self.job_result, file=ContentFile(content, name=filename)
-        )
+        if isinstance(content, bytes):
+            file = ContentFile(content, name=filename)
+        else:
+            file = File(content, name=filename)
+            # Determine the size by seeking to the end, as Django can't for in-memory files such as SpooledTemporaryFile
+            position = content.tell()
+            file.size = content.seek(0, os.SEEK_END)
+            content.seek(position)
+        if max_size is not None and file.size > max_size:
+            raise ValueError(f"Provided {file.size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
+        fp = FileProxy.objects.create(name=filename, job_result=self.job_result, file=file)
         self.logger.info("Created file [%s](%s)", filename, fp.file.url)
         return fp
 
@@ -1149,33 +1163,56 @@ def enqueue_job_hooks(object_change):
     Find job hook(s) assigned to this changed object type + action and enqueue them
     to be processed
     """
+    enqueue_job_hooks_in_bulk([object_change])
 
-    # Job hooks cannot trigger other job hooks
-    if object_change.change_context == ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
-        return
 
-    # Determine whether this type of object supports job hooks
-    content_type = object_change.changed_object_type
-    if content_type not in change_logged_models_queryset():
-        return
+def enqueue_job_hooks_in_bulk(object_changes):
+    """
+    Find the job hook(s) assigned to each of the given ObjectChanges' changed object type + action and enqueue them to be
+    processed.
 
-    # Retrieve any applicable job hooks
-    action_flag = {
+    Job hooks are looked up only once for each distinct combination of changed object type and action.
+    """
+    action_flags = {
         ObjectChangeActionChoices.ACTION_CREATE: "type_create",
         ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
         ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
-    job_hooks = JobHook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
-
-    # Enqueue the jobs related to the job_hooks
-    get_jobs(reload=True)
-    for job_hook in job_hooks:
-        job_model = job_hook.job
-        if not job_model.installed or not job_model.enabled:
-            logger.warning(
-                "JobHook %s is enabled, but the underlying Job %s is not installed and enabled", job_hook, job_model
-            )
-        elif get_job(job_model.class_path) is None:
-            logger.error("JobHook %s is enabled, but the underlying Job implementation is missing", job_hook)
-        else:
-            JobResult.enqueue_job(job_model, object_change.user, object_change=object_change.pk)
+    }
+    job_hooks_by_type_and_action = {}
+    jobs_loaded = False
+    for object_change in object_changes:
+        # Job hooks cannot trigger other job hooks
+        if object_change.change_context == ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
+            continue
+
+        key = (object_change.changed_object_type_id, object_change.action)
+        if key not in job_hooks_by_type_and_action:
+            # Determine whether this type of object supports job hooks
+            content_type = ContentType.objects.get_for_id(object_change.changed_object_type_id)
+            if content_type not in change_logged_models_queryset():
+                job_hooks_by_type_and_action[key] = []
+            else:
+                # Retrieve any applicable job hooks
+                job_hooks_by_type_and_action[key] = list(
+                    JobHook.objects.filter(
+                        content_types=content_type, enabled=True, **{action_flags[object_change.action]: True}
+                    ).select_related("job")
+                )
+        job_hooks = job_hooks_by_type_and_action[key]
+        if not job_hooks:
+            continue
+
+        # Enqueue the jobs related to the job_hooks
+        if not jobs_loaded:
+            get_jobs(reload=True)
+            jobs_loaded = True
+        for job_hook in job_hooks:
+            job_model = job_hook.job
+            if not job_model.installed or not job_model.enabled:
+                logger.warning(
+                    "JobHook %s is enabled, but the underlying Job %s is not installed and enabled", job_hook, job_model
+                )
+            elif get_job(job_model.class_path) is None:
+                logger.error("JobHook %s is enabled, but the underlying Job implementation is missing", job_hook)
+            else:
+                JobResult.enqueue_job(job_model, object_change.user, object_change=object_change.pk)
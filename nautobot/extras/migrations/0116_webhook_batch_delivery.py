@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+import nautobot.extras.models.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0115_scheduledjob_time_zone"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="webhook",
+            managers=[
+                ("objects", nautobot.extras.models.models.WebhookManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_delivery",
+            field=models.BooleanField(default=False),
+        ),
+    ]
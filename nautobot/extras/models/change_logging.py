@@ -1,3 +1,5 @@
+import contextvars
+
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -18,6 +20,10 @@ from nautobot.extras.utils import extras_features
 # Change logging
 #
 
+# While True, `ChangeLoggedModel.to_objectchange()` leaves `object_data_v2` unset, to be filled in afterwards
+# (see `ChangeContext.queue_object_changes()` and the `save_object_changes` task)
+defer_object_data_v2 = contextvars.ContextVar("defer_object_data_v2", default=False)
+
 
 class ChangeLoggedModel(models.Model):
     """
@@ -37,12 +43,20 @@ class ChangeLoggedModel(models.Model):
 
         This will typically be called automatically by ChangeLoggingMiddleware.
         """
+        object_data = serialize_object(self, extra=object_data_extra, exclude=object_data_exclude)
+        object_data_v2 = None
+        if not defer_object_data_v2.get():
+            # Avoid serializing the object a second time if it has no REST API serializer to produce object_data_v2 with
+            fallback_data = None
+            if not object_data_extra and not object_data_exclude:
+                fallback_data = dict(object_data)
+            object_data_v2 = serialize_object_v2(self, fallback_data=fallback_data)
         return ObjectChange(
             changed_object=self,
             object_repr=str(self)[:CHANGELOG_MAX_OBJECT_REPR],
             action=action,
-            object_data=serialize_object(self, extra=object_data_extra, exclude=object_data_exclude),
-            object_data_v2=serialize_object_v2(self),
+            object_data=object_data,
+            object_data_v2=object_data_v2,
             related_object=related_object,
         )
 
@@ -6,7 +6,6 @@ import re
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator, ValidationError
@@ -35,6 +34,7 @@ from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.models.validators import validate_regex
 from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.templatetags.helpers import render_markdown
+from nautobot.core.utils.cache import get_cached_value
 from nautobot.core.utils.data import render_jinja2
 from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTypeChoices
 from nautobot.extras.models import ChangeLoggedModel
@@ -54,12 +54,12 @@ class ComputedFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
         """
         concrete_model = model._meta.concrete_model
         cache_key = f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+        def get_queryset():
             content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = self.get_queryset().filter(content_type=content_type)
-            cache.set(cache_key, queryset)
-        return queryset
+            return self.get_queryset().filter(content_type=content_type)
+
+        return get_cached_value(self.get_for_model.cache_key_prefix, cache_key, get_queryset)
 
     get_for_model.cache_key_prefix = "nautobot.extras.computedfield.get_for_model"
 
@@ -380,14 +380,15 @@ class CustomFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
         cache_key = (
             f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}.{exclude_filter_disabled}"
         )
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+        def get_queryset():
             content_type = ContentType.objects.get_for_model(concrete_model)
             queryset = self.get_queryset().filter(content_types=content_type)
             if exclude_filter_disabled:
                 queryset = queryset.exclude(filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED)
-            cache.set(cache_key, queryset)
-        return queryset
+            return queryset
+
+        return get_cached_value(self.get_for_model.cache_key_prefix, cache_key, get_queryset)
 
     get_for_model.cache_key_prefix = "nautobot.extras.customfield.get_for_model"
 
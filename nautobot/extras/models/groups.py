@@ -3,6 +3,7 @@
 import logging
 
 from django import forms
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
@@ -22,8 +23,14 @@ from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.deprecation import method_deprecated, method_deprecated_in_favor_of
 from nautobot.core.utils.lookup import get_filterset_for_model, get_form_for_model
 from nautobot.extras.choices import DynamicGroupOperatorChoices, DynamicGroupTypeChoices
+from nautobot.extras.config_context_cache import invalidate_config_context_cache_for_objects
 from nautobot.extras.querysets import DynamicGroupMembershipQuerySet, DynamicGroupQuerySet
-from nautobot.extras.utils import extras_features, FeatureQuery
+from nautobot.extras.utils import (
+    bulk_create_with_bulk_change_logging,
+    bulk_delete_with_bulk_change_logging,
+    extras_features,
+    FeatureQuery,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -315,29 +322,14 @@ class DynamicGroup(PrimaryModel):
         return self._set_members(value)
 
     def _set_members(self, value):
-        """Internal API for updating the static/cached members of this group."""
-        if isinstance(value, models.QuerySet):
-            if value.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            to_remove = self.members.exclude(pk__in=value.values_list("pk", flat=True))
-            self._remove_members(to_remove)
-            to_add = value.exclude(pk__in=self.members.values_list("pk", flat=True))
-            self._add_members(to_add)
-        else:
-            for obj in value:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-            to_remove = []
-            for member in self.members:
-                if member not in value:
-                    to_remove.append(member)
-            self._remove_members(to_remove)
-            to_add = []
-            members = self.members
-            for candidate in value:
-                if candidate not in members:
-                    to_add.append(candidate)
-            self._add_members(to_add)
+        """
+        Internal API for updating the static/cached members of this group.
+
+        The members to add and remove are determined by the database, so the cost of this scales with the number of
+        members added or removed rather than with the size of the group.
+        """
+        self._remove_member_associations(self._member_associations().exclude(associated_object_id__in=self._pks(value)))
+        self._add_members(value)
 
         return self.members
 
@@ -350,31 +342,32 @@ class DynamicGroup(PrimaryModel):
     def _add_members(self, objects_to_add):
         """Internal API for adding the given list or QuerySet of objects to the cached/static members of this group."""
         if isinstance(objects_to_add, models.QuerySet):
-            if objects_to_add.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
+            pks_to_add = self._pks(objects_to_add).exclude(
+                pk__in=self._member_associations().values("associated_object_id")
+            )
         else:
-            for obj in objects_to_add:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
+            pks_to_add = self._pks(objects_to_add)
+            pks_to_add -= set(
+                self._member_associations()
+                .filter(associated_object_id__in=pks_to_add)
+                .values_list("associated_object_id", flat=True)
+            )
 
+        sgas = [
+            StaticGroupAssociation(
+                dynamic_group=self, associated_object_type=self.content_type, associated_object_id=pk
+            )
+            for pk in pks_to_add
+        ]
         if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
-            for obj in objects_to_add:
-                # We don't use `.bulk_create()` currently because we want change logging for these creates.
-                # Might be a good future performance improvement though.
-                StaticGroupAssociation.all_objects.get_or_create(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
+            # Members of a static group are change-logged, so create their ObjectChanges in bulk as well
+            bulk_create_with_bulk_change_logging(sgas)
         else:
             # Cached/hidden static group associations, so we can use bulk-create to bypass change logging.
-            existing_members = self.members
-            sgas = [
-                StaticGroupAssociation(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
-                for obj in objects_to_add
-                if obj not in existing_members
-            ]
-            StaticGroupAssociation.all_objects.bulk_create(sgas)
+            StaticGroupAssociation.all_objects.bulk_create(sgas, batch_size=1000)
+        if sgas and settings.CONFIG_CONTEXT_CACHE_ENABLED and settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            # Bulk creation sends no post_save signal to invalidate the stored ConfigContext data of the new members
+            invalidate_config_context_cache_for_objects(self.model, [sga.associated_object_id for sga in sgas])
 
     def remove_members(self, objects_to_remove):
         """Remove the given list or QuerySet of objects from this staticly defined group."""
@@ -384,24 +377,40 @@ class DynamicGroup(PrimaryModel):
 
     def _remove_members(self, objects_to_remove):
         """Internal API for removing the given list or QuerySet from the cached/static members of this Group."""
-        if isinstance(objects_to_remove, models.QuerySet):
-            if objects_to_remove.model != self.model:
+        self._remove_member_associations(
+            self._member_associations().filter(associated_object_id__in=self._pks(objects_to_remove))
+        )
+
+    def _pks(self, objects):
+        """
+        Return the primary keys of the given list or QuerySet of objects of this group's model.
+
+        For a QuerySet, the result is a `values_list()` QuerySet that can be used as a subquery.
+        """
+        if isinstance(objects, models.QuerySet):
+            if objects.model != self.model:
                 raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            StaticGroupAssociation.all_objects.filter(
-                dynamic_group=self,
-                associated_object_type=self.content_type,
-                associated_object_id__in=objects_to_remove.values_list("pk", flat=True),
-            ).delete()
+            return objects.values_list("pk", flat=True)
+
+        pks = set()
+        for obj in objects:
+            if not isinstance(obj, self.model):
+                raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
+            pks.add(obj.pk)
+        return pks
+
+    def _member_associations(self):
+        """Return the QuerySet of StaticGroupAssociations recording the static/cached members of this group."""
+        return StaticGroupAssociation.all_objects.filter(dynamic_group=self, associated_object_type=self.content_type)
+
+    def _remove_member_associations(self, associations):
+        """Delete the given StaticGroupAssociations, change-logging them in bulk if this is a static group."""
+        from nautobot.extras.signals import change_context_state  # avoid circular import
+
+        if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC and change_context_state.get() is not None:
+            bulk_delete_with_bulk_change_logging(associations)
         else:
-            pks_to_remove = set()
-            for obj in objects_to_remove:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-                pks_to_remove.add(obj.pk)
-
-            StaticGroupAssociation.all_objects.filter(
-                dynamic_group=self, associated_object_type=self.content_type, associated_object_id__in=pks_to_remove
-            ).delete()
+            associations.delete()
 
     @property
     @method_deprecated("Members are now cached in the database via StaticGroupAssociations rather than in Redis.")
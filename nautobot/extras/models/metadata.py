@@ -2,7 +2,6 @@ from datetime import date, datetime, timezone
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
 
@@ -12,6 +11,7 @@ from nautobot.core.models.fields import JSONArrayField
 from nautobot.core.models.generics import PrimaryModel
 from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.settings_funcs import is_truthy
+from nautobot.core.utils.cache import get_cached_value
 from nautobot.extras.choices import MetadataTypeDataTypeChoices
 from nautobot.extras.models.change_logging import ChangeLoggedModel
 from nautobot.extras.models.contacts import Contact, Team
@@ -25,12 +25,12 @@ class MetadataTypeManager(BaseManager.from_queryset(RestrictedQuerySet)):
         """Return all MetadataTypes assigned to the given model."""
         concrete_model = model._meta.concrete_model
         cache_key = f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+        def get_queryset():
             content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = self.get_queryset().filter(content_types=content_type)
-            cache.set(cache_key, queryset)
-        return queryset
+            return self.get_queryset().filter(content_types=content_type)
+
+        return get_cached_value(self.get_for_model.cache_key_prefix, cache_key, get_queryset)
 
     get_for_model.cache_key_prefix = "nautobot.extras.metadatatype.get_for_model"
 
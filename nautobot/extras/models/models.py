@@ -1,4 +1,3 @@
-from collections import OrderedDict
 import json
 
 from db_file_storage.model_utils import delete_file, delete_file_if_needed
@@ -25,11 +24,15 @@ from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models import BaseManager, BaseModel
 from nautobot.core.models.fields import ForeignKeyWithAutoRelatedName, LaxURLField
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
+from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.core.utils.cache import get_cached_value
 from nautobot.core.utils.data import deepmerge, render_jinja2
 from nautobot.extras.choices import (
     ButtonClassChoices,
+    ObjectChangeActionChoices,
     WebhookHttpMethodChoices,
 )
+from nautobot.extras.config_context_cache import get_rendered_config_context_data, merge_config_context_data
 from nautobot.extras.constants import HTTP_CONTENT_TYPE_JSON
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import ContactMixin, DynamicGroupsModelMixin, NotesMixin, SavedViewMixin
@@ -203,18 +206,21 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         """
         Return the rendered configuration context for a device or VM.
         """
-        if not hasattr(self, "config_context_data"):
-            # Annotation not available, so fall back to manually querying for the config context
-            config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
-        else:
+        if hasattr(self, "config_context_data"):
             config_context_data = self.config_context_data or []
             config_context_data = [
                 c["data"] for c in sorted(config_context_data, key=lambda k: (k["weight"], k["name"]))
             ]
-        # Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs
-        data = OrderedDict()
-        for context in config_context_data:
-            data = deepmerge(data, context)
+            data = None
+        else:
+            # Annotation not available, so use the stored rendered data if possible
+            data = get_rendered_config_context_data(self)
+            if data is None:
+                # Fall back to manually querying for the config context
+                config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
+        if data is None:
+            # Compile all config data, overwriting lower-weight values with higher-weight values on collision
+            data = merge_config_context_data(config_context_data)
 
         # If the object has local config context data defined, merge it last
         if self.local_config_context_data:
@@ -908,6 +914,30 @@ class UserSavedViewAssociation(BaseModel):
 #
 
 
+class WebhookManager(BaseManager.from_queryset(RestrictedQuerySet)):
+    use_in_migrations = True
+
+    def get_for_model(self, model, action):
+        """
+        Return all enabled Webhooks triggered by the given action (create, update, or delete) on the given model.
+        """
+        concrete_model = model._meta.concrete_model
+        cache_key = f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}.{action}"
+
+        def get_queryset():
+            action_flag = {
+                ObjectChangeActionChoices.ACTION_CREATE: "type_create",
+                ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
+                ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
+            }[action]
+            content_type = ContentType.objects.get_for_model(concrete_model)
+            return self.get_queryset().filter(content_types=content_type, enabled=True, **{action_flag: True})
+
+        return get_cached_value(self.get_for_model.cache_key_prefix, cache_key, get_queryset)
+
+    get_for_model.cache_key_prefix = "nautobot.extras.webhook.get_for_model"
+
+
 @extras_features("graphql")
 class Webhook(
     ChangeLoggedModel,
@@ -986,6 +1016,13 @@ class Webhook(
         "Leave blank to use the system defaults.",
         default="",
     )
+    batch_delivery = models.BooleanField(
+        default=False,
+        help_text="Deliver all events resulting from a single request together, as a list of <code>events</code>, "
+        "rather than sending one request per event.",
+    )
+
+    objects = WebhookManager()
 
     class Meta:
         ordering = ("name",)
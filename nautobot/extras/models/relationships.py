@@ -3,7 +3,6 @@ import logging
 from django import forms
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
@@ -22,6 +21,7 @@ from nautobot.core.models import BaseManager, BaseModel
 from nautobot.core.models.fields import AutoSlugField, slugify_dashes_to_underscores
 from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.templatetags.helpers import bettertitle
+from nautobot.core.utils.cache import get_cached_value
 from nautobot.core.utils.lookup import get_filterset_for_model, get_route_for_model
 from nautobot.extras.choices import RelationshipRequiredSideChoices, RelationshipSideChoices, RelationshipTypeChoices
 from nautobot.extras.models import ChangeLoggedModel
@@ -367,16 +367,17 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
         """
         concrete_model = model._meta.concrete_model
         cache_key = f"{self.get_for_model_source.cache_key_prefix}.{concrete_model._meta.label_lower}.{hidden}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+        def get_queryset():
             content_type = ContentType.objects.get_for_model(concrete_model)
             queryset = (
                 self.get_queryset().filter(source_type=content_type).select_related("source_type", "destination_type")
             )  # You almost always will want access to the source_type/destination_type
             if hidden is not None:
                 queryset = queryset.filter(source_hidden=hidden)
-            cache.set(cache_key, queryset)
-        return queryset
+            return queryset
+
+        return get_cached_value(self.get_for_model_source.cache_key_prefix, cache_key, get_queryset)
 
     get_for_model_source.cache_key_prefix = "nautobot.extras.relationship.get_for_model_source"
 
@@ -390,8 +391,8 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
         """
         concrete_model = model._meta.concrete_model
         cache_key = f"{self.get_for_model_destination.cache_key_prefix}.{concrete_model._meta.label_lower}.{hidden}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+        def get_queryset():
             content_type = ContentType.objects.get_for_model(concrete_model)
             queryset = (
                 self.get_queryset()
@@ -400,8 +401,9 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
             )  # You almost always will want access to the source_type/destination_type
             if hidden is not None:
                 queryset = queryset.filter(destination_hidden=hidden)
-            cache.set(cache_key, queryset)
-        return queryset
+            return queryset
+
+        return get_cached_value(self.get_for_model_destination.cache_key_prefix, cache_key, get_queryset)
 
     get_for_model_destination.cache_key_prefix = "nautobot.extras.relationship.get_for_model_destination"
 
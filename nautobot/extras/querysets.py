@@ -79,6 +79,16 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
     This allows the annotation to be entirely optional.
     """
 
+    def update(self, **kwargs):
+        """
+        Update the given fields of all objects in this queryset, invalidating their stored rendered ConfigContext data.
+        """
+        if settings.CONFIG_CONTEXT_CACHE_ENABLED:
+            from nautobot.extras.config_context_cache import invalidate_config_context_cache_for_objects
+
+            invalidate_config_context_cache_for_objects(self.model, self.values_list("pk", flat=True))
+        return super().update(**kwargs)
+
     def annotate_config_context_data(self):
         """
         Attach the subquery annotation to the base queryset.
@@ -199,6 +209,64 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
             static_group_associations__associated_object_id=obj.id,
         )
 
+    def update_cached_members_for_objects(self, model, pks):
+        """
+        Re-evaluate the membership of only the given objects in each filter- or set-based group of this queryset.
+
+        Cached members are added or removed as needed for each group assignable to the given model, using one
+        membership query per group, rather than recomputing the entire membership of each group as
+        `DynamicGroup.update_cached_members()` does. Objects that no longer exist are removed from all groups.
+
+        Args:
+            model (Model): The model class of the objects to re-evaluate.
+            pks (iterable): The primary keys of the objects to re-evaluate.
+        """
+        from nautobot.extras.choices import DynamicGroupTypeChoices
+        from nautobot.extras.models import StaticGroupAssociation
+
+        pks = set(pks)
+        groups = list(self.get_for_model(model).exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC))
+        if not pks or not groups:
+            return
+
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+        existing = {
+            (group_pk, object_pk)
+            for group_pk, object_pk in StaticGroupAssociation.all_objects.filter(
+                dynamic_group__in=groups,
+                associated_object_type=content_type,
+                associated_object_id__in=pks,
+            ).values_list("dynamic_group", "associated_object_id")
+        }
+        matching = set()
+        for group in groups:
+            matching.update(
+                (group.pk, object_pk)
+                for object_pk in group._get_group_queryset().filter(pk__in=pks).values_list("pk", flat=True)
+            )
+
+        to_remove = existing - matching
+        if to_remove:
+            query = Q()
+            for group_pk, object_pk in to_remove:
+                query |= Q(dynamic_group=group_pk, associated_object_id=object_pk)
+            StaticGroupAssociation.all_objects.filter(query, associated_object_type=content_type).delete()
+        # Cached/hidden static group associations, so we can use bulk-create to bypass change logging.
+        to_add = matching - existing
+        StaticGroupAssociation.all_objects.bulk_create(
+            [
+                StaticGroupAssociation(
+                    dynamic_group_id=group_pk, associated_object_type=content_type, associated_object_id=object_pk
+                )
+                for group_pk, object_pk in to_add
+            ]
+        )
+        if to_add and settings.CONFIG_CONTEXT_CACHE_ENABLED and settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            # bulk_create() sends no post_save signal to invalidate the stored ConfigContext data of the new members
+            from nautobot.extras.config_context_cache import invalidate_config_context_cache_for_objects
+
+            invalidate_config_context_cache_for_objects(model, {object_pk for _, object_pk in to_add})
+
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
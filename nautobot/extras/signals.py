@@ -3,6 +3,7 @@ import contextvars
 import logging
 import os
 import shutil
+import threading
 import traceback
 
 from db_file_storage.model_utils import delete_file
@@ -21,11 +22,19 @@ import redis.exceptions
 
 from nautobot.core.celery import app, import_jobs
 from nautobot.core.models import BaseModel
+from nautobot.core.utils.cache import invalidate_cached_values
 from nautobot.core.utils.logging import sanitize
 from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
+from nautobot.extras.config_context_cache import (
+    invalidate_config_context_cache,
+    invalidate_config_context_cache_for_objects,
+)
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
+from nautobot.extras.dynamic_group_refresh import enqueue_cache_refresh
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
+    ConfigContextModel,
     ContactAssociation,
     CustomField,
     DynamicGroup,
@@ -35,6 +44,11 @@ from nautobot.extras.models import (
     MetadataType,
     ObjectChange,
     Relationship,
+    Role,
+    StaticGroupAssociation,
+    Tag,
+    TaggedItem,
+    Webhook,
 )
 from nautobot.extras.querysets import NotesQuerySet
 from nautobot.extras.tasks import delete_custom_field_data, provision_field
@@ -79,18 +93,23 @@ def get_user_if_authenticated(user, instance):
 @receiver(post_delete, sender=CustomField.content_types.through)
 @receiver(post_delete, sender=MetadataType)
 @receiver(post_delete, sender=MetadataType.content_types.through)
+@receiver(post_save, sender=Webhook)
+@receiver(m2m_changed, sender=Webhook.content_types.through)
+@receiver(post_delete, sender=Webhook)
 def invalidate_models_cache(sender, **kwargs):
-    """Invalidate the related-models cache for ComputedFields and CustomFields."""
+    """Invalidate the related-models cache for ComputedFields, CustomFields, MetadataTypes, and Webhooks."""
     if sender is CustomField.content_types.through:
         manager = CustomField.objects
     elif sender is MetadataType.content_types.through:
         manager = MetadataType.objects
+    elif sender is Webhook.content_types.through:
+        manager = Webhook.objects
     else:
         manager = sender.objects
 
     with contextlib.suppress(redis.exceptions.ConnectionError):
         # TODO: *maybe* target more narrowly, e.g. only clear the cache for specific related content-types?
-        cache.delete_pattern(f"{manager.get_for_model.cache_key_prefix}.*")
+        invalidate_cached_values(manager.get_for_model.cache_key_prefix)
 
 
 @receiver(post_save, sender=Relationship)
@@ -104,7 +123,90 @@ def invalidate_relationship_models_cache(sender, **kwargs):
     ):
         with contextlib.suppress(redis.exceptions.ConnectionError):
             # TODO: *maybe* target more narrowly, e.g. only clear the cache for specific related content-types?
-            cache.delete_pattern(f"{method.cache_key_prefix}.*")
+            invalidate_cached_values(method.cache_key_prefix)
+
+
+@receiver(post_save, sender=ConfigContext)
+@receiver(post_delete, sender=ConfigContext)
+@receiver(post_save, sender="dcim.DeviceRedundancyGroup")
+@receiver(post_delete, sender="dcim.DeviceRedundancyGroup")
+@receiver(post_save, sender="dcim.DeviceType")
+@receiver(post_delete, sender="dcim.DeviceType")
+@receiver(post_save, sender="dcim.Location")
+@receiver(post_delete, sender="dcim.Location")
+@receiver(post_save, sender="dcim.Platform")
+@receiver(post_delete, sender="dcim.Platform")
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender="tenancy.Tenant")
+@receiver(post_delete, sender="tenancy.Tenant")
+@receiver(post_save, sender="tenancy.TenantGroup")
+@receiver(post_delete, sender="tenancy.TenantGroup")
+@receiver(post_save, sender="virtualization.Cluster")
+@receiver(post_delete, sender="virtualization.Cluster")
+@receiver(post_save, sender="virtualization.ClusterGroup")
+@receiver(post_delete, sender="virtualization.ClusterGroup")
+@receiver(post_delete, sender=Tag)
+def invalidate_config_context_cache_for_all_objects(sender, raw=False, **kwargs):
+    """
+    Invalidate the stored rendered config context data of all objects when a ConfigContext changes.
+
+    The models that a ConfigContext may be assigned through are included since changes to their hierarchy or grouping
+    may change which ConfigContexts apply to an object, and their deletion clears the corresponding field of any related
+    Devices or Virtual Machines without sending a signal for each of them.
+    """
+    if settings.CONFIG_CONTEXT_CACHE_ENABLED and not raw:
+        invalidate_config_context_cache()
+
+
+def config_context_assignments_changed(sender, action, **kwargs):
+    """
+    Invalidate the stored rendered config context data of all objects when the assignments of a ConfigContext change.
+    """
+    if settings.CONFIG_CONTEXT_CACHE_ENABLED and action in ("post_add", "post_remove", "post_clear"):
+        invalidate_config_context_cache()
+
+
+for _field in ConfigContext._meta.many_to_many:
+    m2m_changed.connect(config_context_assignments_changed, sender=_field.remote_field.through)
+
+
+@receiver(post_save, sender="dcim.Device")
+@receiver(post_delete, sender="dcim.Device")
+@receiver(post_save, sender="virtualization.VirtualMachine")
+@receiver(post_delete, sender="virtualization.VirtualMachine")
+def invalidate_config_context_cache_for_object(sender, instance, raw=False, **kwargs):
+    """
+    Invalidate the stored rendered config context data of a Device or Virtual Machine when it is modified or deleted.
+    """
+    if settings.CONFIG_CONTEXT_CACHE_ENABLED and not raw:
+        invalidate_config_context_cache(instance)
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def config_context_model_tags_changed(sender, instance, action, **kwargs):
+    """
+    Invalidate the stored rendered config context data of a Device or Virtual Machine when its tags change.
+    """
+    if (
+        settings.CONFIG_CONTEXT_CACHE_ENABLED
+        and action in ("post_add", "post_remove", "post_clear")
+        and isinstance(instance, ConfigContextModel)
+    ):
+        invalidate_config_context_cache(instance)
+
+
+@receiver(post_save, sender=StaticGroupAssociation)
+@receiver(post_delete, sender=StaticGroupAssociation)
+def config_context_model_dynamic_groups_changed(sender, instance, raw=False, **kwargs):
+    """
+    Invalidate the stored rendered config context data of a Device or Virtual Machine when the Dynamic Groups it is a
+    member of change, if ConfigContexts may be assigned through Dynamic Groups.
+    """
+    if settings.CONFIG_CONTEXT_CACHE_ENABLED and settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED and not raw:
+        model = instance.associated_object_type.model_class()
+        if model is not None and issubclass(model, ConfigContextModel):
+            invalidate_config_context_cache_for_objects(model, [instance.associated_object_id])
 
 
 @receiver(post_save)
@@ -151,9 +253,16 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
         else:
             unique_object_change_id = f"{changed_object_type.pk}__{changed_object_id}"
 
+        if change_context.async_object_changes:
+            # Only record the change once it's committed, so that changes that are rolled back are never logged
+            entry = {"action": action, "instance": instance, "user": user}
+            transaction.on_commit(
+                lambda: change_context.deferred_object_changes.setdefault(unique_object_change_id, [entry])
+            )
+
         # If a change already exists for this change_id, user, and object, update it instead of creating a new one.
         # If the object was deleted then recreated with the same pk (don't do this), change the action to update.
-        if unique_object_change_id in change_context.deferred_object_changes:
+        elif unique_object_change_id in change_context.deferred_object_changes:
             related_changes = ObjectChange.objects.filter(
                 changed_object_type=changed_object_type,
                 changed_object_id=changed_object_id,
@@ -197,6 +306,17 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
         model_updates.labels(instance._meta.model_name).inc()
 
 
+def _record_deferred_deletion(change_context, unique_object_change_id, entry):
+    """Record a committed deletion in the deferred object changes of an asynchronous change context."""
+    entries = change_context.deferred_object_changes.setdefault(unique_object_change_id, [])
+    if entries and entries[-1]["action"] != ObjectChangeActionChoices.ACTION_CREATE:
+        # A deletion supersedes an update of the same object
+        entries[-1] = entry
+    else:
+        # Log the deletion as well as any creation of the object in the same change context
+        entries.append(entry)
+
+
 @receiver(pre_delete)
 def _handle_deleted_object(sender, instance, **kwargs):
     """
@@ -233,10 +353,22 @@ def _handle_deleted_object(sender, instance, **kwargs):
         unique_object_change_id = f"{changed_object_type.pk}__{changed_object_id}__{user.pk}"
         save_new_objectchange = True
 
+        if change_context.async_object_changes:
+            # Only record the deletion once it's committed, so that deletions that are rolled back are never logged
+            entry = {
+                "action": ObjectChangeActionChoices.ACTION_DELETE,
+                "instance": instance,
+                "user": user,
+                "changed_object_id": changed_object_id,
+                "changed_object_type": changed_object_type,
+            }
+            transaction.on_commit(lambda: _record_deferred_deletion(change_context, unique_object_change_id, entry))
+            save_new_objectchange = False
+
         # if a change already exists for this change_id, user, and object, update it instead of creating a new one
         # except in the case that the object was created and deleted in the same change_id
         # we don't want to create a delete change for an object that never existed
-        if unique_object_change_id in change_context.deferred_object_changes:
+        elif unique_object_change_id in change_context.deferred_object_changes:
             cached_related_change = change_context.deferred_object_changes[unique_object_change_id][-1]
             if cached_related_change["action"] != ObjectChangeActionChoices.ACTION_CREATE:
                 cached_related_change["action"] = ObjectChangeActionChoices.ACTION_DELETE
@@ -289,6 +421,22 @@ def _handle_deleted_object(sender, instance, **kwargs):
     model_deletes.labels(instance._meta.model_name).inc()
 
 
+@receiver(post_save, sender=ObjectChange)
+def _record_object_change(sender, instance, raw=False, **kwargs):
+    """
+    Fires when an ObjectChange is saved, to record it in the current change context for dispatch to job hooks and webhooks.
+    """
+    if raw:
+        return
+
+    change_context = change_context_state.get()
+
+    if change_context is None or instance.request_id != change_context.change_id:
+        return
+
+    change_context.record_object_changes([instance])
+
+
 #
 # Content types
 #
@@ -430,6 +578,11 @@ def dynamic_group_update_cached_members(sender, instance, **kwargs):
     else:
         group = instance
 
+    if settings.DYNAMIC_GROUPS_ASYNC_REFRESH_ENABLED:
+        group_pk = group.pk
+        transaction.on_commit(lambda: enqueue_cache_refresh([group_pk], include_ancestors=True))
+        return
+
     group.update_cached_members()
     for ancestor in group.get_ancestors():
         ancestor.update_cached_members()
@@ -439,6 +592,55 @@ post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroup)
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroupMembership)
 
 
+# Objects whose dynamic group memberships are pending re-evaluation, as {model: {pk, ...}}
+_dynamic_group_pending_objects = threading.local()
+
+
+def _update_pending_dynamic_group_memberships():
+    """Re-evaluate the dynamic group memberships of all objects saved since the last call (in this thread)."""
+    pending = getattr(_dynamic_group_pending_objects, "objects", None)
+    _dynamic_group_pending_objects.objects = {}
+    for model, pks in (pending or {}).items():
+        DynamicGroup.objects.update_cached_members_for_objects(model, pks)
+
+
+def queue_dynamic_group_membership_updates(model, pks):
+    """
+    Queue the re-evaluation of the cached Dynamic Group memberships of the given objects, once the current transaction
+    (if any) is committed.
+
+    This is done automatically when an object is saved, but must be done explicitly for objects that are created or
+    updated without sending `post_save`, such as with `bulk_create()`.
+    """
+    if not settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED or not getattr(
+        model, "is_dynamic_group_associable_model", False
+    ):
+        return
+    if not hasattr(_dynamic_group_pending_objects, "objects"):
+        _dynamic_group_pending_objects.objects = {}
+    _dynamic_group_pending_objects.objects.setdefault(model, set()).update(pks)
+    # All objects saved within a transaction are re-evaluated together, once it's committed
+    transaction.on_commit(_update_pending_dynamic_group_memberships)
+
+
+@receiver(post_save)
+def dynamic_group_update_memberships_on_object_save(sender, instance, raw=False, **kwargs):
+    """
+    When an object that can belong to Dynamic Groups is saved, re-evaluate its cached membership in those groups.
+    """
+    if not raw:
+        queue_dynamic_group_membership_updates(sender, [instance.pk])
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def dynamic_group_update_memberships_on_object_tags_changed(sender, instance, action, **kwargs):
+    """
+    When the tags of an object that can belong to Dynamic Groups change, re-evaluate its cached membership in them.
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        queue_dynamic_group_membership_updates(type(instance), [instance.pk])
+
+
 #
 # Jobs
 #
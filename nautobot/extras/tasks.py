@@ -12,6 +12,8 @@ from nautobot.extras.utils import generate_signature
 
 logger = getLogger("nautobot.extras.tasks")
 
+_webhook_session = None
+
 
 @nautobot_task
 def update_custom_field_choice_data(field_id, old_value, new_value, change_context=None):
@@ -154,24 +156,69 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
 
 
 @nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+def save_object_changes(object_change_pks, batch_size=1000):
     """
-    Make a POST request to the defined Webhook
+    Add the `object_data_v2` of the ObjectChanges saved by a change context with `CHANGELOG_ASYNC_ENABLED`, then enqueue
+    any relevant job hooks and webhooks for them.
+
+    `object_data_v2` is only added to a change if its object still exists and is unchanged since, as determined by
+    comparing the object's current `serialize_object()` snapshot to the `object_data` of the change. Otherwise it is
+    left empty, and consumers of the change fall back to its `object_data`.
+
+    Args:
+        object_change_pks (list): The PKs of the ObjectChanges to complete
+        batch_size (int): Number of ObjectChanges to update per query
     """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+    # Circular Import
+    from nautobot.extras.jobs import enqueue_job_hooks_in_bulk
+    from nautobot.extras.models import ObjectChange
+    from nautobot.extras.webhooks import enqueue_webhooks_in_bulk
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
+    object_changes = list(ObjectChange.objects.filter(pk__in=object_change_pks).order_by("time"))
 
-    context = {
-        "event": dict(ObjectChangeActionChoices)[event].lower(),
-        "timestamp": timestamp,
-        "model": model_name,
-        "username": username,
-        "request_id": request_id,
-        "data": data,
-        "snapshots": snapshots,
-    }
+    object_ids_by_type = {}
+    for objectchange in object_changes:
+        object_ids_by_type.setdefault(objectchange.changed_object_type_id, set()).add(objectchange.changed_object_id)
+    instances = {}
+    for content_type_pk, object_ids in object_ids_by_type.items():
+        model = ContentType.objects.get_for_id(content_type_pk).model_class()
+        if model is None:
+            continue
+        for instance in model.objects.filter(pk__in=object_ids):
+            instances[(content_type_pk, instance.pk)] = instance
 
+    updated_object_changes = []
+    for objectchange in object_changes:
+        instance = instances.get((objectchange.changed_object_type_id, objectchange.changed_object_id))
+        if instance is None:
+            continue
+        current_objectchange = instance.to_objectchange(objectchange.action)
+        if current_objectchange is None or current_objectchange.object_data != objectchange.object_data:
+            logger.debug("Not adding object_data_v2 to %s, as %s has changed since", objectchange, instance)
+            continue
+        objectchange.object_data_v2 = current_objectchange.object_data_v2
+        updated_object_changes.append(objectchange)
+
+    ObjectChange.objects.bulk_update(updated_object_changes, ["object_data_v2"], batch_size=batch_size)
+
+    enqueue_job_hooks_in_bulk(object_changes)
+    enqueue_webhooks_in_bulk(object_changes)
+
+    return len(updated_object_changes)
+
+
+def _get_webhook_session():
+    """Return this process's shared `requests.Session` for webhooks, so that connections to receivers are reused."""
+    global _webhook_session
+    if _webhook_session is None:
+        _webhook_session = requests.Session()
+    return _webhook_session
+
+
+def _send_webhook_request(webhook, context):
+    """
+    Render and send the request for the given Webhook and context, raising an exception if it fails.
+    """
     # Build the headers for the HTTP request
     headers = {
         "Content-Type": webhook.http_content_type,
@@ -196,7 +243,6 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -209,11 +255,8 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
 
     # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    verify = webhook.ca_file_path or webhook.ssl_verification
+    response = _get_webhook_session().send(prepared_request, proxies=settings.HTTP_PROXIES, verify=verify)
 
     if response.ok:
         logger.info("Request succeeded; response status %s", response.status_code)
@@ -223,3 +266,73 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+def _get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots):
+    return {
+        "event": dict(ObjectChangeActionChoices)[event].lower(),
+        "timestamp": timestamp,
+        "model": model_name,
+        "username": username,
+        "request_id": request_id,
+        "data": data,
+        "snapshots": snapshots,
+    }
+
+
+@nautobot_task
+def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = _get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots)
+
+    logger.info(
+        "Sending %s request to %s (%s %s)", webhook.http_method, webhook.payload_url, model_name, context["event"]
+    )
+    return _send_webhook_request(webhook, context)
+
+
+@nautobot_task
+def process_webhook_batch(webhook_pk, events):
+    """
+    Make a single request to the defined Webhook for multiple events.
+
+    Args:
+        webhook_pk (uuid4): The PK of a Webhook with `batch_delivery` enabled
+        events (list): The arguments of `process_webhook()` (other than `webhook_pk`) for each event
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = {"events": [_get_webhook_context(*event) for event in events]}
+
+    logger.info("Sending %s request to %s (%d events)", webhook.http_method, webhook.payload_url, len(events))
+    return _send_webhook_request(webhook, context)
+
+
+@nautobot_task
+def refresh_dynamic_group_cached_members(dynamic_group_pk):
+    """
+    Refresh the cached members of a single DynamicGroup, as scheduled by `dynamic_group_refresh.enqueue_cache_refresh()`.
+
+    Args:
+        dynamic_group_pk (uuid4): The PK of the DynamicGroup to refresh
+    """
+    from nautobot.extras.dynamic_group_refresh import clear_pending_refresh  # avoiding circular import
+    from nautobot.extras.models import DynamicGroup
+
+    # Any request to refresh this group made from now on will need to see the changes that prompted it
+    clear_pending_refresh(dynamic_group_pk)
+    try:
+        group = DynamicGroup.objects.get(pk=dynamic_group_pk)
+    except DynamicGroup.DoesNotExist:
+        logger.warning("Dynamic group with ID %s not found, skipping refresh of its cached members.", dynamic_group_pk)
+        return None
+
+    group.update_cached_members()
+    logger.info("Refreshed the cached members of dynamic group %s (%d members)", group, group.count)
+    return group.count
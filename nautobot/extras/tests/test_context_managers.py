@@ -1,6 +1,9 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.db import transaction
+from django.test import override_settings, TestCase
 
 from nautobot.core.celery import app
 from nautobot.core.testing import TransactionTestCase
@@ -20,7 +23,8 @@ from nautobot.extras.context_managers import (
     deferred_change_logging_for_bulk_operation,
     web_request_context,
 )
-from nautobot.extras.models import Status, Webhook
+from nautobot.extras.models import ObjectChange, Status, Webhook
+from nautobot.extras.signals import change_context_state
 from nautobot.extras.utils import bulk_delete_with_bulk_change_logging
 
 # Use the proper swappable User model
@@ -179,6 +183,34 @@ class WebRequestContextTestCase(TestCase):
         with self.subTest():
             self.assertEqual(oc_list[0].change_context_detail, "test_change_log_context")
 
+    def test_no_changes_dispatched_without_queries(self):
+        """Test that a context without any changes doesn't query for changes to dispatch"""
+        with self.assertNumQueries(0):
+            with web_request_context(self.user):
+                pass
+
+    @mock.patch("nautobot.extras.context_managers.enqueue_webhooks_in_bulk")
+    def test_rolled_back_changes_not_dispatched(self, mock_enqueue_webhooks):
+        """Test that only the changes saved in the context, and not rolled back, are dispatched to webhooks"""
+        location_type = LocationType.objects.get(name="Campus")
+        location_status = Status.objects.get_for_model(Location).first()
+        with web_request_context(self.user):
+            location = Location.objects.create(
+                name="Test Location 1", location_type=location_type, status=location_status
+            )
+            try:
+                with transaction.atomic():
+                    Location.objects.create(name="Test Location 2", location_type=location_type, status=location_status)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        mock_enqueue_webhooks.assert_called_once()
+        self.assertEqual(
+            list(mock_enqueue_webhooks.call_args[0][0]),
+            list(get_changes_for_model(location).filter(changed_object_id=location.pk)),
+        )
+
     def test_change_webhook_enqueued(self):
         """Test that the webhook resides on the queue"""
         # TODO(john): come back to this with a way to actually do it without a running worker
@@ -196,6 +228,114 @@ class WebRequestContextTestCase(TestCase):
         # self.assertEqual(job.args[2], "site")
 
 
+@override_settings(CHANGELOG_ASYNC_ENABLED=True)
+class AsyncWebRequestContextTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="jacob",
+            email="jacob@example.com",
+            password="top_secret",  # noqa: S106  # hardcoded-password-func-arg -- ok as this is test code only
+        )
+        self.location_type = LocationType.objects.get(name="Campus")
+        self.location_status = Status.objects.get_for_model(Location).first()
+
+    def test_change_log_created_after_request(self):
+        """Test that changes are logged once the context exits"""
+        deleted_location = Location.objects.create(
+            name="Test Location 0", location_type=self.location_type, status=self.location_status
+        )
+        deleted_location_pk = deleted_location.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                location = Location(
+                    name="Test Location 1", location_type=self.location_type, status=self.location_status
+                )
+                location.save()
+                location.description = "changed"
+                location.save()
+                deleted_location.delete()
+                change_id = change_context_state.get().change_id
+                self.assertFalse(ObjectChange.objects.filter(request_id=change_id).exists())
+
+        oc_list = get_changes_for_model(Location).filter(changed_object_id=location.pk)
+        self.assertEqual(len(oc_list), 1)
+        self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc_list[0].request_id, change_id)
+        self.assertEqual(oc_list[0].user, self.user)
+        self.assertEqual(oc_list[0].change_context, ObjectChangeEventContextChoices.CONTEXT_ORM)
+        self.assertEqual(oc_list[0].object_data_v2["description"], "changed")
+
+        oc_list = get_changes_for_model(Location).filter(changed_object_id=deleted_location_pk)
+        self.assertEqual(len(oc_list), 1)
+        self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(oc_list[0].request_id, change_id)
+
+    def test_rolled_back_changes_not_logged(self):
+        """Test that changes rolled back within the context, or made by a body that raises, aren't logged"""
+        location = Location.objects.create(
+            name="Test Location 0", location_type=self.location_type, status=self.location_status
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                with self.assertRaises(RuntimeError):
+                    with transaction.atomic():
+                        rolled_back_location = Location.objects.create(
+                            name="Test Location 1", location_type=self.location_type, status=self.location_status
+                        )
+                        location.description = "rolled back"
+                        location.save()
+                        raise RuntimeError
+                kept_location = Location.objects.create(
+                    name="Test Location 2", location_type=self.location_type, status=self.location_status
+                )
+
+        self.assertFalse(get_changes_for_model(Location).filter(changed_object_id=rolled_back_location.pk).exists())
+        self.assertFalse(get_changes_for_model(Location).filter(changed_object_id=location.pk).exists())
+        self.assertTrue(get_changes_for_model(Location).filter(changed_object_id=kept_location.pk).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError):
+                with web_request_context(self.user):
+                    failed_location = Location.objects.create(
+                        name="Test Location 3", location_type=self.location_type, status=self.location_status
+                    )
+                    raise RuntimeError
+        self.assertFalse(get_changes_for_model(Location).filter(changed_object_id=failed_location.pk).exists())
+
+    def test_change_log_records_state_at_change_time(self):
+        """Test that a change logs the object as it was changed, even if it's changed again before the worker runs"""
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                location = Location.objects.create(
+                    name="Test Location 1", location_type=self.location_type, status=self.location_status
+                )
+            # Change the object again before the save_object_changes task runs
+            Location.objects.filter(pk=location.pk).update(description="changed later")
+
+        oc_list = get_changes_for_model(Location).filter(changed_object_id=location.pk)
+        self.assertEqual(len(oc_list), 1)
+        self.assertEqual(oc_list[0].object_data["description"], "")
+        # The current state of the object no longer matches the change, so it's left without object_data_v2
+        self.assertIsNone(oc_list[0].object_data_v2)
+
+    def test_bulk_operation(self):
+        """Test that changes deferred before a nested bulk operation are still logged"""
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                location = Location.objects.create(
+                    name="Test Location 1", location_type=self.location_type, status=self.location_status
+                )
+                with deferred_change_logging_for_bulk_operation():
+                    bulk_location = Location.objects.create(
+                        name="Test Location 2", location_type=self.location_type, status=self.location_status
+                    )
+
+        for obj in (location, bulk_location):
+            oc_list = get_changes_for_model(Location).filter(changed_object_id=obj.pk)
+            self.assertEqual(len(oc_list), 1)
+            self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_CREATE)
+
+
 class WebRequestContextTransactionTestCase(TransactionTestCase):
     def test_change_log_thread_safe(self):
         """
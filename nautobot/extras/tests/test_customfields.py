@@ -1,11 +1,14 @@
 import json
 import logging
+import time
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError
 from django.forms import ChoiceField, IntegerField, NumberInput
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
@@ -16,6 +19,7 @@ from nautobot.core.tables import CustomFieldColumn
 from nautobot.core.testing import APITestCase, TestCase, TransactionTestCase
 from nautobot.core.testing.models import ModelTestCases
 from nautobot.core.testing.utils import post_data
+from nautobot.core.utils import cache as cache_utils
 from nautobot.core.utils.lookup import get_changes_for_model
 from nautobot.dcim.filters import LocationFilterSet
 from nautobot.dcim.forms import RackFilterForm
@@ -453,6 +457,37 @@ class CustomFieldManagerTest(TestCase):
         with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location)
 
+    @override_settings(LOCAL_CACHE_TIMEOUT=60)
+    def test_get_for_model_local_caching(self):
+        """Test that get_for_model is served from process memory, and that it is invalidated by changes."""
+        CustomField.objects.get_for_model(Location)
+        with mock.patch.object(cache_utils.cache, "get", wraps=cache_utils.cache.get) as cache_get:
+            with self.assertNumQueries(0):
+                self.assertEqual(CustomField.objects.get_for_model(Location).count(), 2)
+            cache_get.assert_not_called()
+
+        # Each caller gets its own copy of the cached queryset
+        self.assertIsNot(CustomField.objects.get_for_model(Location), CustomField.objects.get_for_model(Location))
+
+        # Changes made by this process are seen immediately
+        custom_field = CustomField(type=CustomFieldTypeChoices.TYPE_TEXT, label="Test CF1", default="foo")
+        custom_field.save()
+        custom_field.content_types.set([self.content_type])
+        with self.assertNumQueries(1):
+            self.assertEqual(CustomField.objects.get_for_model(Location).count(), 3)
+
+        # Changes made by another process are seen once the version is next checked
+        cache_key = f"{CustomField.objects.get_for_model.cache_key_prefix}.{Location._meta.label_lower}.False"
+        cache_utils.cache.delete(cache_key)
+        cache_utils.cache.set(
+            cache_utils._version_cache_key(CustomField.objects.get_for_model.cache_key_prefix), "changed", timeout=None
+        )
+        with self.assertNumQueries(0):
+            CustomField.objects.get_for_model(Location)
+        with mock.patch.object(cache_utils.time, "monotonic", return_value=time.monotonic() + 120):
+            with self.assertNumQueries(1):
+                CustomField.objects.get_for_model(Location)
+
 
 class CustomFieldDataAPITest(APITestCase):
     """
@@ -1,15 +1,18 @@
 import random
+from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError, QuerySet
+from django.test import override_settings
 from django.urls import reverse
 
 from nautobot.core.forms.fields import MultiMatchModelMultipleChoiceField, MultiValueCharField
 from nautobot.core.forms.widgets import APISelectMultiple, MultiValueCharInput
 from nautobot.core.testing import TestCase
 from nautobot.core.testing.filters import FilterTestCases
-from nautobot.dcim.choices import PortTypeChoices
+from nautobot.dcim.choices import InterfaceTypeChoices, PortTypeChoices
 from nautobot.dcim.filters import DeviceFilterSet
 from nautobot.dcim.forms import DeviceFilterForm, DeviceForm
 from nautobot.dcim.models import (
@@ -17,6 +20,7 @@ from nautobot.dcim.models import (
     Device,
     DeviceType,
     FrontPort,
+    Interface,
     Location,
     LocationType,
     Manufacturer,
@@ -27,19 +31,29 @@ from nautobot.extras.choices import (
     CustomFieldTypeChoices,
     DynamicGroupOperatorChoices,
     DynamicGroupTypeChoices,
+    ObjectChangeActionChoices,
     RelationshipTypeChoices,
 )
+from nautobot.extras.context_managers import web_request_context
+from nautobot.extras.dynamic_group_refresh import (
+    _pending_refresh_cache_key,
+    enqueue_cache_refresh,
+    get_refresh_stages,
+)
 from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershipFilterSet
 from nautobot.extras.models import (
     CustomField,
     DynamicGroup,
     DynamicGroupMembership,
+    ObjectChange,
     Relationship,
     RelationshipAssociation,
     Role,
+    StaticGroupAssociation,
     Status,
     Tag,
 )
+from nautobot.extras.utils import bulk_create_with_bulk_change_logging
 from nautobot.ipam.models import IPAddress, Prefix
 from nautobot.ipam.querysets import PrefixQuerySet
 from nautobot.tenancy.models import Tenant
@@ -329,6 +343,34 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertIsInstance(Prefix.objects.filter(ip_version=6).first().dynamic_groups, QuerySet)
         self.assertIn(sg, list(Prefix.objects.filter(ip_version=6).first().dynamic_groups))
 
+    def test_static_member_operations_change_logging(self):
+        sg = DynamicGroup.objects.create(
+            name="All Prefixes",
+            content_type=ContentType.objects.get_for_model(Prefix),
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+        )
+        sga_ct = ContentType.objects.get_for_model(StaticGroupAssociation)
+        with web_request_context(self.user):
+            sg.members = Prefix.objects.filter(ip_version=4)
+            sg.members = list(Prefix.objects.all())
+        self.assertQuerysetEqualAndNotEmpty(sg.members, Prefix.objects.all())
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=sga_ct, action=ObjectChangeActionChoices.ACTION_CREATE, user=self.user
+            ).count(),
+            Prefix.objects.count(),
+        )
+
+        with web_request_context(self.user):
+            sg.members = Prefix.objects.filter(ip_version=6)
+        self.assertQuerysetEqualAndNotEmpty(sg.members, Prefix.objects.filter(ip_version=6))
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=sga_ct, action=ObjectChangeActionChoices.ACTION_DELETE, user=self.user
+            ).count(),
+            Prefix.objects.filter(ip_version=4).count(),
+        )
+
     # TODO negative test that members=, add_members(), remove_members() raise appropriate errors for non-static groups
 
     def test_members_fail_closed(self):
@@ -1048,6 +1090,124 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertEqual(sorted(list(group.members)), sorted(list(updated_members)))
         self.assertEqual(sorted(list(group.members)), sorted(list(group.members_cached)))
 
+    def test_update_cached_members_for_objects(self):
+        device = self.devices[0]
+        Device.objects.filter(pk=device.pk).update(location=self.locations[2])
+        self.assertIn(self.first_child, device.dynamic_groups)
+        self.assertNotIn(self.second_child, device.dynamic_groups)
+
+        DynamicGroup.objects.update_cached_members_for_objects(Device, [device.pk])
+        self.assertNotIn(self.first_child, device.dynamic_groups)
+        self.assertIn(self.second_child, device.dynamic_groups)
+        # The result is the same as for a full refresh of each group
+        for group in self.groups:
+            cached_members = set(group.members)
+            self.assertEqual(cached_members, set(group.update_cached_members()), group)
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED=True)
+    def test_incremental_updates_on_object_save(self):
+        device = self.devices[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            device.location = self.locations[2]
+            device.save()
+        self.assertNotIn(self.first_child, device.dynamic_groups)
+        self.assertIn(self.second_child, device.dynamic_groups)
+
+        tag = Tag.objects.get_for_model(Device).first()
+        group = DynamicGroup.objects.create(
+            name="Tagged Devices",
+            content_type=self.device_ct,
+            filter={"tags": [tag.name]},
+        )
+        self.assertNotIn(group, device.dynamic_groups)
+        with self.captureOnCommitCallbacks(execute=True):
+            device.tags.add(tag)
+        self.assertIn(group, device.dynamic_groups)
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED=True)
+    def test_incremental_updates_on_bulk_create(self):
+        """Objects created with bulk_create_with_bulk_change_logging() don't send post_save, but are still updated."""
+        device = self.devices[0]
+        group = DynamicGroup.objects.create(
+            name="Device Interfaces",
+            content_type=ContentType.objects.get_for_model(Interface),
+            filter={"device": [device.name]},
+        )
+        interface = Interface(
+            device=device,
+            name="bulk-created",
+            type=InterfaceTypeChoices.TYPE_VIRTUAL,
+            status=Status.objects.get_for_model(Interface).first(),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_create_with_bulk_change_logging([interface])
+        self.assertIn(group, interface.dynamic_groups)
+
+    def test_get_refresh_stages(self):
+        """Test that groups are scheduled to be refreshed after all of their descendants."""
+        self.assertEqual(
+            get_refresh_stages([self.nested_child.pk], include_ancestors=True),
+            [{self.nested_child.pk}, {self.third_child.pk}, {self.parent.pk}],
+        )
+        self.assertEqual(
+            get_refresh_stages([self.parent.pk, self.first_child.pk, self.nested_child.pk, self.no_match_filter.pk]),
+            [{self.first_child.pk, self.nested_child.pk, self.no_match_filter.pk}, {self.parent.pk}],
+        )
+        self.assertEqual(get_refresh_stages([self.nested_child.pk]), [{self.nested_child.pk}])
+
+    @override_settings(DYNAMIC_GROUPS_ASYNC_REFRESH_ENABLED=True)
+    def test_async_refresh_on_group_save(self):
+        """Test that saving a group refreshes its cache and that of its ancestors only once committed."""
+        old_members = set(self.nested_child.members)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.nested_child.filter = {"status": [self.status_2.name]}
+            self.nested_child.save()
+        self.assertEqual(set(self.nested_child.members), old_members)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(set(self.nested_child.members), set(Device.objects.filter(status=self.status_2)))
+        for group in (self.third_child, self.parent):
+            self.assertEqual(set(group.members), set(group._get_group_queryset()), group)
+
+    def test_enqueue_cache_refresh_coalesces_pending_refreshes(self):
+        """Test that a group already waiting to be refreshed isn't enqueued to be refreshed again."""
+        self.nested_child.filter = {"status": [self.status_2.name]}
+        DynamicGroup.objects.filter(pk=self.nested_child.pk).update(filter=self.nested_child.filter)
+        old_members = set(self.nested_child.members)
+        pending_key = _pending_refresh_cache_key(self.nested_child.pk)
+        cache.set(pending_key, True)
+        try:
+            self.assertIsNone(enqueue_cache_refresh([self.nested_child.pk]))
+            self.assertEqual(set(self.nested_child.members), old_members)
+            # A pending parent group still needs to be refreshed after its children
+            enqueue_cache_refresh([self.nested_child.pk, self.third_child.pk, self.parent.pk])
+            self.assertEqual(set(self.nested_child.members), old_members)
+            self.assertEqual(set(self.parent.members), set(self.parent._get_group_queryset()))
+        finally:
+            cache.delete(pending_key)
+
+    def test_enqueue_cache_refresh_marks_only_first_stage_pending(self):
+        """Test that only groups refreshed in the first stage are marked as pending, as later stages may never run."""
+        group_pks = [self.nested_child.pk, self.third_child.pk, self.parent.pk]
+        stages = get_refresh_stages(group_pks)
+        self.assertGreater(len(stages), 1)
+        pending_keys = [_pending_refresh_cache_key(pk) for pk in group_pks]
+        try:
+            # Enqueue the refresh without running it, as if a task of the first stage had failed
+            with mock.patch("nautobot.extras.dynamic_group_refresh.chain") as mock_chain:
+                enqueue_cache_refresh(group_pks)
+            mock_chain.return_value.apply_async.assert_called_once()
+            for pk in stages[0]:
+                self.assertTrue(cache.get(_pending_refresh_cache_key(pk)))
+            for stage in stages[1:]:
+                for pk in stage:
+                    self.assertIsNone(cache.get(_pending_refresh_cache_key(pk)))
+                    # A new request to refresh the group isn't coalesced with the refresh that never ran
+                    self.assertIsNotNone(enqueue_cache_refresh([pk]))
+        finally:
+            cache.delete_many(pending_keys)
+
 
 class DynamicGroupMembershipModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mixin?
     """DynamicGroupMembership model tests."""
@@ -280,6 +280,35 @@ register_jobs(BadJob)
             # Clean up back to normal behavior
             get_jobs(reload=True)
 
+    def test_get_jobs_reload_skips_unchanged_jobs_root(self):
+        """
+        Test that get_jobs(reload=True) only reimports JOBS_ROOT modules if any file in JOBS_ROOT has changed.
+        """
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                with override_settings(JOBS_ROOT=temp_dir):
+                    with open(os.path.join(temp_dir, "my_jobs.py"), "w") as fd:
+                        fd.write("""\
+from nautobot.apps.jobs import Job, register_jobs
+class MyJob(Job):
+    def run(self):
+        pass
+register_jobs(MyJob)
+""")
+                    self.assertIn("my_jobs.MyJob", get_jobs(reload=True))
+
+                    with mock.patch("nautobot.core.celery.import_modules_privately") as mock_import:
+                        self.assertIn("my_jobs.MyJob", get_jobs(reload=True))
+                        mock_import.assert_not_called()
+
+                        with open(os.path.join(temp_dir, "my_jobs.py"), "a") as fd:
+                            fd.write("# changed\n")
+                        get_jobs(reload=True)
+                        mock_import.assert_called_once()
+        finally:
+            # Clean up back to normal behavior
+            get_jobs(reload=True)
+
 
 class JobTransactionTest(TransactionTestCase):
     """
@@ -616,6 +616,95 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         self.assertIn("dynamic context 2", device2.get_config_context().values())
         self.assertNotIn("dynamic context 1", device2.get_config_context().values())
 
+    @override_settings(CONFIG_CONTEXT_CACHE_ENABLED=True)
+    def test_config_context_cache(self):
+        self.device.local_config_context_data = {"local": True}
+        self.device.save()
+        # Treat the data of this test's transaction as committed, so that the cache isn't bypassed
+        with mock.patch("nautobot.extras.config_context_cache._dirty_keys", return_value=set()):
+            with self.captureOnCommitCallbacks(execute=True):
+                context = ConfigContext.objects.create(name="context 2", weight=200, data={"c": 1})
+            expected_data = {"a": 123, "b": 456, "c": 1, "local": True}
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context(), expected_data)
+            with self.assertNumQueries(0):
+                self.assertEqual(self.device.get_config_context(), expected_data)
+
+            # Modifying a ConfigContext invalidates the stored data of all objects
+            with self.captureOnCommitCallbacks(execute=True):
+                context.data = {"c": 2}
+                context.save()
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 2)
+
+            # Modifying the tags of an object invalidates its stored data
+            with self.captureOnCommitCallbacks(execute=True):
+                context.tags.set([self.tag])
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 777)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.device.tags.add(self.tag)
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 2)
+
+            # Modifying an object invalidates its stored data
+            with self.captureOnCommitCallbacks(execute=True):
+                context.locations.set([self.root_location])
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 2)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.device.location = (
+                    Location.objects.exclude(pk=self.location.pk)
+                    .filter(location_type__content_types=ContentType.objects.get_for_model(Device))
+                    .first()
+                )
+                self.device.save()
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 777)
+
+            # The stored data matches the annotated data
+            self.assertEqual(
+                Device.objects.get(pk=self.device.pk).get_config_context(),
+                Device.objects.filter(pk=self.device.pk).annotate_config_context_data().get().get_config_context(),
+            )
+
+    @override_settings(CONFIG_CONTEXT_CACHE_ENABLED=True)
+    def test_config_context_cache_bulk_changes(self):
+        platform = Platform.objects.create(name="Config Context Platform")
+        # Treat the data of this test's transaction as committed, so that the cache isn't bypassed
+        with mock.patch("nautobot.extras.config_context_cache._dirty_keys", return_value=set()):
+            with self.captureOnCommitCallbacks(execute=True):
+                context = ConfigContext.objects.create(name="platform context", weight=200, data={"c": 1})
+                context.platforms.add(platform)
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 777)
+
+            # QuerySet.update() invalidates the stored data of the updated objects
+            with self.captureOnCommitCallbacks(execute=True):
+                Device.objects.filter(pk=self.device.pk).update(platform=platform)
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 1)
+
+            # Deleting a Platform clears the platform of its Devices without sending signals for them
+            with self.captureOnCommitCallbacks(execute=True):
+                platform.delete()
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 777)
+
+    @override_settings(CONFIG_CONTEXT_CACHE_ENABLED=True, CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True)
+    def test_config_context_cache_dynamic_groups(self):
+        # Treat the data of this test's transaction as committed, so that the cache isn't bypassed
+        with mock.patch("nautobot.extras.config_context_cache._dirty_keys", return_value=set()):
+            with self.captureOnCommitCallbacks(execute=True):
+                context = ConfigContext.objects.create(name="dynamic group context", weight=200, data={"c": 1})
+                context.dynamic_groups.add(self.dynamic_group_2)
+                self.dynamic_group_2.update_cached_members()
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 777)
+
+            # Changing the Dynamic Groups that an object is a member of invalidates its stored data
+            with self.captureOnCommitCallbacks(execute=True):
+                self.dynamic_group_2.filter = {"name": ["Device 1"]}
+                self.dynamic_group_2.save()
+                self.dynamic_group_2.update_cached_members()
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 1)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.dynamic_group_2.filter = {"name": ["Device 2"]}
+                self.dynamic_group_2.save()
+                self.dynamic_group_2.update_cached_members()
+            self.assertEqual(Device.objects.get(pk=self.device.pk).get_config_context()["c"], 777)
+
 
 class ConfigContextSchemaTestCase(ModelTestCases.BaseModelTestCase):
     """
@@ -3,6 +3,8 @@ import uuid
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.html import format_html
 
@@ -1331,6 +1333,48 @@ class RelationshipTableTest(RelationshipBaseTest, TestCase):
             for value in col_expected_value:
                 self.assertIn(value, rendered_value)
 
+    def test_relationship_table_render_query_count(self):
+        """Relationship columns should be rendered for a whole page in a constant number of queries."""
+        for i in range(3):
+            RelationshipAssociation.objects.create(
+                relationship=self.o2m_1,
+                source=self.locations[i],
+                destination=self.vlans[i],
+            )
+            RelationshipAssociation.objects.create(
+                relationship=self.o2o_1,
+                source=self.racks[i],
+                destination=self.locations[i],
+            )
+            RelationshipAssociation.objects.create(
+                relationship=self.m2ms_1,
+                source=self.locations[i],
+                destination=self.locations[3],
+            )
+        extra_columns = [
+            ("cr_location_vlan_src", RelationshipColumn(self.o2m_1, side=RelationshipSideChoices.SIDE_SOURCE)),
+            (
+                "cr_primary_rack_location_dst",
+                RelationshipColumn(self.o2o_1, side=RelationshipSideChoices.SIDE_DESTINATION),
+            ),
+            ("cr_related_locations_peer", RelationshipColumn(self.m2ms_1, side=RelationshipSideChoices.SIDE_PEER)),
+        ]
+
+        def render_relationship_columns(queryset):
+            table = LocationTable(queryset, extra_columns=extra_columns)
+            with CaptureQueriesContext(connection) as context:
+                rendered = [[row.get_cell(name) for name, _ in extra_columns] for row in table.rows]
+            return rendered, len(context.captured_queries)
+
+        render_relationship_columns(Location.objects.filter(pk=self.locations[0].pk))
+        rendered, single_row_query_count = render_relationship_columns(Location.objects.filter(pk=self.locations[0].pk))
+        self.assertIn(self.racks[0].get_absolute_url(), rendered[0][1])
+        rendered, query_count = render_relationship_columns(
+            Location.objects.filter(pk__in=[location.pk for location in self.locations[:3]])
+        )
+        self.assertEqual(len(rendered), 3)
+        self.assertEqual(query_count, single_row_query_count)
+
 
 class RequiredRelationshipTestMixin:
     """Common test mixin for both view and API tests dealing with required relationships."""
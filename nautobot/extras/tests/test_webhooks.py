@@ -20,7 +20,7 @@ from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.models import Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
 from nautobot.extras.utils import generate_signature
 
 User = get_user_model()
@@ -330,7 +330,7 @@ class WebhookTest(APITestCase):
         self.assertEqual(args[6], request_id)
         self.assertNotEqual(args[7], {})
 
-    @patch("nautobot.extras.context_managers.enqueue_webhooks")
+    @patch("nautobot.extras.context_managers.enqueue_webhooks_in_bulk")
     def test_enqueue_webhooks_create_update(self, mock_enqueue_webhooks):
         """
         Make sure only one webhook is enqueued if there's a create and update in the same change context.
@@ -345,7 +345,84 @@ class WebhookTest(APITestCase):
 
         all_changes = get_changes_for_model(location)
         self.assertEqual(all_changes.count(), 1)
-        mock_enqueue_webhooks.assert_called_once_with(all_changes.first())
+        mock_enqueue_webhooks.assert_called_once()
+        self.assertEqual(list(mock_enqueue_webhooks.call_args[0][0]), [all_changes.first()])
+
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_batch_delivery(self, mock_async, mock_batch_async):
+        """
+        Make sure a webhook with batch delivery enabled is enqueued once for all events of a change context.
+        """
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_delivery = True
+        webhook.save()
+        location_type = LocationType.objects.get(name="Campus")
+
+        with web_request_context(self.user):
+            for i in range(3):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        mock_async.assert_not_called()
+        mock_batch_async.assert_called_once()
+        args = mock_batch_async.call_args[1]["args"]
+        self.assertEqual(args[0], webhook.pk)
+        self.assertEqual(sorted(event[0]["name"] for event in args[1]), ["Location 0", "Location 1", "Location 2"])
+        for event in args[1]:
+            self.assertEqual(event[1], "location")
+            self.assertEqual(event[2], ObjectChangeActionChoices.ACTION_CREATE)
+
+    def test_webhooks_process_webhook_batch(self):
+        """
+        Mock a Session.send to inspect the result of `process_webhook_batch()`.
+        """
+        request_id = uuid.uuid4()
+        webhook = Webhook.objects.get(type_create=True)
+        timestamp = str(timezone.now())
+        events = [
+            [{"name": name}, "location", ObjectChangeActionChoices.ACTION_CREATE, timestamp, "admin", request_id, {}]
+            for name in ("Location 1", "Location 2")
+        ]
+
+        def mock_send(_, request, **kwargs):
+            self.assertEqual(request.headers["X-Hook-Signature"], generate_signature(request.body, webhook.secret))
+            body = json.loads(request.body)
+            self.assertEqual([event["data"]["name"] for event in body["events"]], ["Location 1", "Location 2"])
+            for event in body["events"]:
+                self.assertEqual(event["event"], "created")
+                self.assertEqual(event["request_id"], str(request_id))
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        with patch.object(Session, "send", mock_send):
+            process_webhook_batch(webhook.pk, events)
+
+    def test_get_for_model(self):
+        """
+        Make sure the cached webhooks for a model and action are invalidated when a webhook changes.
+        """
+        create_webhook = Webhook.objects.get(type_create=True)
+        self.assertEqual(
+            list(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_CREATE)), [create_webhook]
+        )
+        self.assertEqual(list(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_DELETE)), [])
+
+        create_webhook.enabled = False
+        create_webhook.save()
+        self.assertEqual(list(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_CREATE)), [])
+
+        delete_webhook = Webhook.objects.create(
+            name="Location Delete Webhook", type_delete=True, payload_url="http://localhost/"
+        )
+        self.assertEqual(list(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_DELETE)), [])
+        delete_webhook.content_types.add(ContentType.objects.get_for_model(Location))
+        self.assertEqual(
+            list(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_DELETE)), [delete_webhook]
+        )
 
     def test_all_webhook_supported_models(self):
         """
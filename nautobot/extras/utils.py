@@ -694,6 +694,9 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
     if change_context is None:
         raise ValueError("Change logging must be enabled before using bulk_delete_with_bulk_change_logging")
 
+    # Flush any changes already deferred by the enclosing context, as they would otherwise be reset below
+    change_context.flush_deferred_object_changes()
+    defer_object_changes = change_context.defer_object_changes
     with transaction.atomic():
         try:
             queued_object_changes = []
@@ -703,6 +706,7 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
                     break
                 if len(queued_object_changes) >= batch_size:
                     ObjectChange.objects.bulk_create(queued_object_changes)
+                    change_context.record_object_changes(queued_object_changes)
                     queued_object_changes = []
                 oc = obj.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
                 if oc is not None:
@@ -713,7 +717,54 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
                     oc.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
                     queued_object_changes.append(oc)
             ObjectChange.objects.bulk_create(queued_object_changes)
+            change_context.record_object_changes(queued_object_changes)
             return qs.delete()
         finally:
-            change_context.defer_object_changes = False
+            change_context.defer_object_changes = defer_object_changes
             change_context.reset_deferred_object_changes()
+
+
+def bulk_create_with_bulk_change_logging(objs, batch_size=1000):
+    """
+    Creates the provided (unsaved) instances of a single model with `bulk_create()`, and if change logging is enabled,
+    creates their ObjectChange instances in bulk as well. This operation is wrapped in an atomic transaction.
+
+    As `bulk_create()` doesn't send `post_save`, the Dynamic Group membership updates that it would otherwise trigger
+    are queued for the created instances here.
+
+    Returns the list of created instances.
+    """
+    from nautobot.extras.models import ObjectChange
+    from nautobot.extras.signals import change_context_state, queue_dynamic_group_membership_updates
+
+    objs = list(objs)
+    if not objs:
+        return objs
+
+    change_context = change_context_state.get()
+    with transaction.atomic():
+        objs = type(objs[0]).objects.bulk_create(objs, batch_size=batch_size)
+        queue_dynamic_group_membership_updates(type(objs[0]), [obj.pk for obj in objs])
+        if change_context is None:
+            return objs
+
+        user = change_context.get_user()
+        queued_object_changes = []
+        for obj in objs:
+            if not hasattr(obj, "to_objectchange"):
+                break
+            if len(queued_object_changes) >= batch_size:
+                ObjectChange.objects.bulk_create(queued_object_changes)
+                change_context.record_object_changes(queued_object_changes)
+                queued_object_changes = []
+            oc = obj.to_objectchange(ObjectChangeActionChoices.ACTION_CREATE)
+            if oc is not None:
+                oc.user = user
+                oc.user_name = user.username if user is not None else "Undefined"
+                oc.request_id = change_context.change_id
+                oc.change_context = change_context.context
+                oc.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+                queued_object_changes.append(oc)
+        ObjectChange.objects.bulk_create(queued_object_changes)
+        change_context.record_object_changes(queued_object_changes)
+    return objs
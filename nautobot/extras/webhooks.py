@@ -1,9 +1,12 @@
+from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 
-from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
+
+# Maximum number of events to deliver in a single request to a Webhook with `batch_delivery` enabled
+WEBHOOK_BATCH_MAX_EVENTS = 1000
 
 
 def enqueue_webhooks(object_change):
@@ -11,37 +14,58 @@ def enqueue_webhooks(object_change):
     Find Webhook(s) assigned to this instance + action and enqueue them
     to be processed
     """
-    # Determine whether this type of object supports webhooks
-    app_label = object_change.changed_object_type.app_label
-    model_name = object_change.changed_object_type.model
-    if model_name not in registry["model_features"]["webhooks"].get(app_label, []):
-        return
-
-    # Retrieve any applicable Webhooks
-    content_type = object_change.changed_object_type
-    action_flag = {
-        ObjectChangeActionChoices.ACTION_CREATE: "type_create",
-        ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
-        ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
-    webhooks = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
-
-    if webhooks.exists():
+    enqueue_webhooks_in_bulk([object_change])
+
+
+def enqueue_webhooks_in_bulk(object_changes):
+    """
+    Find the Webhook(s) assigned to each of the given ObjectChanges' instance + action and enqueue them to be processed.
+
+    Webhooks are looked up only once for each distinct combination of changed object type and action. Webhooks with
+    `batch_delivery` enabled are enqueued once for all of their events (in batches of up to `WEBHOOK_BATCH_MAX_EVENTS`)
+    rather than once per event.
+    """
+    webhooks_by_type_and_action = {}
+    batched_events = {}
+    for object_change in object_changes:
+        content_type = ContentType.objects.get_for_id(object_change.changed_object_type_id)
+        model_name = content_type.model
+        key = (content_type.pk, object_change.action)
+        if key not in webhooks_by_type_and_action:
+            webhooks_by_type_and_action[key] = []
+            # Determine whether this type of object supports webhooks
+            model = content_type.model_class()
+            if model is not None and model_name in registry["model_features"]["webhooks"].get(
+                content_type.app_label, []
+            ):
+                # Retrieve any applicable Webhooks
+                webhooks_by_type_and_action[key] = Webhook.objects.get_for_model(model, object_change.action)
+        webhooks = webhooks_by_type_and_action[key]
+        if not webhooks:
+            continue
+
         # fall back to object_data if object_data_v2 is not available
         serialized_data = object_change.object_data_v2
         if serialized_data is None:
             serialized_data = object_change.object_data
 
+        event = [
+            serialized_data,
+            model_name,
+            object_change.action,
+            str(timezone.now()),
+            object_change.user_name,
+            object_change.request_id,
+            object_change.get_snapshots(),
+        ]
+
         # Enqueue the webhooks
         for webhook in webhooks:
-            args = [
-                webhook.pk,
-                serialized_data,
-                model_name,
-                object_change.action,
-                str(timezone.now()),
-                object_change.user_name,
-                object_change.request_id,
-                object_change.get_snapshots(),
-            ]
-            process_webhook.apply_async(args=args)
+            if webhook.batch_delivery:
+                batched_events.setdefault(webhook.pk, []).append(event)
+            else:
+                process_webhook.apply_async(args=[webhook.pk, *event])
+
+    for webhook_pk, events in batched_events.items():
+        for i in range(0, len(events), WEBHOOK_BATCH_MAX_EVENTS):
+            process_webhook_batch.apply_async(args=[webhook_pk, events[i : i + WEBHOOK_BATCH_MAX_EVENTS]])
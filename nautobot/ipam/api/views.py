@@ -1,14 +1,17 @@
-from django.conf import settings
-from django.core.cache import cache
+import itertools
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, extend_schema_view
+import netaddr
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.exceptions import APIException
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.response import Response
+from rest_framework.serializers import as_serializer_error
 
 from nautobot.core.models.querysets import count_related
-from nautobot.core.utils.config import get_settings_or_config
 from nautobot.dcim.models import Location
 from nautobot.extras.api.views import NautobotModelViewSet
 from nautobot.ipam import filters
@@ -156,6 +159,44 @@ class PrefixViewSet(NautobotModelViewSet):
         except Location.MultipleObjectsReturned as e:
             raise self.LocationIncompatibleLegacyBehavior from e
 
+    def _allocate_prefixes(self, request, prefix, requested_prefixes):
+        # Allocate prefixes to the requested objects based on availability within the parent
+        allocated_prefixes = netaddr.IPSet()
+        for requested_prefix in requested_prefixes:
+            # Find the first available prefix of the requested size, skipping any allocated by this request
+            allocated_prefix = next(
+                prefix.iter_available_prefixes(
+                    prefix_length=requested_prefix["prefix_length"], exclude=allocated_prefixes
+                ),
+                None,
+            )
+            if allocated_prefix is None:
+                return Response(
+                    {"detail": "Insufficient space is available to accommodate the requested prefix size(s)"},
+                    status=status.HTTP_204_NO_CONTENT,
+                )
+            requested_prefix["prefix"] = str(allocated_prefix)
+            requested_prefix["namespace"] = prefix.namespace
+
+            # The serializer usage above has mapped "custom_fields" dict to "_custom_field_data".
+            # We need to convert it back to "custom_fields" as we're going to deserialize it a second time below
+            requested_prefix["custom_fields"] = requested_prefix.pop("_custom_field_data", {})
+
+            # Exclude the allocated prefix from subsequent allocations
+            allocated_prefixes.add(allocated_prefix)
+
+        # Initialize the serializer with a list or a single object depending on what was requested
+        context = {"request": request, "depth": 0}
+        if isinstance(request.data, list):
+            serializer = self.get_serializer_class()(data=requested_prefixes, many=True, context=context)
+        else:
+            serializer = self.get_serializer_class()(data=requested_prefixes[0], context=context)
+
+        # Create the new Prefix(es)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
     @extend_schema(methods=["get"], responses={200: serializers.AvailablePrefixSerializer(many=True)})
     @extend_schema(
         methods=["post"],
@@ -173,66 +214,36 @@ class PrefixViewSet(NautobotModelViewSet):
         """
         A convenience method for listing and/or allocating available child prefixes within a parent.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
-        if multiple clients tried to simultaneously request allocation from the same parent prefix.
+        Concurrent allocations from the same parent prefix are serialized by `Prefix.lock_for_allocation()`.
         """
         prefix = get_object_or_404(self.queryset, pk=pk)
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_prefixes", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
-                available_prefixes = prefix.get_available_prefixes()
-
-                # Validate Requested Prefixes' length
-                serializer = serializers.PrefixLengthSerializer(
-                    data=request.data if isinstance(request.data, list) else [request.data],
-                    many=True,
-                    context={
-                        "request": request,
-                        "prefix": prefix,
-                    },
+            # Validate Requested Prefixes' length
+            serializer = serializers.PrefixLengthSerializer(
+                data=request.data if isinstance(request.data, list) else [request.data],
+                many=True,
+                context={
+                    "request": request,
+                    "prefix": prefix,
+                },
+            )
+            serializer.is_valid(raise_exception=True)
+
+            requested_prefixes = serializer.validated_data
+            try:
+                with transaction.atomic():
+                    # Serialize concurrent allocations from this prefix so they can't be handed overlapping space
+                    prefix.lock_for_allocation()
+                    return self._allocate_prefixes(request, prefix, requested_prefixes)
+            except IntegrityError:
+                return Response(
+                    {"detail": "One of the allocated prefixes was concurrently created; please try again"},
+                    status=status.HTTP_409_CONFLICT,
                 )
-                serializer.is_valid(raise_exception=True)
-
-                requested_prefixes = serializer.validated_data
-                # Allocate prefixes to the requested objects based on availability within the parent
-                for requested_prefix in requested_prefixes:
-                    # Find the first available prefix equal to or larger than the requested size
-                    for available_prefix in available_prefixes.iter_cidrs():
-                        if requested_prefix["prefix_length"] >= available_prefix.prefixlen:
-                            allocated_prefix = f"{available_prefix.network}/{requested_prefix['prefix_length']}"
-                            requested_prefix["prefix"] = allocated_prefix
-                            requested_prefix["namespace"] = prefix.namespace
-                            break
-                    else:
-                        return Response(
-                            {"detail": "Insufficient space is available to accommodate the requested prefix size(s)"},
-                            status=status.HTTP_204_NO_CONTENT,
-                        )
-
-                    # The serializer usage above has mapped "custom_fields" dict to "_custom_field_data".
-                    # We need to convert it back to "custom_fields" as we're going to deserialize it a second time below
-                    requested_prefix["custom_fields"] = requested_prefix.pop("_custom_field_data", {})
-
-                    # Remove the allocated prefix from the list of available prefixes
-                    available_prefixes.remove(allocated_prefix)
-
-                # Initialize the serializer with a list or a single object depending on what was requested
-                context = {"request": request, "depth": 0}
-                if isinstance(request.data, list):
-                    serializer = self.get_serializer_class()(data=requested_prefixes, many=True, context=context)
-                else:
-                    serializer = self.get_serializer_class()(data=requested_prefixes[0], context=context)
-
-                # Create the new Prefix(es)
-                serializer.is_valid(raise_exception=True)
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
-            available_prefixes = prefix.get_available_prefixes()
             serializer = serializers.AvailablePrefixSerializer(
-                available_prefixes.iter_cidrs(),
+                prefix.iter_available_prefixes(),
                 many=True,
                 context={
                     "request": request,
@@ -262,79 +273,54 @@ class PrefixViewSet(NautobotModelViewSet):
         By default, the number of IPs returned will be equivalent to PAGINATE_COUNT.
         An arbitrary limit (up to MAX_PAGE_SIZE, if set) may be passed, however results will not be paginated.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
-        if multiple clients tried to simultaneously request allocation from the same parent prefix.
+        Addresses are allocated with `Prefix.allocate_ips()`, which serializes concurrent allocations from the same
+        prefix.
         """
         prefix = get_object_or_404(Prefix.objects.restrict(request.user), pk=pk)
 
         # Create the next available IP within the prefix
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_ips", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
-                # Normalize to a list of objects
-                serializer = serializers.IPAllocationSerializer(
-                    data=request.data if isinstance(request.data, list) else [request.data],
-                    many=True,
-                    context={
-                        "request": request,
-                        "prefix": prefix,
-                    },
-                )
-                serializer.is_valid(raise_exception=True)
-
-                requested_ips = serializer.validated_data
-
-                # Determine if the requested number of IPs is available
-                available_ips = prefix.get_available_ips()
-                if available_ips.size < len(requested_ips):
-                    return Response(
-                        {
-                            "detail": (
-                                f"An insufficient number of IP addresses are available within the prefix {prefix} "
-                                f"({len(requested_ips)} requested, {len(available_ips)} available)"
-                            )
-                        },
-                        status=status.HTTP_204_NO_CONTENT,
-                    )
-
-                # Assign addresses from the list of available IPs and copy Namespace assignment from the parent Prefix
-                available_ips = iter(available_ips)
-                prefix_length = prefix.prefix.prefixlen
-                for requested_ip in requested_ips:
-                    requested_ip["address"] = f"{next(available_ips)}/{prefix_length}"
-                    requested_ip["namespace"] = prefix.namespace
-                    # The serializer usage above has mapped "custom_fields" dict to "_custom_field_data".
-                    # We need to convert it back to "custom_fields" as we're going to deserialize it a second time below
-                    requested_ip["custom_fields"] = requested_ip.pop("_custom_field_data", {})
-
-                # Initialize the serializer with a list or a single object depending on what was requested
-                context = {"request": request, "depth": 0}
-                if isinstance(request.data, list):
-                    serializer = serializers.IPAddressSerializer(data=requested_ips, many=True, context=context)
-                else:
-                    serializer = serializers.IPAddressSerializer(data=requested_ips[0], context=context)
-
-                # Create the new IP address(es)
-                serializer.is_valid(raise_exception=True)
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # Normalize to a list of objects
+            serializer = serializers.IPAllocationSerializer(
+                data=request.data if isinstance(request.data, list) else [request.data],
+                many=True,
+                context={
+                    "request": request,
+                    "prefix": prefix,
+                },
+            )
+            serializer.is_valid(raise_exception=True)
+
+            requested_ips = serializer.validated_data
+            required_relationships_errors = IPAddress.required_related_objects_errors(output_for="api")
+            if required_relationships_errors:
+                raise ValidationError({"relationships": required_relationships_errors})
+
+            # Assign addresses from the list of available IPs, copying Namespace assignment from the parent Prefix
+            try:
+                ip_addresses = prefix.allocate_ips(field_values=requested_ips)
+            except DjangoValidationError as exc:
+                if getattr(exc, "code", None) == "insufficient_addresses":
+                    return Response({"detail": exc.message}, status=status.HTTP_204_NO_CONTENT)
+                if getattr(exc, "code", None) == "allocation_conflict":
+                    return Response({"detail": exc.message}, status=status.HTTP_409_CONFLICT)
+                raise ValidationError(as_serializer_error(exc))
+
+            # Serialize a list or a single object depending on what was requested
+            context = {"request": request, "depth": 0}
+            if isinstance(request.data, list):
+                serializer = serializers.IPAddressSerializer(ip_addresses, many=True, context=context)
+            else:
+                serializer = serializers.IPAddressSerializer(ip_addresses[0], context=context)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         # Determine the maximum number of IPs to return
         else:
-            try:
-                limit = int(request.query_params.get("limit", get_settings_or_config("PAGINATE_COUNT")))
-            except ValueError:
-                limit = get_settings_or_config("PAGINATE_COUNT")
-            if get_settings_or_config("MAX_PAGE_SIZE"):
-                limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE"))
+            # Interpret the limit the same way as the pagination does (a limit of 0 means "up to MAX_PAGE_SIZE, if set")
+            limit = self.paginator.get_limit(request)
 
             # Calculate available IPs within the prefix
-            ip_list = []
-            for index, ip in enumerate(prefix.get_available_ips(), start=1):
-                ip_list.append(ip)
-                if index == limit:
-                    break
+            ip_list = list(itertools.islice(prefix.iter_available_ips(), limit or None))
             serializer = serializers.AvailableIPSerializer(
                 ip_list,
                 many=True,
@@ -0,0 +1,195 @@
+"""
+Bulk maintenance of the `Prefix.parent` and `IPAddress.parent` hierarchy.
+
+Saving a single `Prefix` or `IPAddress` looks up its closest parent and reparents any existing children, which costs
+several queries per object. When loading large amounts of IPAM data this per-object bookkeeping can be deferred with
+`deferred_reparenting()` and the whole hierarchy of each affected Namespace recomputed afterwards in a single sorted
+sweep by `rebuild_prefix_hierarchy()`.
+"""
+
+from contextlib import contextmanager
+import contextvars
+import logging
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+import netaddr
+
+logger = logging.getLogger(__name__)
+
+# Active `DeferredReparentingState`, if any; consulted by `Prefix.save()` and `IPAddress.save()`.
+deferred_reparenting_state = contextvars.ContextVar("deferred_reparenting_state", default=None)
+
+
+class DeferredReparentingState:
+    """Bookkeeping for objects saved while `deferred_reparenting()` is active."""
+
+    def __init__(self):
+        self.namespace_pks = set()
+        self.pending_ip_address_pks = {}
+        self._default_namespace_pk = None
+
+    @property
+    def default_namespace_pk(self):
+        if self._default_namespace_pk is None:
+            from nautobot.ipam.models import get_default_namespace_pk  # avoid circular import
+
+            self._default_namespace_pk = get_default_namespace_pk()
+        return self._default_namespace_pk
+
+    def add_prefix(self, prefix):
+        self.namespace_pks.add(prefix.namespace_id)
+
+    def add_ip_address(self, ip_address):
+        if ip_address.parent_id is not None:
+            self.namespace_pks.add(ip_address.parent.namespace_id)
+            return
+        namespace = getattr(ip_address, "_provided_namespace", None)
+        namespace_pk = getattr(namespace, "pk", namespace) or self.default_namespace_pk
+        self.namespace_pks.add(namespace_pk)
+        self.pending_ip_address_pks.setdefault(namespace_pk, set()).add(ip_address.pk)
+
+
+@contextmanager
+def deferred_reparenting():
+    """
+    Skip the per-object parent lookups and child reparenting normally performed by `Prefix.save()` and
+    `IPAddress.save()`, and instead rebuild the hierarchy of every affected Namespace once on exit.
+
+    This context manager is wrapped in an atomic transaction. IP addresses saved without an explicit `parent` are
+    temporarily stored without one; if no suitable parent Prefix exists for any of them once the hierarchy has been
+    rebuilt, a `ValidationError` is raised and the whole transaction is rolled back.
+
+    Example usage:
+
+    >>> from nautobot.ipam.hierarchy import deferred_reparenting
+    >>> with deferred_reparenting():
+    ...     for cidr in cidrs:
+    ...         Prefix.objects.create(prefix=cidr, namespace=namespace, status=status)
+    """
+    if deferred_reparenting_state.get() is not None:
+        # Nested usage; the outermost context manager will do the rebuild.
+        yield
+        return
+
+    state = DeferredReparentingState()
+    with transaction.atomic():
+        token = deferred_reparenting_state.set(state)
+        try:
+            yield
+        finally:
+            deferred_reparenting_state.reset(token)
+        for namespace_pk in state.namespace_pks:
+            rebuild_prefix_hierarchy(
+                namespace_pk,
+                pending_ip_address_pks=state.pending_ip_address_pks.get(namespace_pk),
+            )
+
+
+def _sort_key(version, address):
+    return (version, int(netaddr.IPAddress(address, version=version)))
+
+
+def rebuild_prefix_hierarchy(namespace, pending_ip_address_pks=None, batch_size=1000):
+    """
+    Recompute the `parent` of every Prefix and IPAddress in the given Namespace in a single sorted sweep.
+
+    Prefixes and IP addresses are each sorted by (ip_version, network/host, prefix_length) and merged; a stack of the
+    currently "open" prefixes is maintained so that the top of the stack is always the closest containing Prefix.
+    Only rows whose parent actually changes are written back. The resulting parents are identical to those that
+    would be assigned by saving each object individually.
+
+    Args:
+        namespace (Namespace, UUID): Namespace (or its primary key) to rebuild.
+        pending_ip_address_pks (set, optional): Primary keys of IP addresses that belong to this Namespace but do not
+            (yet) have a parent Prefix to indicate as much.
+        batch_size (int): Number of rows per `bulk_update()` query.
+
+    Returns:
+        (tuple[int, int]): Number of Prefixes and IPAddresses whose parent was changed.
+    """
+    from nautobot.ipam.models import IPAddress, Prefix  # avoid circular import
+
+    namespace_pk = getattr(namespace, "pk", namespace)
+
+    prefixes = sorted(
+        (
+            (*_sort_key(ip_version, network), prefix_length, _sort_key(ip_version, broadcast)[1], pk, parent_id)
+            for pk, ip_version, network, broadcast, prefix_length, parent_id in Prefix.objects.filter(
+                namespace_id=namespace_pk
+            ).values_list("pk", "ip_version", "network", "broadcast", "prefix_length", "parent_id")
+        ),
+        key=lambda row: row[:3],
+    )
+
+    ip_addresses = IPAddress.objects.filter(parent__namespace_id=namespace_pk)
+    if pending_ip_address_pks:
+        ip_addresses = ip_addresses | IPAddress.objects.filter(pk__in=pending_ip_address_pks)
+    ip_addresses = sorted(
+        (*_sort_key(ip_version, host), pk, parent_id)
+        for pk, ip_version, host, parent_id in ip_addresses.values_list("pk", "ip_version", "host", "parent_id")
+    )
+
+    # IP addresses saved while reparenting was deferred have no parent yet, so the database's (parent, host) uniqueness
+    # constraint could not reject duplicates at the time; catch them here rather than failing the bulk update below.
+    duplicate_ip_addresses = sorted(
+        {
+            str(netaddr.IPAddress(host, version=ip_version))
+            for (ip_version, host, *_), (next_ip_version, next_host, *_) in zip(ip_addresses, ip_addresses[1:])
+            if (ip_version, host) == (next_ip_version, next_host)
+        }
+    )
+    if duplicate_ip_addresses:
+        raise ValidationError(
+            {"address": f"Duplicate IP addresses exist in this Namespace: {', '.join(duplicate_ip_addresses)}"}
+        )
+
+    changed_prefixes = []
+    changed_ip_addresses = []
+    orphaned_ip_addresses = []
+    stack = []  # (ip_version, broadcast, pk) of each currently open prefix, outermost first
+    prefix_index = 0
+
+    def close_prefixes(version, value):
+        # Pop every open prefix that ends before `value` (or belongs to a different IP version).
+        while stack and (stack[-1][0] != version or stack[-1][1] < value):
+            stack.pop()
+
+    def open_prefixes_through(version, value):
+        # Push every prefix that starts at or before `value`, recording its closest parent on the way.
+        nonlocal prefix_index
+        while prefix_index < len(prefixes) and prefixes[prefix_index][:2] <= (version, value):
+            p_version, p_network, _, p_broadcast, p_pk, p_parent_id = prefixes[prefix_index]
+            close_prefixes(p_version, p_network)
+            new_parent_id = stack[-1][2] if stack else None
+            if new_parent_id != p_parent_id:
+                changed_prefixes.append(Prefix(id=p_pk, parent_id=new_parent_id))
+            stack.append((p_version, p_broadcast, p_pk))
+            prefix_index += 1
+
+    for ip_version, host, pk, parent_id in ip_addresses:
+        open_prefixes_through(ip_version, host)
+        close_prefixes(ip_version, host)
+        if not stack:
+            orphaned_ip_addresses.append(str(netaddr.IPAddress(host, version=ip_version)))
+            continue
+        if stack[-1][2] != parent_id:
+            changed_ip_addresses.append(IPAddress(id=pk, parent_id=stack[-1][2]))
+    open_prefixes_through(float("inf"), 0)  # process any prefixes sorting after the last IP address
+
+    if orphaned_ip_addresses:
+        raise ValidationError(
+            {"namespace": f"No suitable parent Prefix exists in this Namespace for {', '.join(orphaned_ip_addresses)}"}
+        )
+
+    with transaction.atomic():
+        Prefix.objects.bulk_update(changed_prefixes, ["parent"], batch_size=batch_size)
+        IPAddress.objects.bulk_update(changed_ip_addresses, ["parent"], batch_size=batch_size)
+
+    logger.debug(
+        "Rebuilt hierarchy of namespace %s: reparented %d prefixes and %d IP addresses",
+        namespace_pk,
+        len(changed_prefixes),
+        len(changed_ip_addresses),
+    )
+    return len(changed_prefixes), len(changed_ip_addresses)
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from nautobot.ipam.hierarchy import rebuild_prefix_hierarchy
+from nautobot.ipam.models import Namespace
+
+
+class Command(BaseCommand):
+    help = "Recompute the parent of every Prefix and IP Address, for example after a bulk data load."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "namespaces",
+            nargs="*",
+            help="Names of the namespaces to rebuild (default: all namespaces)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows to update per query (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        namespaces = Namespace.objects.all()
+        if options["namespaces"]:
+            namespaces = namespaces.filter(name__in=options["namespaces"])
+            missing = set(options["namespaces"]) - set(namespaces.values_list("name", flat=True))
+            if missing:
+                raise CommandError(f"Unknown namespace(s): {', '.join(sorted(missing))}")
+
+        for namespace in namespaces:
+            with transaction.atomic():
+                prefix_count, ip_address_count = rebuild_prefix_hierarchy(namespace, batch_size=options["batch_size"])
+            self.stdout.write(
+                f"Namespace {namespace}: reparented {prefix_count} prefixes and {ip_address_count} IP addresses"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Finished."))
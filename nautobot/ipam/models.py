@@ -1,11 +1,14 @@
+import bisect
+import itertools
 import logging
 import operator
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import MultipleObjectsReturned, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import connections, IntegrityError, models, router, transaction
 from django.db.models import Q
+from django.db.models.signals import post_save
 from django.utils.functional import cached_property
 import netaddr
 
@@ -22,7 +25,9 @@ from nautobot.ipam import choices, constants
 from nautobot.virtualization.models import VMInterface
 
 from .fields import VarbinaryIPField
+from .hierarchy import deferred_reparenting_state
 from .querysets import IPAddressQuerySet, PrefixQuerySet, RIRQuerySet, VLANQuerySet
+from .trie import get_closest_parent
 from .validators import DNSValidator
 
 __all__ = (
@@ -532,6 +537,9 @@ class Prefix(PrimaryModel):
         super().__init__(*args, **kwargs)
         self._deconstruct_prefix(prefix)
 
+        # Save the original namespace, so that a move to another namespace can be detected once saved
+        self._original_namespace_id = self.__dict__.get("namespace_id")
+
     def __str__(self):
         return str(self.prefix)
 
@@ -618,11 +626,15 @@ class Prefix(PrimaryModel):
             # which will (re)set the broadcast and ip_version values of this instance to their correct values.
             self.prefix = self.prefix.cidr
 
+        # When reparenting is deferred, the parent/child hierarchy is rebuilt in bulk afterwards instead.
+        deferred_reparenting = deferred_reparenting_state.get()
+
         # Determine if a parent exists and set it to the closest ancestor by `prefix_length`.
-        supernets = self.supernets()
-        if supernets:
-            parent = max(supernets, key=operator.attrgetter("prefix_length"))
-            self.parent = parent
+        if deferred_reparenting is None:
+            supernets = self.supernets()
+            if supernets:
+                parent = max(supernets, key=operator.attrgetter("prefix_length"))
+                self.parent = parent
 
         # Validate that creation of this prefix does not create an invalid parent/child relationship
         # 3.0 TODO: uncomment this to enforce this constraint
@@ -659,6 +671,10 @@ class Prefix(PrimaryModel):
             if self._location is not None:
                 self.location = self._location
 
+        if deferred_reparenting is not None:
+            deferred_reparenting.add_prefix(self)
+            return
+
         # Determine the subnets and reparent them to this prefix.
         self.reparent_subnets()
         # Determine the child IPs and reparent them to this prefix.
@@ -889,6 +905,164 @@ class Prefix(PrimaryModel):
         )
         return available_ips
 
+    def _iter_available_ranges(self):
+        """
+        Yield (first, last) integer bounds of each contiguous range of space within this prefix not used by any of its
+        descendant Prefixes, in ascending order.
+
+        The descendants are read in order of their network address through a database cursor and merged in a single
+        pass, so memory use doesn't grow with their number.
+        """
+        cursor = self.prefix.first
+        descendants = self.descendants().order_by("network", "prefix_length").values_list("network", "broadcast")
+        for network, broadcast in descendants.iterator():
+            first = int(netaddr.IPAddress(network))
+            if first > cursor:
+                yield cursor, first - 1
+            cursor = max(cursor, int(netaddr.IPAddress(broadcast)) + 1)
+        if cursor <= self.prefix.last:
+            yield cursor, self.prefix.last
+
+    def iter_available_prefixes(self, prefix_length=None, exclude=None):
+        """
+        Lazily yield the available space within this prefix as `netaddr.IPNetwork` objects, in ascending order.
+
+        Unlike `get_available_prefixes()`, this doesn't require loading all descendant Prefixes at once, so taking
+        only the first few results (for example with `itertools.islice()`) is cheap even for very large prefixes.
+
+        Args:
+            prefix_length (int, optional): If specified, yield every available subnet of this length, rather than
+                the largest CIDR blocks making up the available space.
+            exclude (netaddr.IPSet, optional): Additional space to treat as unavailable.
+        """
+        for first, last in self._iter_available_ranges():
+            available_range = netaddr.IPRange(
+                netaddr.IPAddress(first, version=self.ip_version), netaddr.IPAddress(last, version=self.ip_version)
+            )
+            if exclude:
+                cidrs = (netaddr.IPSet(available_range) - exclude).iter_cidrs()
+            else:
+                cidrs = available_range.cidrs()
+            for cidr in cidrs:
+                if prefix_length is None:
+                    yield cidr
+                elif cidr.prefixlen <= prefix_length:
+                    yield from cidr.subnet(prefix_length)
+
+    def iter_available_ips(self):
+        """
+        Lazily yield the available IPs within this prefix as `netaddr.IPAddress` objects, in ascending order.
+
+        Unlike `get_available_ips()`, this walks the sorted host addresses of the child IPAddresses through a
+        database cursor, so taking only the first few results (for example with `itertools.islice()`) is cheap even
+        for very large prefixes.
+        """
+        first, last = self.prefix.first, self.prefix.last
+        # For "normal" IPv4 prefixes, omit first and last addresses;
+        # IPv6, pool, or IPv4 /31-32 prefixes are fully usable
+        if not any(
+            [
+                self.ip_version == 6,
+                self.type == choices.PrefixTypeChoices.TYPE_POOL,
+                self.ip_version == 4 and self.prefix_length >= 31,
+            ]
+        ):
+            first, last = first + 1, last - 1
+
+        cursor = first
+        for host in self.ip_addresses.order_by("host").values_list("host", flat=True).iterator():
+            value = int(netaddr.IPAddress(host))
+            if value > last:
+                break
+            for available in range(cursor, value):
+                yield netaddr.IPAddress(available, version=self.ip_version)
+            cursor = max(cursor, value + 1)
+        for available in range(cursor, last + 1):
+            yield netaddr.IPAddress(available, version=self.ip_version)
+
+    def lock_for_allocation(self):
+        """
+        Lock this prefix against concurrent allocations of child prefixes or IP addresses until the current transaction
+        ends. Must be called within a transaction, before determining which space within this prefix is available.
+
+        On PostgreSQL this takes a transaction-level advisory lock keyed on this prefix, so that the prefix row itself
+        remains writable; on other databases the prefix row is locked with `SELECT ... FOR UPDATE`.
+        """
+        using = router.db_for_write(Prefix, instance=self)
+        connection = connections[using]
+        if connection.vendor == "postgresql":
+            # pg_advisory_xact_lock() takes a signed 64-bit key, so derive one from the first half of the UUID
+            lock_key = int.from_bytes(self.pk.bytes[:8], byteorder="big", signed=True)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_key])
+        else:
+            list(Prefix.objects.using(using).select_for_update().filter(pk=self.pk).values_list("pk", flat=True))
+
+    def allocate_ips(self, count=None, field_values=None, **kwargs):
+        """
+        Create new IPAddresses at the first available addresses within this prefix, in a single transaction.
+
+        Concurrent allocations from this prefix are serialized by `lock_for_allocation()`; allocations from other
+        prefixes are not blocked. The new IPAddresses are validated, then inserted with a single `bulk_create()`.
+
+        Args:
+            count (int): Number of IPAddresses to create. May be omitted if `field_values` is specified.
+            field_values (list[dict]): Field values (such as `status` or `tags`) for each new IPAddress, if they differ.
+            **kwargs: Field values common to all of the new IPAddresses.
+
+        Returns:
+            (list[IPAddress]): The newly created IPAddresses.
+
+        Raises:
+            ValidationError: If fewer than the requested number of addresses are available, if any of the new
+                IPAddresses is invalid, or if one of the addresses was concurrently created other than by an allocation.
+        """
+        if field_values is None:
+            field_values = [{} for _ in range(count)]
+        field_values = [{**kwargs, **values} for values in field_values]
+
+        try:
+            with transaction.atomic():
+                self.lock_for_allocation()
+                return self._allocate_ips(field_values)
+        except IntegrityError as exc:
+            raise ValidationError(
+                f"IP addresses could not be allocated within the prefix {self} "
+                "as one of them was concurrently created; please try again",
+                code="allocation_conflict",
+            ) from exc
+
+    def _allocate_ips(self, field_values):
+        count = len(field_values)
+        addresses = list(itertools.islice(self.iter_available_ips(), count))
+        if len(addresses) < count:
+            raise ValidationError(
+                f"An insufficient number of IP addresses are available within the prefix {self} "
+                f"({count} requested, {len(addresses)} available)",
+                code="insufficient_addresses",
+            )
+
+        ip_addresses = []
+        ip_address_tags = []
+        for address, values in zip(addresses, field_values):
+            values = values.copy()
+            ip_address_tags.append(values.pop("tags", None))
+            ip_address = IPAddress(address=f"{address}/{self.prefix_length}", namespace=self.namespace, **values)
+            # Uniqueness is enforced by the database below
+            ip_address.full_clean(validate_unique=False)
+            ip_addresses.append(ip_address)
+        ip_addresses = IPAddress.objects.bulk_create(ip_addresses)
+
+        # bulk_create() bypasses IPAddress.save(), so replicate its side effects (signals, deferred reparenting)
+        deferred_reparenting = deferred_reparenting_state.get()
+        for ip_address, tags in zip(ip_addresses, ip_address_tags):
+            if deferred_reparenting is not None:
+                deferred_reparenting.add_ip_address(ip_address)
+            post_save.send(sender=IPAddress, instance=ip_address, created=True, raw=False, using=ip_address._state.db)
+            if tags:
+                ip_address.tags.set(tags)
+        return ip_addresses
+
     def get_child_ips(self):
         """
         Return IP addresses with this prefix as parent.
@@ -910,19 +1084,16 @@ class Prefix(PrimaryModel):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
-            return None
-        return available_prefixes.iter_cidrs()[0]
+        return next(self.iter_available_prefixes(), None)
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        available_ip = next(self.iter_available_ips(), None)
+        if available_ip is None:
             return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        return f"{available_ip}/{self.prefix_length}"
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -935,37 +1106,144 @@ class Prefix(PrimaryModel):
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
-        denominator = self.prefix.size
-        child_ips = netaddr.IPSet()
-        child_prefixes = netaddr.IPSet()
+        return self.get_bulk_utilization([self])[self.pk]
+
+    @classmethod
+    def get_bulk_utilization(cls, prefixes):
+        """
+        Compute the utilization of each of the given prefixes, as per `get_utilization()`, in a fixed number of queries.
+
+        The direct child prefixes of all given prefixes are retrieved in a single query and merged into sorted,
+        non-overlapping ranges. IP addresses are counted with a single aggregate query for prefixes without child
+        prefixes, and are otherwise retrieved in a single query and merged against those ranges in one linear pass.
+
+        Args:
+            prefixes (list[Prefix]): Prefixes to compute the utilization of, such as a page of a list view.
+
+        Returns:
+            (dict): `{prefix.pk: UtilizationData}` for each of the given `prefixes`.
+        """
+        prefixes = list(prefixes)
+        if not prefixes:
+            return {}
+
+        def to_int(address, ip_version):
+            return int(netaddr.IPAddress(address, version=ip_version))
+
+        def host_range_q(prefix):
+            return Q(
+                parent__namespace_id=prefix.namespace_id,
+                ip_version=prefix.ip_version,
+                host__gte=prefix.network,
+                host__lte=prefix.broadcast,
+            )
+
+        # Ranges covered by child prefixes; pools only count their IP addresses towards utilization
+        child_ranges = {prefix.pk: [] for prefix in prefixes}
+        child_parent_pks = [prefix.pk for prefix in prefixes if prefix.type != choices.PrefixTypeChoices.TYPE_POOL]
+        if child_parent_pks:
+            for parent_pk, ip_version, network, broadcast in (
+                cls.objects.filter(parent_id__in=child_parent_pks)
+                .order_by()
+                .values_list("parent_id", "ip_version", "network", "broadcast")
+                .iterator()
+            ):
+                child_ranges[parent_pk].append((to_int(network, ip_version), to_int(broadcast, ip_version)))
+        for pk, ranges in child_ranges.items():
+            merged = []
+            for first, last in sorted(ranges):
+                if merged and first <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], last)
+                else:
+                    merged.append([first, last])
+            child_ranges[pk] = merged
 
         # 3.0 TODO: In the long term, TYPE_POOL prefixes will be disallowed from directly containing IPAddresses,
         # and the addresses will instead be parented to the containing TYPE_NETWORK prefix. It should be possible to
         # change this when that is the case, see #3873 for historical context.
-        if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
-            pool_ips = IPAddress.objects.filter(
-                parent__namespace=self.namespace, host__gte=self.network, host__lte=self.broadcast
-            ).values_list("host", flat=True)
-            child_ips = netaddr.IPSet(pool_ips)
-
-        if self.type != choices.PrefixTypeChoices.TYPE_POOL:
-            child_prefixes = netaddr.IPSet(p.prefix for p in self.children.only("network", "prefix_length").iterator())
-
-        numerator_set = child_ips | child_prefixes
+        ip_prefixes = [prefix for prefix in prefixes if prefix.type != choices.PrefixTypeChoices.TYPE_CONTAINER]
+        counted_prefixes = [prefix for prefix in ip_prefixes if not child_ranges[prefix.pk]]
+        merged_prefixes = [prefix for prefix in ip_prefixes if child_ranges[prefix.pk]]
+        merged_prefix_pks = {prefix.pk for prefix in merged_prefixes}
+
+        # Prefixes without child prefixes: count the distinct hosts in range, and whether the network/broadcast is used
+        ip_counts = {}
+        if counted_prefixes:
+            aggregates = {}
+            query = Q()
+            for i, prefix in enumerate(counted_prefixes):
+                query |= host_range_q(prefix)
+                aggregates[f"hosts_{i}"] = models.Count("host", distinct=True, filter=host_range_q(prefix))
+                aggregates[f"edges_{i}"] = models.Count(
+                    "host",
+                    filter=Q(
+                        parent__namespace_id=prefix.namespace_id,
+                        ip_version=prefix.ip_version,
+                        host__in=[prefix.network, prefix.broadcast],
+                    ),
+                )
+            counts = IPAddress.objects.filter(query).aggregate(**aggregates)
+            for i, prefix in enumerate(counted_prefixes):
+                ip_counts[prefix.pk] = (counts[f"hosts_{i}"], counts[f"edges_{i}"] > 0)
+
+        # Prefixes with child prefixes: only hosts not already covered by a child prefix are added to the numerator
+        hosts = {}
+        if merged_prefixes:
+            query = Q()
+            for prefix in merged_prefixes:
+                query |= host_range_q(prefix)
+            for namespace_pk, ip_version, host in (
+                IPAddress.objects.filter(query)
+                .order_by()
+                .values_list("parent__namespace_id", "ip_version", "host")
+                .iterator()
+            ):
+                hosts.setdefault((namespace_pk, ip_version), set()).add(to_int(host, ip_version))
+            hosts = {key: sorted(values) for key, values in hosts.items()}
+
+        utilization = {}
+        for prefix in prefixes:
+            first, last = prefix.prefix.first, prefix.prefix.last
+            ranges = child_ranges[prefix.pk]
+            numerator = sum(range_last - range_first + 1 for range_first, range_last in ranges)
+            edges_used = any(
+                range_first <= address <= range_last for range_first, range_last in ranges for address in (first, last)
+            )
 
-        # Exclude network and broadcast address from the denominator unless they've been assigned to an IPAddress or child pool.
-        # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
-        if all(
-            [
-                denominator > 2,
-                self.type == choices.PrefixTypeChoices.TYPE_NETWORK,
-                self.ip_version == 4,
-            ]
-        ):
-            if not any([self.network in numerator_set, self.broadcast in numerator_set]):
+            if prefix.pk in ip_counts:
+                host_count, hosts_on_edges = ip_counts[prefix.pk]
+                numerator += host_count
+                edges_used = edges_used or hosts_on_edges
+            elif prefix.pk in merged_prefix_pks:
+                namespace_hosts = hosts.get((prefix.namespace_id, prefix.ip_version), [])
+                prefix_hosts = namespace_hosts[
+                    bisect.bisect_left(namespace_hosts, first) : bisect.bisect_right(namespace_hosts, last)
+                ]
+                range_index = 0
+                for host in prefix_hosts:
+                    while range_index < len(ranges) and ranges[range_index][1] < host:
+                        range_index += 1
+                    if range_index == len(ranges) or host < ranges[range_index][0]:
+                        numerator += 1
+                if prefix_hosts and (prefix_hosts[0] == first or prefix_hosts[-1] == last):
+                    edges_used = True
+
+            # Exclude network and broadcast address from the denominator unless they've been assigned to an IPAddress or child pool.
+            # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
+            denominator = prefix.prefix.size
+            if all(
+                [
+                    denominator > 2,
+                    prefix.type == choices.PrefixTypeChoices.TYPE_NETWORK,
+                    prefix.ip_version == 4,
+                    not edges_used,
+                ]
+            ):
                 denominator -= 2
 
-        return UtilizationData(numerator=numerator_set.size, denominator=denominator)
+            utilization[prefix.pk] = UtilizationData(numerator=numerator, denominator=denominator)
+
+        return utilization
 
 
 @extras_features("graphql")
@@ -1103,13 +1381,13 @@ class IPAddress(PrimaryModel):
         empty_values = [None, b"", ""]
         if self.host in empty_values or self.mask_length in empty_values:
             return None
+        # When reparenting is deferred, the parent is assigned in bulk afterwards instead.
+        if deferred_reparenting_state.get() is not None:
+            return None
         try:
-            closest_parent = (
-                Prefix.objects.filter(namespace=self._namespace)
-                # 3.0 TODO: disallow IPAddress from parenting to a TYPE_POOL prefix, instead pick closest TYPE_NETWORK
-                # .exclude(type=choices.PrefixTypeChoices.TYPE_POOL)
-                .get_closest_parent(self.host, include_self=True)
-            )
+            # 3.0 TODO: disallow IPAddress from parenting to a TYPE_POOL prefix, instead pick closest TYPE_NETWORK
+            # .exclude(type=choices.PrefixTypeChoices.TYPE_POOL)
+            closest_parent = get_closest_parent(self._namespace, self.host, include_self=True)
             return closest_parent
         except Prefix.DoesNotExist as e:
             raise ValidationError({"namespace": "No suitable parent Prefix exists in this Namespace"}) from e
@@ -1158,6 +1436,10 @@ class IPAddress(PrimaryModel):
 
         super().save(*args, **kwargs)
 
+        deferred_reparenting = deferred_reparenting_state.get()
+        if deferred_reparenting is not None:
+            deferred_reparenting.add_ip_address(self)
+
     @property
     def address(self):
         if self.host is not None and self.mask_length is not None:
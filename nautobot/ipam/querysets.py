@@ -8,6 +8,7 @@ import netaddr
 from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.data import merge_dicts_without_collision
 from nautobot.ipam.mixins import LocationToLocationsQuerySetMixin
+from nautobot.ipam.trie import get_closest_parent
 
 
 class RIRQuerySet(RestrictedQuerySet):
@@ -399,7 +400,7 @@ class IPAddressQuerySet(BaseNetworkQuerySet):
         return super().order_by("host")
 
     def get_or_create(self, **kwargs):
-        from nautobot.ipam.models import get_default_namespace, Prefix
+        from nautobot.ipam.models import get_default_namespace
 
         parent = kwargs.get("parent")
         namespace = kwargs.pop("namespace", None)
@@ -419,7 +420,7 @@ class IPAddressQuerySet(BaseNetworkQuerySet):
                 netaddr.IPNetwork(cidr)
             except netaddr.AddrFormatError as err:
                 raise ValidationError(f"{cidr} does not appear to be an IPv4 or IPv6 network.") from err
-            parent = Prefix.objects.filter(namespace=namespace).get_closest_parent(cidr=cidr, include_self=True)
+            parent = get_closest_parent(namespace, cidr, include_self=True)
             kwargs["parent"] = parent
         return super().get_or_create(**kwargs)
 
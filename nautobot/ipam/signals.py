@@ -1,7 +1,8 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import Q
-from django.db.models.signals import m2m_changed, pre_delete, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from nautobot.ipam.models import (
@@ -13,6 +14,7 @@ from nautobot.ipam.models import (
     VRFDeviceAssignment,
     VRFPrefixAssignment,
 )
+from nautobot.ipam.trie import update_prefix_trie
 
 
 @receiver(pre_save, sender=VRFDeviceAssignment)
@@ -131,3 +133,26 @@ def assert_locations_content_types(sender, instance, action, reverse, model, pk_
             raise ValidationError(
                 {key: f"{instance} is a {instance.location_type} and may not have {label} associated to it."}
             )
+
+
+@receiver(post_save, sender=Prefix)
+def prefix_saved_update_prefix_trie(sender, instance, **kwargs):
+    """
+    Update any cached `PrefixTrie` affected by the creation or modification of a Prefix.
+    """
+    if not settings.IPAM_PREFIX_TRIE_ENABLED:
+        return
+    original_namespace_id = instance._original_namespace_id
+    if original_namespace_id is not None and original_namespace_id != instance.namespace_id:
+        update_prefix_trie(original_namespace_id, instance.pk)
+    update_prefix_trie(instance.namespace_id, instance.pk, instance.prefix)
+    instance._original_namespace_id = instance.namespace_id
+
+
+@receiver(post_delete, sender=Prefix)
+def prefix_deleted_update_prefix_trie(sender, instance, **kwargs):
+    """
+    Update any cached `PrefixTrie` affected by the deletion of a Prefix.
+    """
+    if settings.IPAM_PREFIX_TRIE_ENABLED:
+        update_prefix_trie(instance.namespace_id, instance.pk)
@@ -37,9 +37,9 @@ from .models import (
 
 AVAILABLE_LABEL = mark_safe('<span class="label label-success">Available</span>')  # noqa: S308  # suspicious-mark-safe-usage -- known safe string here
 
-UTILIZATION_GRAPH = """
+PREFIX_UTILIZATION_GRAPH = """
 {% load helpers %}
-{% if record.present_in_database %}{% utilization_graph record.get_utilization %}{% else %}&mdash;{% endif %}
+{% if record.present_in_database %}{% utilization_graph value %}{% else %}&mdash;{% endif %}
 """
 
 
@@ -397,8 +397,28 @@ class PrefixTable(StatusTableMixin, RoleTableMixin, BaseTable):
         }
 
 
+class PrefixUtilizationColumn(tables.TemplateColumn):
+    """
+    Display the utilization of each Prefix, computed for all Prefixes in the current page of the table at once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("orderable", False)
+        super().__init__(*args, template_code=PREFIX_UTILIZATION_GRAPH, **kwargs)
+
+    def render(self, record, table, value, bound_column, **kwargs):
+        if getattr(table, "_prefix_utilization", None) is None:
+            table._prefix_utilization = Prefix.get_bulk_utilization(
+                row.record for row in table.paginated_rows if getattr(row.record, "present_in_database", False)
+            )
+        value = table._prefix_utilization.get(record.pk)
+        if value is None and getattr(record, "present_in_database", False):
+            value = record.get_utilization()
+        return super().render(record, table, value, bound_column, **kwargs)
+
+
 class PrefixDetailTable(PrefixTable):
-    utilization = tables.TemplateColumn(template_code=UTILIZATION_GRAPH, orderable=False)
+    utilization = PrefixUtilizationColumn()
     tenant = TenantColumn()
     tags = TagColumn(url_name="ipam:prefix_list")
 
@@ -6,7 +6,9 @@ from unittest import skip
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
 from django.db.models import Count
+from django.test import override_settings
 from django.urls import reverse
+import netaddr
 from rest_framework import status
 
 from nautobot.core.testing import APITestCase, APIViewTestCases, disable_warnings
@@ -588,6 +590,38 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         response = self.client.get(url, **self.header)
         self.assertEqual(len(response.data), 6)  # 8 - 2 because prefix.type = network
 
+    def test_list_available_ips_limit(self):
+        """
+        Test that the limit of available IP addresses is interpreted the same way as by the REST API pagination.
+        """
+        prefix = Prefix.objects.create(
+            prefix="192.0.2.0/29",
+            type=choices.PrefixTypeChoices.TYPE_POOL,
+            namespace=self.namespace,
+            status=self.status,
+        )
+        url = reverse("ipam-api:prefix-available-ips", kwargs={"pk": prefix.pk})
+        self.add_permissions("ipam.view_prefix", "ipam.view_ipaddress")
+
+        response = self.client.get(f"{url}?limit=3", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+
+        # A negative limit falls back to the default page size
+        response = self.client.get(f"{url}?limit=-1", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 8)
+
+        # A limit of 0 means up to MAX_PAGE_SIZE
+        with override_settings(MAX_PAGE_SIZE=5):
+            response = self.client.get(f"{url}?limit=0", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 5)
+        with override_settings(MAX_PAGE_SIZE=0):
+            response = self.client.get(f"{url}?limit=0", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 8)
+
     def test_create_single_available_ip(self):
         """
         Test retrieval of the first available IP address within a parent prefix.
@@ -729,6 +763,33 @@ class ParallelPrefixTest(APITransactionTestCase):
         prefixes = [str(o) for o in Prefix.objects.filter(prefix_length=30).all()]
         self.assertEqual(len(prefixes), len(set(prefixes)), "Duplicate prefixes should not exist")
 
+    def test_create_overlapping_available_prefixes_parallel(self):
+        prefix = Prefix.objects.create(
+            prefix="192.0.2.0/26",
+            type=choices.PrefixTypeChoices.TYPE_POOL,
+            namespace=self.namespace,
+            status=self.status,
+        )
+
+        # 2 x /28 and 4 x /29 Prefixes, which could overlap if allocated concurrently
+        requests = [
+            {
+                "prefix_length": prefix_length,
+                "description": f"Test Prefix {i}",
+                "namespace": self.namespace.pk,
+                "status": self.status.pk,
+            }
+            for i, prefix_length in enumerate([28, 28, 29, 29, 29, 29], start=1)
+        ]
+        url = reverse("ipam-api:prefix-available-prefixes", kwargs={"pk": prefix.pk})
+        self._do_parallel_requests(url, requests)
+
+        allocated = netaddr.IPSet()
+        for child in Prefix.objects.filter(prefix_length__in=[28, 29]):
+            self.assertFalse(allocated & netaddr.IPSet([child.prefix]), "Overlapping prefixes should not exist")
+            allocated.add(child.prefix)
+        self.assertEqual(allocated.size, 64)
+
     def test_create_multiple_available_ips_parallel(self):
         prefix = Prefix.objects.create(
             prefix="192.0.2.0/29",
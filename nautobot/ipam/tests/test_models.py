@@ -1,10 +1,12 @@
-from unittest import skipIf
+import itertools
+from unittest import mock, skipIf
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import connection, IntegrityError
 from django.db.models import ProtectedError
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 import netaddr
 
 from nautobot.core.testing.models import ModelTestCases
@@ -12,6 +14,7 @@ from nautobot.dcim import choices as dcim_choices
 from nautobot.dcim.models import Device, DeviceType, Interface, Location, LocationType
 from nautobot.extras.models import Role, Status
 from nautobot.ipam.choices import IPAddressTypeChoices, PrefixTypeChoices, ServiceProtocolChoices
+from nautobot.ipam.hierarchy import deferred_reparenting, rebuild_prefix_hierarchy
 from nautobot.ipam.models import (
     get_default_namespace,
     IPAddress,
@@ -528,6 +531,68 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         self.assertEqual(child2.parent, parent)
         self.assertEqual(list(child1.ancestors()), [root, parent])
 
+    def test_deferred_reparenting(self):
+        """Test that deferring reparenting produces the same hierarchy as saving each object individually."""
+        cidrs = [
+            "10.0.0.0/8",
+            "10.0.4.0/22",
+            "10.0.0.0/16",
+            "10.0.5.0/24",
+            "10.1.0.0/16",
+            "10.0.5.7/32",
+            "2001:db8::/32",
+            "2001:db8::/48",
+        ]
+        addresses = ["10.0.5.7/24", "10.0.5.8/24", "10.0.6.1/22", "10.2.0.1/8", "2001:db8:0:1::1/64"]
+
+        namespace = Namespace.objects.create(name="test_deferred_reparenting")
+        for cidr in cidrs:
+            Prefix.objects.create(prefix=cidr, status=self.status, namespace=self.namespace)
+        for address in addresses:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+
+        with deferred_reparenting():
+            for cidr in cidrs:
+                Prefix.objects.create(prefix=cidr, status=self.status, namespace=namespace)
+            for address in addresses:
+                ip = IPAddress.objects.create(address=address, status=self.status, namespace=namespace)
+                self.assertIsNone(ip.parent)
+
+        for cidr in cidrs:
+            expected = Prefix.objects.get(prefix=cidr, namespace=self.namespace).parent
+            actual = Prefix.objects.get(prefix=cidr, namespace=namespace).parent
+            self.assertEqual(getattr(expected, "prefix", None), getattr(actual, "prefix", None), cidr)
+        for address in addresses:
+            expected = IPAddress.objects.get(address=address, parent__namespace=self.namespace).parent
+            actual = IPAddress.objects.get(address=address, parent__namespace=namespace).parent
+            self.assertEqual(expected.prefix, actual.prefix, address)
+
+        # A second rebuild finds nothing to change
+        self.assertEqual(rebuild_prefix_hierarchy(namespace), (0, 0))
+
+    def test_deferred_reparenting_without_parent(self):
+        """Test that an IPAddress with no possible parent Prefix rolls back the deferred transaction."""
+        namespace = Namespace.objects.create(name="test_deferred_reparenting_without_parent")
+        with self.assertRaises(ValidationError):
+            with deferred_reparenting():
+                Prefix.objects.create(prefix="10.0.0.0/24", status=self.status, namespace=namespace)
+                IPAddress.objects.create(address="192.0.2.1/24", status=self.status, namespace=namespace)
+        self.assertFalse(Prefix.objects.filter(namespace=namespace).exists())
+
+    def test_deferred_reparenting_duplicate_ip_address(self):
+        """Test that duplicate IP addresses saved while reparenting is deferred roll back the transaction."""
+        namespace = Namespace.objects.create(name="test_deferred_reparenting_duplicate_ip_address")
+        Prefix.objects.create(prefix="10.0.0.0/24", status=self.status, namespace=namespace)
+        IPAddress.objects.create(address="10.0.0.1/24", status=self.status, namespace=namespace)
+        for existing_address in ("10.0.0.1/24", "10.0.0.2/24"):
+            with self.subTest(existing_address=existing_address):
+                with self.assertRaises(ValidationError) as cm:
+                    with deferred_reparenting():
+                        IPAddress.objects.create(address="10.0.0.2/24", status=self.status, namespace=namespace)
+                        IPAddress.objects.create(address=existing_address, status=self.status, namespace=namespace)
+                self.assertIn(existing_address.split("/")[0], str(cm.exception))
+                self.assertEqual(IPAddress.objects.filter(parent__namespace=namespace).count(), 1)
+
     def test_descendants(self):
         prefixes = (
             Prefix.objects.create(
@@ -620,6 +685,86 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         available_ips = parent_prefix.get_available_ips()
         self.assertEqual(available_ips, missing_ips)
 
+    def test_iter_available_prefixes(self):
+        prefixes = [
+            Prefix(
+                prefix="10.0.0.0/16",
+                status=self.status,
+                namespace=self.namespace,
+                type=PrefixTypeChoices.TYPE_CONTAINER,
+            ),  # Parent prefix
+            Prefix(prefix="10.0.0.0/20", status=self.status, namespace=self.namespace),
+            Prefix(prefix="10.0.4.0/24", status=self.status, namespace=self.namespace),
+            Prefix(prefix="10.0.32.0/20", status=self.status, namespace=self.namespace),
+            Prefix(prefix="10.0.128.0/18", status=self.status, namespace=self.namespace),
+        ]
+        [p.save() for p in prefixes]  # pylint: disable=expression-not-assigned
+
+        self.assertEqual(
+            list(prefixes[0].iter_available_prefixes()), list(prefixes[0].get_available_prefixes().iter_cidrs())
+        )
+        self.assertEqual(
+            list(itertools.islice(prefixes[0].iter_available_prefixes(prefix_length=19), 3)),
+            [netaddr.IPNetwork("10.0.64.0/19"), netaddr.IPNetwork("10.0.96.0/19"), netaddr.IPNetwork("10.0.192.0/19")],
+        )
+        self.assertEqual(
+            next(prefixes[0].iter_available_prefixes(prefix_length=20, exclude=netaddr.IPSet(["10.0.16.0/20"]))),
+            netaddr.IPNetwork("10.0.48.0/20"),
+        )
+        self.assertEqual(
+            list(prefixes[1].iter_available_prefixes()), list(prefixes[1].get_available_prefixes().iter_cidrs())
+        )
+
+    def test_iter_available_ips(self):
+        parent_prefix = Prefix.objects.create(prefix="10.0.0.0/28", status=self.status, namespace=self.namespace)
+        for address in ["10.0.0.1/28", "10.0.0.2/28", "10.0.0.5/28", "10.0.0.14/28"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+        self.assertEqual(list(parent_prefix.iter_available_ips()), list(parent_prefix.get_available_ips()))
+        self.assertEqual(
+            list(itertools.islice(parent_prefix.iter_available_ips(), 2)),
+            [netaddr.IPAddress("10.0.0.3"), netaddr.IPAddress("10.0.0.4")],
+        )
+
+        pool = Prefix.objects.create(
+            prefix="10.0.1.0/30", status=self.status, namespace=self.namespace, type=PrefixTypeChoices.TYPE_POOL
+        )
+        IPAddress.objects.create(address="10.0.1.1/30", status=self.status, namespace=self.namespace)
+        self.assertEqual(list(pool.iter_available_ips()), list(pool.get_available_ips()))
+
+    def test_allocate_ips(self):
+        parent_prefix = Prefix.objects.create(prefix="10.0.0.0/29", status=self.status, namespace=self.namespace)
+        IPAddress.objects.create(address="10.0.0.2/29", status=self.status, namespace=self.namespace)
+        ip_addresses = parent_prefix.allocate_ips(3, status=self.status, description="allocated")
+        self.assertEqual([str(ip.address) for ip in ip_addresses], ["10.0.0.1/29", "10.0.0.3/29", "10.0.0.4/29"])
+        for ip in ip_addresses:
+            self.assertEqual(ip.parent, parent_prefix)
+            self.assertEqual(ip.description, "allocated")
+
+        with self.assertRaises(ValidationError):
+            parent_prefix.allocate_ips(3, status=self.status)
+        self.assertEqual(parent_prefix.ip_addresses.count(), 4)
+
+    def test_allocate_ips_conflict(self):
+        parent_prefix = Prefix.objects.create(prefix="10.0.0.0/29", status=self.status, namespace=self.namespace)
+        IPAddress.objects.create(address="10.0.0.1/29", status=self.status, namespace=self.namespace)
+
+        # Simulate a concurrent creation of 10.0.0.1 between computing the available IPs and inserting them
+        with mock.patch.object(Prefix, "iter_available_ips", return_value=iter([netaddr.IPAddress("10.0.0.1")])):
+            with self.assertRaises(ValidationError) as cm:
+                parent_prefix.allocate_ips(1, status=self.status)
+        self.assertEqual(cm.exception.code, "allocation_conflict")
+        self.assertEqual(parent_prefix.ip_addresses.count(), 1)
+
+    def test_lock_for_allocation(self):
+        prefix = Prefix.objects.create(prefix="10.0.0.0/29", status=self.status, namespace=self.namespace)
+        with CaptureQueriesContext(connection) as queries:
+            prefix.lock_for_allocation()
+        self.assertEqual(len(queries), 1)
+        if connection.vendor == "postgresql":
+            self.assertIn("pg_advisory_xact_lock", queries[0]["sql"])
+        else:
+            self.assertIn("FOR UPDATE", queries[0]["sql"])
+
     def test_get_first_available_prefix(self):
         prefixes = [
             Prefix(
@@ -753,6 +898,30 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         Prefix.objects.create(prefix="ab80::/9", status=self.status, namespace=self.namespace)
         self.assertEqual(large_prefix_v6.get_utilization(), (2**120, 2**120))
 
+    def test_get_bulk_utilization(self):
+        container = Prefix.objects.create(
+            prefix="10.0.0.0/16", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=self.namespace
+        )
+        network = Prefix.objects.create(prefix="10.0.2.0/24", status=self.status, namespace=self.namespace)
+        pool = Prefix.objects.create(
+            prefix="10.0.2.0/28", type=PrefixTypeChoices.TYPE_POOL, status=self.status, namespace=self.namespace
+        )
+        leaf = Prefix.objects.create(prefix="10.0.3.0/24", status=self.status, namespace=self.namespace)
+        for address in ["10.0.2.1/32", "10.0.2.20/32", "10.0.2.21/32", "10.0.3.1/32", "10.0.3.255/32"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+
+        prefixes = [container, network, pool, leaf]
+        with self.assertNumQueries(3):
+            utilization = Prefix.get_bulk_utilization(prefixes)
+        self.assertEqual(utilization[container.pk], (512, 65536))
+        # The pool covers the network address and 10.0.2.1, so only two more IPs are counted
+        self.assertEqual(utilization[network.pk], (18, 256))
+        self.assertEqual(utilization[pool.pk], (1, 16))
+        self.assertEqual(utilization[leaf.pk], (2, 256))
+        for prefix in prefixes:
+            self.assertEqual(prefix.get_utilization(), utilization[prefix.pk])
+        self.assertEqual(Prefix.get_bulk_utilization([]), {})
+
     #
     # Uniqueness enforcement tests
     #
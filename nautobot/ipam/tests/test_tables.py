@@ -3,7 +3,7 @@ from django.test import TestCase
 from nautobot.core.models.querysets import count_related
 from nautobot.dcim.models.locations import Location
 from nautobot.ipam.models import Prefix
-from nautobot.ipam.tables import PrefixTable
+from nautobot.ipam.tables import PrefixDetailTable, PrefixTable
 
 
 class PrefixTableTestCase(TestCase):
@@ -40,3 +40,14 @@ class PrefixTableTestCase(TestCase):
         location_count_queryset = queryset.annotate(location_count=count_related(Location, "prefixes")).all()
         self._validate_sorted_queryset_same_with_table_queryset(location_count_queryset, PrefixTable, "location_count")
         self._validate_sorted_queryset_same_with_table_queryset(location_count_queryset, PrefixTable, "-location_count")
+
+    def test_prefix_detail_table_utilization(self):
+        """Assert that the utilization column is computed for the whole table at once and matches `get_utilization()`."""
+        pk_list = [str(pk) for pk in Prefix.objects.all().values_list("pk", flat=True)[:20]]
+        queryset = Prefix.objects.filter(pk__in=pk_list)
+        table = PrefixDetailTable(queryset)
+        bound_row = table.rows[0]
+        bound_row.get_cell("utilization")
+        self.assertEqual(set(table._prefix_utilization), set(queryset.values_list("pk", flat=True)))
+        for prefix in queryset:
+            self.assertEqual(table._prefix_utilization[prefix.pk], prefix.get_utilization())
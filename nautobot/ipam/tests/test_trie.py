@@ -0,0 +1,132 @@
+from unittest import mock
+
+from django.test import override_settings
+import netaddr
+
+from nautobot.core.testing import TestCase
+from nautobot.extras.models import Status
+from nautobot.ipam.models import Namespace, Prefix
+from nautobot.ipam.querysets import PrefixQuerySet
+from nautobot.ipam.trie import _dirty_namespaces, get_closest_parent, get_prefix_trie, PrefixTrie
+
+
+class PrefixTrieTestCase(TestCase):
+    cidrs = [
+        "0.0.0.0/0",
+        "10.0.0.0/8",
+        "10.0.0.0/16",
+        "10.0.4.0/22",
+        "10.0.5.0/24",
+        "10.0.5.7/32",
+        "10.1.0.0/16",
+        "10.128.0.0/9",
+        "192.0.2.0/24",
+        "2001:db8::/32",
+        "2001:db8::/48",
+        "2001:db8:0:1::/64",
+    ]
+
+    def setUp(self):
+        self.trie = PrefixTrie()
+        for pk, cidr in enumerate(self.cidrs):
+            network = netaddr.IPNetwork(cidr)
+            self.trie.insert(network.version, network.first, network.prefixlen, pk)
+
+    def brute_force(self, cidr, cidrs):
+        """Return the index in `cidrs` of the longest CIDR containing `cidr`, or None."""
+        cidr = netaddr.IPNetwork(cidr)
+        closest = None
+        for pk, other in enumerate(cidrs):
+            if other is None:
+                continue
+            other = netaddr.IPNetwork(other)
+            if other.version == cidr.version and cidr in other and other.prefixlen < cidr.prefixlen:
+                if closest is None or other.prefixlen > netaddr.IPNetwork(cidrs[closest]).prefixlen:
+                    closest = pk
+        return closest
+
+    def test_insert_and_remove(self):
+        lookups = ["10.0.5.7/32", "10.0.5.8/32", "10.0.6.1/32", "10.200.0.1/32", "11.0.0.1/32", "2001:db8:0:1::1/128"]
+        cidrs = list(self.cidrs)
+        # Remove leaves, intermediate prefixes, and the root, checking all lookups after each removal
+        for pk in [5, 2, 0, 9, 3, 11, 1]:
+            self.trie.remove(pk)
+            cidrs[pk] = None
+            for cidr in lookups:
+                with self.subTest(removed=pk, cidr=cidr):
+                    self.assertEqual(
+                        self.trie.get_closest_parent(netaddr.IPNetwork(cidr)), self.brute_force(cidr, cidrs)
+                    )
+        # Move a prefix by inserting it again
+        self.trie.insert(4, int(netaddr.IPAddress("10.0.6.0")), 24, 4)
+        cidrs[4] = "10.0.6.0/24"
+        for cidr in lookups:
+            with self.subTest(moved=4, cidr=cidr):
+                self.assertEqual(self.trie.get_closest_parent(netaddr.IPNetwork(cidr)), self.brute_force(cidr, cidrs))
+
+    def test_get_closest_parent(self):
+        self.assertEqual(self.trie.get_closest_parent(netaddr.IPNetwork("10.0.5.7/32")), 4)
+        self.assertEqual(self.trie.get_closest_parent(netaddr.IPNetwork("10.0.5.7/32"), include_self=True), 5)
+        self.assertEqual(self.trie.get_closest_parent(netaddr.IPNetwork("10.0.6.1/32")), 3)
+        self.assertEqual(
+            self.trie.get_closest_parent(netaddr.IPNetwork("10.0.6.1/32"), shortest_prefix_length=23), None
+        )
+        self.assertEqual(self.trie.get_closest_parent(netaddr.IPNetwork("11.0.0.1/32")), 0)
+        self.assertEqual(self.trie.get_closest_parent(netaddr.IPNetwork("2001:db8:1::1/128")), 9)
+        self.assertIsNone(self.trie.get_closest_parent(netaddr.IPNetwork("2001:db9::1/128")))
+
+    @override_settings(IPAM_PREFIX_TRIE_ENABLED=True)
+    def test_get_closest_parent_matches_queryset(self):
+        status = Status.objects.get_for_model(Prefix).first()
+        namespace = Namespace.objects.create(name="Prefix Trie Test")
+        for cidr in self.cidrs[1:]:
+            Prefix.objects.create(prefix=cidr, namespace=namespace, status=status)
+        # The Prefixes were created within the test case's transaction, which would otherwise disable the trie
+        _dirty_namespaces().clear()
+        self.assertIsNotNone(get_prefix_trie(namespace))
+        for cidr in ["10.0.5.7/32", "10.0.5.8/32", "10.200.0.1/32", "2001:db8:0:1::1/128", "10.0.4.0/22"]:
+            with self.subTest(cidr=cidr):
+                expected = Prefix.objects.filter(namespace=namespace).get_closest_parent(cidr, include_self=True)
+                with mock.patch.object(PrefixQuerySet, "get_closest_parent") as queryset_get_closest_parent:
+                    self.assertEqual(get_closest_parent(namespace, cidr, include_self=True), expected)
+                queryset_get_closest_parent.assert_not_called()
+        with self.assertRaises(Prefix.DoesNotExist):
+            get_closest_parent(namespace, "203.0.113.1/32")
+
+    @override_settings(IPAM_PREFIX_TRIE_ENABLED=True)
+    def test_prefix_changes_update_trie_in_place(self):
+        status = Status.objects.get_for_model(Prefix).first()
+        namespace = Namespace.objects.create(name="Prefix Trie Test")
+        other_namespace = Namespace.objects.create(name="Other Prefix Trie Test")
+        with self.captureOnCommitCallbacks(execute=True):
+            parent = Prefix.objects.create(prefix="10.0.0.0/8", namespace=namespace, status=status)
+        # The Prefixes were created within the test case's transaction, which would otherwise disable the trie
+        _dirty_namespaces().clear()
+        trie = get_prefix_trie(namespace)
+        self.assertEqual(trie.get_closest_parent(netaddr.IPNetwork("10.0.0.1/32")), parent.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            child = Prefix.objects.create(prefix="10.0.0.0/24", namespace=namespace, status=status)
+        _dirty_namespaces().clear()
+        with mock.patch.object(PrefixTrie, "from_queryset") as from_queryset:
+            self.assertIs(get_prefix_trie(namespace), trie)
+        from_queryset.assert_not_called()
+        self.assertEqual(trie.get_closest_parent(netaddr.IPNetwork("10.0.0.1/32")), child.pk)
+
+        # Moving a Prefix to another Namespace removes it from the trie of its original Namespace
+        with self.captureOnCommitCallbacks(execute=True):
+            child.namespace = other_namespace
+            child.save()
+        _dirty_namespaces().clear()
+        with mock.patch.object(PrefixTrie, "from_queryset") as from_queryset:
+            self.assertIs(get_prefix_trie(namespace), trie)
+        from_queryset.assert_not_called()
+        self.assertEqual(trie.get_closest_parent(netaddr.IPNetwork("10.0.0.1/32")), parent.pk)
+        self.assertEqual(
+            get_prefix_trie(other_namespace).get_closest_parent(netaddr.IPNetwork("10.0.0.1/32")), child.pk
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            parent.delete()
+        _dirty_namespaces().clear()
+        self.assertIsNone(get_prefix_trie(namespace).get_closest_parent(netaddr.IPNetwork("10.0.0.1/32")))
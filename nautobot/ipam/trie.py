@@ -0,0 +1,271 @@
+"""
+Optional in-process radix trie index of Prefixes, used to find the closest parent Prefix of new IP addresses.
+
+When `settings.IPAM_PREFIX_TRIE_ENABLED` is set, each process lazily builds one `PrefixTrie` per Namespace and uses it
+to answer closest-parent lookups for new IP addresses without range queries. The Prefix `post_save`/`post_delete`
+signals publish each change through the Django cache as a numbered entry in a per-Namespace change log, once the change
+is committed, and each process applies the changes it hasn't seen yet to its trie in place on its next lookup. A trie is
+only rebuilt from the database if it falls too far behind, or if any of the changes it needs is missing from the cache.
+
+While a transaction has modified the Prefixes of a Namespace, lookups in that Namespace (from the same thread) fall back
+to the database, since the trie only reflects committed data.
+"""
+
+import secrets
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+import netaddr
+
+_BITS = {4: 32, 6: 128}
+
+# A trie that is more changes than this behind its Namespace is rebuilt rather than updated in place.
+_MAX_PENDING_CHANGES = 1000
+# Published changes only need to be kept until every process has had a chance to apply them.
+_CHANGE_TIMEOUT = 60 * 60
+
+_CACHE_KEY_PREFIX = "nautobot.ipam.trie"
+_tries = {}  # {namespace_pk: (sequence, PrefixTrie)}
+_tries_lock = threading.Lock()
+_local = threading.local()
+
+
+class _Node:
+    __slots__ = ("children", "length", "network", "pk")
+
+    def __init__(self, network, length, pk=None):
+        self.network = network
+        self.length = length
+        self.pk = pk
+        self.children = [None, None]
+
+
+def _bit(value, position, bits):
+    """Return the bit of `value` at `position`, counting from the most significant bit."""
+    return (value >> (bits - position - 1)) & 1
+
+
+def _covers(node, network, bits):
+    """Return whether `node` contains the address `network`."""
+    return not (node.network ^ network) >> (bits - node.length)
+
+
+class PrefixTrie:
+    """
+    Path-compressed binary (Patricia) trie of the Prefixes in a single Namespace.
+
+    Nodes are keyed by (network, prefix_length) as integers; nodes created only to join two branches carry no `pk`.
+    """
+
+    def __init__(self):
+        self._roots = {version: _Node(0, 0) for version in _BITS}
+        self._prefixes = {}  # {pk: (ip_version, network, length)}
+
+    @classmethod
+    def from_queryset(cls, queryset):
+        trie = cls()
+        for pk, ip_version, network, prefix_length in queryset.values_list(
+            "pk", "ip_version", "network", "prefix_length"
+        ).iterator():
+            trie.insert(ip_version, int(netaddr.IPAddress(network, version=ip_version)), prefix_length, pk)
+        return trie
+
+    def insert(self, ip_version, network, length, pk):
+        """Add the Prefix with the given pk, or move it if it is already present."""
+        if pk in self._prefixes:
+            self.remove(pk)
+        self._prefixes[pk] = (ip_version, network, length)
+        bits = _BITS[ip_version]
+        node = self._roots[ip_version]
+        if length == 0:
+            node.pk = pk
+            return
+        while True:
+            bit = _bit(network, node.length, bits)
+            child = node.children[bit]
+            if child is None:
+                node.children[bit] = _Node(network, length, pk)
+                return
+            common = min(length, child.length, bits - (network ^ child.network).bit_length())
+            if common == child.length:
+                if common == length:
+                    child.pk = pk
+                    return
+                node = child
+                continue
+            # Split the edge to `child` at the common prefix
+            if common == length:
+                branch = _Node(network, length, pk)
+            else:
+                branch = _Node(network & ~((1 << (bits - common)) - 1), common)
+                branch.children[_bit(network, common, bits)] = _Node(network, length, pk)
+            branch.children[_bit(child.network, common, bits)] = child
+            node.children[bit] = branch
+            return
+
+    def remove(self, pk):
+        """Remove the Prefix with the given pk, if present."""
+        if pk not in self._prefixes:
+            return
+        ip_version, network, length = self._prefixes.pop(pk)
+        path = list(self._path(ip_version, network, length))
+        node = path[-1]
+        if node.length != length or node.pk != pk:
+            return
+        node.pk = None
+        # Remove the node if it no longer joins two branches, and likewise its parent if that was only a branch node
+        for node, parent in zip(reversed(path[1:]), reversed(path[:-1])):
+            children = [child for child in node.children if child is not None]
+            if node.pk is not None or len(children) > 1:
+                break
+            parent.children[parent.children.index(node)] = children[0] if children else None
+
+    def _path(self, ip_version, network, length):
+        """Yield each node, from the root downwards, whose prefix contains (network, length)."""
+        bits = _BITS[ip_version]
+        node = self._roots[ip_version]
+        while node is not None and node.length <= length and _covers(node, network, bits):
+            yield node
+            if node.length == length:
+                return
+            node = node.children[_bit(network, node.length, bits)]
+
+    def get_closest_parent(self, cidr, shortest_prefix_length=0, include_self=False):
+        """Return the pk of the longest Prefix containing the given `netaddr.IPNetwork`, or None if there is none."""
+        # As with `PrefixQuerySet.get_closest_parent()`, only an exact match of `cidr` (host bits and all) is "self"
+        include_self = include_self or cidr.value != cidr.first
+        closest = None
+        for node in self._path(cidr.version, cidr.first, cidr.prefixlen):
+            if node.pk is None or node.length < shortest_prefix_length:
+                continue
+            if include_self or node.length < cidr.prefixlen:
+                closest = node.pk
+        return closest
+
+
+def _sequence_cache_key(namespace_pk):
+    return f"{_CACHE_KEY_PREFIX}.{namespace_pk}.sequence"
+
+
+def _change_cache_key(namespace_pk, sequence):
+    return f"{_CACHE_KEY_PREFIX}.{namespace_pk}.change.{sequence}"
+
+
+def _dirty_namespaces():
+    if not hasattr(_local, "dirty_namespaces"):
+        _local.dirty_namespaces = set()
+    # Outside of a transaction, any changes have been either committed or rolled back by now
+    if not connection.in_atomic_block:
+        _local.dirty_namespaces.clear()
+    return _local.dirty_namespaces
+
+
+def _get_sequence(namespace_pk):
+    """Return the number of the latest change published for the given Namespace."""
+    cache_key = _sequence_cache_key(namespace_pk)
+    sequence = cache.get(cache_key)
+    if sequence is None:
+        # Start from a random number, so that a missing (e.g. evicted) sequence never matches a previously seen one
+        cache.add(cache_key, secrets.randbits(48), timeout=None)
+        sequence = cache.get(cache_key)
+    return sequence
+
+
+def _publish_change(namespace_pk, change):
+    """Publish the given change to the given Namespace's change log."""
+    try:
+        sequence = cache.incr(_sequence_cache_key(namespace_pk))
+    except ValueError:
+        _get_sequence(namespace_pk)
+        sequence = cache.incr(_sequence_cache_key(namespace_pk))
+    cache.set(_change_cache_key(namespace_pk, sequence), change, timeout=_CHANGE_TIMEOUT)
+
+
+def _apply_changes(namespace_pk, trie, trie_sequence, sequence):
+    """
+    Apply the changes published after `trie_sequence`, up to `sequence`, to `trie`, returning whether it succeeded.
+    """
+    if not trie_sequence < sequence <= trie_sequence + _MAX_PENDING_CHANGES:
+        return False
+    cache_keys = [_change_cache_key(namespace_pk, number) for number in range(trie_sequence + 1, sequence + 1)]
+    changes = cache.get_many(cache_keys)
+    if len(changes) < len(cache_keys):
+        return False
+    for cache_key in cache_keys:
+        pk, ip_version, network, length = changes[cache_key]
+        if ip_version is None:
+            trie.remove(pk)
+        else:
+            trie.insert(ip_version, network, length, pk)
+    return True
+
+
+def get_prefix_trie(namespace):
+    """
+    Return an up-to-date `PrefixTrie` for the given Namespace (or its pk), or None if it can't be used.
+
+    Returns None if `settings.IPAM_PREFIX_TRIE_ENABLED` is not set, or if the Namespace's Prefixes have been modified
+    within the current transaction.
+    """
+    if not settings.IPAM_PREFIX_TRIE_ENABLED:
+        return None
+    from nautobot.ipam.models import Prefix  # avoid circular import
+
+    namespace_pk = getattr(namespace, "pk", namespace)
+    if namespace_pk in _dirty_namespaces():
+        return None
+
+    # Read the sequence before building the trie, so that changes committed concurrently are applied to it afterwards
+    sequence = _get_sequence(namespace_pk)
+    with _tries_lock:
+        cached = _tries.get(namespace_pk)
+        if cached is not None:
+            trie_sequence, trie = cached
+            if trie_sequence == sequence:
+                return trie
+            if _apply_changes(namespace_pk, trie, trie_sequence, sequence):
+                _tries[namespace_pk] = (sequence, trie)
+                return trie
+
+    trie = PrefixTrie.from_queryset(Prefix.objects.filter(namespace_id=namespace_pk))
+    with _tries_lock:
+        _tries[namespace_pk] = (sequence, trie)
+    return trie
+
+
+def update_prefix_trie(namespace, pk, prefix=None):
+    """
+    Add the Prefix with the given pk to the `PrefixTrie` of the given Namespace (or its pk) at the given
+    `netaddr.IPNetwork`, or remove it from the trie if `prefix` is None.
+
+    The trie is updated in place in all processes once the current transaction (if any) is committed.
+    """
+    namespace_pk = getattr(namespace, "pk", namespace)
+    if prefix is None:
+        change = (pk, None, None, None)
+    else:
+        change = (pk, prefix.version, prefix.first, prefix.prefixlen)
+    if connection.in_atomic_block:
+        _dirty_namespaces().add(namespace_pk)
+    transaction.on_commit(lambda: _publish_change(namespace_pk, change))
+
+
+def get_closest_parent(namespace, cidr, include_self=False):
+    """
+    Equivalent to `Prefix.objects.filter(namespace=namespace).get_closest_parent(cidr, include_self=include_self)`,
+    but answered from the Namespace's `PrefixTrie` where possible.
+    """
+    from nautobot.ipam.models import Prefix  # avoid circular import
+
+    queryset = Prefix.objects.filter(namespace=namespace)
+    trie = get_prefix_trie(namespace)
+    if trie is None:
+        return queryset.get_closest_parent(cidr, include_self=include_self)
+
+    cidr = queryset._validate_cidr(cidr)
+    pk = trie.get_closest_parent(cidr, include_self=include_self)
+    if pk is None:
+        raise Prefix.DoesNotExist(f"Could not determine parent Prefix for {cidr}")
+    return queryset.get(pk=pk)
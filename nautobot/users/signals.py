@@ -0,0 +1,37 @@
+"""Signal handlers for the users app."""
+
+import contextlib
+
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+import redis.exceptions
+
+from nautobot.core.authentication import ObjectPermissionBackend
+from nautobot.core.utils.cache import invalidate_cached_values
+from nautobot.users.models import ObjectPermission, User
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=User)
+def invalidate_object_permissions_cache(sender, **kwargs):
+    """
+    Invalidate the cached ObjectPermissions of all users.
+
+    The cache is invalidated again once the current transaction (if any) is committed, as it may have been refilled in
+    the meantime from the permissions as they were before the change.
+    """
+
+    def invalidate():
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            invalidate_cached_values(ObjectPermissionBackend.get_object_permissions.cache_key_prefix)
+
+    invalidate()
+    transaction.on_commit(invalidate)